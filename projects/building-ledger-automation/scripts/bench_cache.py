@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from building_ledger_api.cache import LedgerCache, SqliteLedgerCache
+from building_ledger_api.redis_cache import RedisLedgerCache
+from fake_redis import FakeRedisServer
+
+
+def sample_payload(pnu: str) -> dict:
+    return {
+        "success": True,
+        "input_address": "충청남도 천안시 서북구 불당동 1329",
+        "road_address": "충청남도 천안시 서북구 불당21로 67",
+        "pnu": pnu,
+        "codes": {"sigungu_code": pnu[0:5], "bdong_code": pnu[5:10], "plat_code": "0", "bun": pnu[11:15], "ji": pnu[15:19]},
+        "from_cache": False,
+        "data": {"regstr_kind_name": "일반", "plat_area": 1234.5, "tot_area": 9876.5, "use_approval_day": "20150101"},
+        "raw_item": {f"field{i}": f"value{i}" for i in range(60)},
+    }
+
+
+def run(cache: LedgerCache, threads: int, ops: int, keys: list[str], op: str) -> float:
+    def work(n: int) -> None:
+        rng = random.Random(n)
+        for _ in range(ops // threads):
+            pnu = rng.choice(keys)
+            if op == "get":
+                cache.get(pnu, ttl_days=30)
+            else:
+                cache.set(pnu, sample_payload(pnu))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(work, range(threads)))
+    elapsed = time.perf_counter() - started
+    return (ops // threads) * threads / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="LedgerCache get/set throughput benchmark")
+    parser.add_argument("--db", type=Path, help="SQLite 파일 (기본: 임시 파일)")
+    parser.add_argument("--ops", type=int, default=20000, help="스레드 수와 무관한 총 연산 수")
+    parser.add_argument("--keys", type=int, default=5000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--backend", choices=("sqlite", "redis"), default="sqlite")
+    parser.add_argument("--redis-url", help="Redis 주소 (기본: 프로세스 내 fake_redis 서버)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, ExitStack() as stack:
+        cache: LedgerCache
+        if args.backend == "redis":
+            url = args.redis_url or stack.enter_context(FakeRedisServer()).url
+            cache = RedisLedgerCache(url, key_prefix="bench:", expire_seconds=3600, timeout=2.0)
+        else:
+            cache = SqliteLedgerCache(args.db or Path(tmp) / "bench_cache.sqlite3")
+        keys = [f"44133{10100 + i % 50:05d}1{i:04d}0000" for i in range(args.keys)]
+        cache.set_many([(pnu, sample_payload(pnu)) for pnu in keys])
+
+        print(f"{'threads':>8} {'get ops/s':>12} {'set ops/s':>12}")
+        for threads in args.threads:
+            get_rate = run(cache, threads, args.ops, keys, "get")
+            set_rate = run(cache, threads, args.ops, keys, "set")
+            print(f"{threads:>8} {get_rate:>12,.0f} {set_rate:>12,.0f}")
+
+        started = time.perf_counter()
+        for start in range(0, len(keys), 100):
+            cache.get_entries(keys[start : start + 100], ttl_days=30)
+        per_key = (time.perf_counter() - started) / len(keys) * 1e6
+        print(f"get_entries (100 keys per call): {per_key:,.1f} us/key")
+        cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from bench_cache import sample_payload
+from building_ledger_api.cache import SqliteLedgerCache
+
+
+def load_payloads(source: Path | None, count: int) -> list[tuple[str, dict]]:
+    """Payloads from an existing cache file, or synthetic ones when none is given."""
+    if source is None:
+        pnus = [f"44133{10100 + i % 50:05d}1{i:04d}0000" for i in range(count)]
+        return [(pnu, sample_payload(pnu)) for pnu in pnus]
+
+    cache = SqliteLedgerCache(source)
+    rows = sqlite3.connect(source).execute(
+        "SELECT pnu FROM ledger_cache WHERE instr(pnu, ':') = 0 LIMIT ?", (count,)
+    ).fetchall()
+    payloads = [(pnu, cache.get(pnu, ttl_days=36500, include_raw=True)) for (pnu,) in rows]
+    cache.close()
+    return [(pnu, payload) for pnu, payload in payloads if payload]
+
+
+def file_size(cache: SqliteLedgerCache) -> int:
+    cache.vacuum()
+    return cache.db_path.stat().st_size
+
+
+def time_gets(cache: SqliteLedgerCache, pnus: list[str], include_raw: bool) -> float:
+    started = time.perf_counter()
+    for pnu in pnus:
+        cache.get(pnu, ttl_days=30, include_raw=include_raw)
+    return (time.perf_counter() - started) / len(pnus) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="ledger_cache 저장 포맷(v1 JSON vs v2 압축) 크기/지연 비교")
+    parser.add_argument("--source", type=Path, help="비교에 사용할 기존 캐시 파일 (기본: 합성 데이터)")
+    parser.add_argument("--count", type=int, default=5000)
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.source, args.count)
+    if not payloads:
+        print("no payloads to compare", file=sys.stderr)
+        return 1
+    pnus = [pnu for pnu, _ in payloads]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = SqliteLedgerCache(Path(tmp) / "v1.sqlite3")
+        with sqlite3.connect(legacy.db_path) as conn:
+            conn.executemany(
+                "INSERT INTO ledger_cache (pnu, payload_json, fetched_at) VALUES (?, ?, datetime('now'))",
+                [(pnu, json.dumps(payload, ensure_ascii=False)) for pnu, payload in payloads],
+            )
+        compact = SqliteLedgerCache(Path(tmp) / "v2.sqlite3")
+        compact.set_many(payloads)
+
+        results = {
+            "rows": len(payloads),
+            "v1_bytes": file_size(legacy),
+            "v2_bytes": file_size(compact),
+            "v1_get_us": round(time_gets(legacy, pnus, include_raw=True), 1),
+            "v2_get_us": round(time_gets(compact, pnus, include_raw=True), 1),
+            "v2_get_without_raw_us": round(time_gets(compact, pnus, include_raw=False), 1),
+        }
+        legacy.close()
+        compact.close()
+
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
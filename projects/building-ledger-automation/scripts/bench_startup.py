@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = Path(__file__).resolve().parent
+STARTUP_LINE = re.compile(r'^ledger_startup_seconds\{phase="([^"]+)"\} (\S+)$', re.MULTILINE)
+
+
+def wait_until(url: str, deadline: float, poll_seconds: float) -> float:
+    """Poll ``url`` until it answers 200; returns the time it first did."""
+    with httpx.Client(timeout=1.0) as client:
+        while time.perf_counter() < deadline:
+            try:
+                if client.get(url).status_code == 200:
+                    return time.perf_counter()
+            except httpx.TransportError:
+                pass
+            time.sleep(poll_seconds)
+    raise TimeoutError(f"{url} did not come up in time")
+
+
+def start_fake_upstream(port: int, latency_ms: float) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            str(SCRIPTS_DIR / "fake_upstream.py"),
+            "--port", str(port),
+            "--latency-ms", str(latency_ms),
+            "--jitter-ms", "0",
+        ]
+    )
+    wait_until(f"http://127.0.0.1:{port}/_stats", time.perf_counter() + 30, 0.05)
+    return process
+
+
+def measure_once(args: argparse.Namespace, upstream: str, cache_dir: Path) -> dict:
+    env = {
+        **os.environ,
+        "VWORLD_API_KEY": "bench",
+        "DATA_GO_KR_SERVICE_KEY": "bench",
+        "VWORLD_BASE_URL": f"{upstream}/req/address",
+        "BUILDING_HUB_BASE_URL": f"{upstream}/1613000/BldRgstHubService",
+        "CACHE_DB_PATH": str(cache_dir / "ledger_cache.sqlite3"),
+        "CACHE_BACKEND": "sqlite",
+        "LEDGER_API_TOKEN": "",
+        "REFRESH_OFFPEAK_HOURS": "",
+    }
+    base_url = f"http://127.0.0.1:{args.port}"
+    command = [
+        sys.executable, "-m", "uvicorn", "building_ledger_api.main:app",
+        "--app-dir", str(PROJECT_ROOT / "src"),
+        "--port", str(args.port),
+        "--log-level", "warning",
+    ]
+
+    started = time.perf_counter()
+    process = subprocess.Popen(command, env=env)
+    try:
+        healthy = wait_until(f"{base_url}/health", started + args.timeout, args.poll_ms / 1000)
+        with httpx.Client(base_url=base_url, timeout=args.timeout) as client:
+            response = client.post("/lookup", json={"address": args.address})
+            first_lookup = time.perf_counter()
+            response.raise_for_status()
+            cached_started = time.perf_counter()
+            client.post("/lookup", json={"address": args.address}).raise_for_status()
+            cached = time.perf_counter() - cached_started
+            phases = {
+                phase: round(float(value) * 1000, 1)
+                for phase, value in STARTUP_LINE.findall(client.get("/metrics").text)
+            }
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+    return {
+        "health_ms": round((healthy - started) * 1000, 1),
+        "first_lookup_ms": round((first_lookup - started) * 1000, 1),
+        "first_lookup_request_ms": round((first_lookup - healthy) * 1000, 1),
+        "cached_lookup_ms": round(cached * 1000, 1),
+        "phases_ms": phases,
+    }
+
+
+def import_profile(top: int) -> list[dict]:
+    """Slowest imports of the app module by cumulative time (``python -X importtime``)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import building_ledger_api.main"],
+        cwd=PROJECT_ROOT / "src",
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        head, cumulative_us, module = line.split("|", 2)
+        self_us = head.removeprefix("import time:")
+        rows.append(
+            {
+                "module": module.strip(),
+                "depth": (len(module) - len(module.lstrip()) - 1) // 2,
+                "cumulative_ms": round(int(cumulative_us) / 1000, 1),
+                "self_ms": round(int(self_us) / 1000, 1),
+            }
+        )
+    top_level = [row for row in rows if row["depth"] <= 1]
+    return sorted(top_level, key=lambda row: row["cumulative_ms"], reverse=True)[:top]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="API 기동 시간 측정: 첫 /health 200, 첫 /lookup 200까지")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8099, help="측정용 API 포트")
+    parser.add_argument("--upstream-port", type=int, default=9099, help="가짜 upstream 포트")
+    parser.add_argument("--upstream-latency-ms", type=float, default=0.0)
+    parser.add_argument("--address", default="충청남도 천안시 서북구 불당동 1329")
+    parser.add_argument("--poll-ms", type=float, default=5.0, help="/health 폴링 간격")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--imports", type=int, default=10, help="느린 import 상위 N개 출력 (0이면 생략)")
+    args = parser.parse_args()
+
+    upstream = start_fake_upstream(args.upstream_port, args.upstream_latency_ms)
+    try:
+        runs = []
+        for _ in range(args.runs):
+            # Fresh cache file every run: the first /lookup is a cold miss.
+            with tempfile.TemporaryDirectory() as cache_dir:
+                runs.append(measure_once(args, f"http://127.0.0.1:{args.upstream_port}", Path(cache_dir)))
+    finally:
+        upstream.terminate()
+        upstream.wait(timeout=10)
+
+    report: dict = {
+        "runs": len(runs),
+        "median": {
+            key: statistics.median(run[key] for run in runs)
+            for key in ("health_ms", "first_lookup_ms", "first_lookup_request_ms", "cached_lookup_ms")
+        },
+        "phases_ms": {
+            phase: statistics.median(run["phases_ms"].get(phase, 0.0) for run in runs)
+            for phase in runs[0]["phases_ms"]
+        },
+    }
+    if args.imports:
+        report["slowest_imports"] = import_profile(args.imports)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from building_ledger_api.cache import SqliteLedgerCache
+from building_ledger_api.clients import pnu_from_title_item
+from building_ledger_api.config import Settings
+from building_ledger_api.parcels import ParcelIndex
+from building_ledger_api.service import build_ledger_result
+
+
+def iter_items(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield title items from a JSON, NDJSON/JSONL or CSV dump (API field names)."""
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with path.open(encoding="utf-8-sig", newline="") as handle:
+            yield from csv.DictReader(handle)
+    elif suffix in {".ndjson", ".jsonl"}:
+        with path.open(encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+    elif suffix == ".json":
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(payload, dict):
+            # Saved getBrTitleInfo responses: response.body.items.item
+            payload = payload.get("response", {}).get("body", {}).get("items", {}).get("item", [])
+        yield from payload if isinstance(payload, list) else [payload]
+    else:
+        raise ValueError(f"Unsupported dump format: {path}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="건축HUB 표제부 덤프를 ledger_cache에 일괄 적재")
+    parser.add_argument("paths", nargs="+", type=Path, help="JSON / NDJSON / CSV 덤프 파일")
+    parser.add_argument("--db", type=Path, help="캐시 SQLite 경로 (기본: CACHE_DB_PATH)")
+    parser.add_argument("--sigungu", help="이 시군구코드(5자리)로 시작하는 PNU만 적재")
+    parser.add_argument("--batch-size", type=int, default=5000, help="트랜잭션당 upsert 건수")
+    args = parser.parse_args()
+
+    db_path = args.db or Settings.load(require_keys=False).cache_db_path
+    cache = SqliteLedgerCache(db_path)
+    parcels = ParcelIndex(db_path)
+
+    started = time.perf_counter()
+    skipped = 0
+    # All buildings of a parcel become one cached record, as with FETCH_ALL_BUILDINGS.
+    grouped: dict[str, list[dict[str, Any]]] = {}
+
+    for path in args.paths:
+        for item in iter_items(path):
+            try:
+                pnu = pnu_from_title_item(item)
+            except ValueError:
+                skipped += 1
+                continue
+            if args.sigungu and not pnu.startswith(args.sigungu):
+                skipped += 1
+                continue
+            grouped.setdefault(pnu, []).append(item)
+
+    imported = 0
+    batch: list[tuple[str, dict]] = []
+    for pnu, items in grouped.items():
+        address = items[0].get("platPlc") or items[0].get("newPlatPlc") or pnu
+        road_address = items[0].get("newPlatPlc") or address
+        batch.append((pnu, build_ledger_result(address, road_address, pnu, items)))
+        if len(batch) >= args.batch_size:
+            cache.set_many(batch)
+            parcels.add_many((key, payload["road_address"], None, None) for key, payload in batch)
+            imported += len(batch)
+            batch.clear()
+            print(f"imported {imported:,} parcels", file=sys.stderr)
+
+    if batch:
+        cache.set_many(batch)
+        parcels.add_many((key, payload["road_address"], None, None) for key, payload in batch)
+        imported += len(batch)
+    cache.close()
+    parcels.close()
+
+    elapsed = time.perf_counter() - started
+    print(json.dumps({"imported": imported, "skipped": skipped, "seconds": round(elapsed, 2)}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
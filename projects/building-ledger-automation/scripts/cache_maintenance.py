@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, TextIO
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from building_ledger_api.cache import GeocodeCache, SqliteLedgerCache
+from building_ledger_api.clients import BuildingHubClient
+from building_ledger_api.config import Settings
+from building_ledger_api.parcels import ParcelIndex
+
+LEDGER_TABLE = "ledger_cache"
+GEOCODE_TABLE = "geocode_cache"
+
+
+def stats(ledger: SqliteLedgerCache, geocode: GeocodeCache, args: argparse.Namespace) -> dict[str, Any]:
+    return {"ledger": ledger.storage_stats(), "geocode": {"rows": geocode.count()}}
+
+
+def purge(ledger: SqliteLedgerCache, geocode: GeocodeCache, args: argparse.Namespace) -> dict[str, Any]:
+    """Delete entries nothing will serve any more, then release the freed pages."""
+    settings: Settings = args.settings
+    now = datetime.now(timezone.utc)
+    # Title entries stay usable as stale fallbacks for STALE_MAX_DAYS past their TTL.
+    cutoffs = {"title": settings.cache_ttl_days + settings.stale_max_days}
+    for section in BuildingHubClient.SECTION_OPERATIONS:
+        cutoffs[section] = getattr(settings, f"{section}_ttl_days")
+
+    deleted = {}
+    for kind, max_age_days in cutoffs.items():
+        section = None if kind == "title" else kind
+        fetched_before = now - timedelta(days=max_age_days)
+        deleted[kind] = ledger.purge(fetched_before, section=section, batch_size=args.batch_size)
+    deleted["geocode"] = geocode.purge(
+        now - timedelta(days=settings.geocode_cache_ttl_days),
+        batch_size=args.batch_size,
+    )
+
+    freed_pages = 0 if args.no_vacuum else ledger.incremental_vacuum()
+    return {"deleted": deleted, "freed_pages": freed_pages, **ledger.file_stats()}
+
+
+def vacuum(ledger: SqliteLedgerCache, geocode: GeocodeCache, args: argparse.Namespace) -> dict[str, Any]:
+    if args.full:
+        ledger.vacuum()
+        return ledger.file_stats()
+    return {"freed_pages": ledger.incremental_vacuum(), **ledger.file_stats()}
+
+
+def export(ledger: SqliteLedgerCache, geocode: GeocodeCache, args: argparse.Namespace) -> dict[str, Any]:
+    handle: TextIO = sys.stdout if args.file == "-" else open(args.file, "w", encoding="utf-8")
+    counts = {LEDGER_TABLE: 0, GEOCODE_TABLE: 0}
+    try:
+        for table, store in ((LEDGER_TABLE, ledger), (GEOCODE_TABLE, geocode)):
+            for key, payload, fetched_at in store.iter_entries(batch_size=args.batch_size):
+                record = {"table": table, "key": key, "fetched_at": fetched_at, "payload": payload}
+                handle.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+                counts[table] += 1
+    finally:
+        if handle is not sys.stdout:
+            handle.close()
+    return {"exported": counts}
+
+
+def import_(ledger: SqliteLedgerCache, geocode: GeocodeCache, args: argparse.Namespace) -> dict[str, Any]:
+    handle: TextIO = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8")
+    stores = {LEDGER_TABLE: ledger, GEOCODE_TABLE: geocode}
+    batches: dict[str, list[tuple[str, dict, str]]] = {LEDGER_TABLE: [], GEOCODE_TABLE: []}
+    written = {LEDGER_TABLE: 0, GEOCODE_TABLE: 0}
+    read = 0
+    try:
+        for line in handle:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            table = record["table"]
+            batches[table].append((record["key"], record["payload"], record["fetched_at"]))
+            read += 1
+            if len(batches[table]) >= args.batch_size:
+                written[table] += stores[table].restore_many(batches[table])
+                batches[table].clear()
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+    for table, batch in batches.items():
+        if batch:
+            written[table] += stores[table].restore_many(batch)
+    # Rows not written already existed locally with a newer fetched_at.
+    return {"read": read, "written": written}
+
+
+def reindex(ledger: SqliteLedgerCache, geocode: GeocodeCache, args: argparse.Namespace) -> dict[str, Any]:
+    """Put every cached PNU into parcel_index (e.g. caches filled before it existed).
+
+    Points come from geocode_cache; rows geocoded before it stored them get
+    theirs when the address is geocoded again.
+    """
+    parcels = ParcelIndex(ledger.db_path)
+    upserted = 0
+    batch: list[tuple[str, str, float | None, float | None]] = []
+    try:
+        cached = ((key, payload) for key, payload, _ in ledger.iter_entries(args.batch_size))
+        geocoded = ((payload["pnu"], payload) for _, payload, _ in geocode.iter_entries(args.batch_size))
+        for pnu, payload in itertools.chain(cached, geocoded):
+            if ":" in pnu:  # section entry; its title key covers the parcel
+                continue
+            batch.append((pnu, payload["road_address"], payload.get("lon"), payload.get("lat")))
+            if len(batch) >= args.batch_size:
+                upserted += parcels.add_many(batch)
+                batch.clear()
+        if batch:
+            upserted += parcels.add_many(batch)
+        return {"upserted": upserted, **parcels.count()}
+    finally:
+        parcels.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="ledger_cache / geocode_cache 유지보수")
+    parser.add_argument("--db", type=Path, help="캐시 SQLite 경로 (기본: CACHE_DB_PATH)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="트랜잭션/페이지당 처리 건수")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("stats", help="행 수, 크기, 경과일 분포").set_defaults(run=stats)
+
+    purge_parser = commands.add_parser(
+        "purge", help="TTL(+STALE_MAX_DAYS)이 지난 행 삭제 후 incremental vacuum"
+    )
+    purge_parser.add_argument(
+        "--no-vacuum", action="store_true", help="삭제만 하고 파일 크기는 회수하지 않음"
+    )
+    purge_parser.set_defaults(run=purge)
+
+    vacuum_parser = commands.add_parser("vacuum", help="빈 페이지를 파일시스템에 반환")
+    vacuum_parser.add_argument("--full", action="store_true", help="incremental 대신 전체 VACUUM")
+    vacuum_parser.set_defaults(run=vacuum)
+
+    export_parser = commands.add_parser("export", help="캐시를 NDJSON으로 내보내기")
+    export_parser.add_argument("file", help="출력 파일 (- 이면 stdout)")
+    export_parser.set_defaults(run=export)
+
+    import_parser = commands.add_parser("import", help="NDJSON 캐시 가져오기 (더 최신인 로컬 행은 유지)")
+    import_parser.add_argument("file", help="입력 파일 (- 이면 stdin)")
+    import_parser.set_defaults(run=import_)
+
+    commands.add_parser(
+        "reindex", help="캐시된 PNU를 지역/좌표 인덱스(parcel_index)에 등록"
+    ).set_defaults(run=reindex)
+
+    args = parser.parse_args()
+    args.settings = Settings.load(require_keys=False)
+    db_path = args.db or args.settings.cache_db_path
+
+    ledger = SqliteLedgerCache(db_path)
+    geocode = GeocodeCache(db_path)
+    try:
+        result = args.run(ledger, geocode, args)
+    finally:
+        ledger.close()
+        geocode.close()
+
+    # Keep stdout clean for `export -`.
+    output = sys.stderr if args.command == "export" and args.file == "-" else sys.stdout
+    print(json.dumps(result, ensure_ascii=False, indent=2), file=output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import bisect
+import socketserver
+import threading
+import time
+from typing import Any
+
+
+class FakeRedis:
+    """In-memory data for the stand-in: strings with expiry and sorted sets.
+
+    Implements the commands ``RedisLedgerCache`` sends plus a few for poking
+    at the data by hand (GET, EXISTS, DBSIZE, ZCARD, FLUSHDB).
+    """
+
+    def __init__(self) -> None:
+        self.strings: dict[bytes, tuple[bytes, float | None]] = {}
+        self.zsets: dict[bytes, dict[bytes, float]] = {}
+        self.lock = threading.Lock()
+
+    def run(self, name: str, args: list[bytes]) -> Any:
+        handler = getattr(self, f"cmd_{name.lower()}", None)
+        if handler is None:
+            return ValueError(f"ERR unknown command '{name}'")
+        with self.lock:
+            try:
+                return handler(*args)
+            except (TypeError, ValueError) as exc:
+                return ValueError(f"ERR {exc}")
+
+    def cmd_ping(self, *args: bytes) -> Any:
+        return args[0] if args else "PONG"
+
+    def cmd_auth(self, *args: bytes) -> Any:
+        return "OK"
+
+    def cmd_select(self, db: bytes) -> Any:
+        return "OK"
+
+    def cmd_get(self, key: bytes) -> Any:
+        return self._string(key)
+
+    def cmd_set(self, key: bytes, value: bytes, *options: bytes) -> Any:
+        expires_at = None
+        if len(options) >= 2 and options[0].upper() == b"EX":
+            expires_at = time.time() + float(options[1])
+        self.strings[key] = (value, expires_at)
+        self.zsets.pop(key, None)
+        return "OK"
+
+    def cmd_mget(self, *keys: bytes) -> Any:
+        return [self._string(key) for key in keys]
+
+    def cmd_del(self, *keys: bytes) -> Any:
+        removed = 0
+        for key in keys:
+            removed += (self.strings.pop(key, None) is not None) + (self.zsets.pop(key, None) is not None)
+        return removed
+
+    def cmd_exists(self, *keys: bytes) -> Any:
+        return sum(self._string(key) is not None or key in self.zsets for key in keys)
+
+    def cmd_dbsize(self) -> Any:
+        return len(self.strings) + len(self.zsets)
+
+    def cmd_flushdb(self, *args: bytes) -> Any:
+        self.strings.clear()
+        self.zsets.clear()
+        return "OK"
+
+    def cmd_zadd(self, key: bytes, *pairs: bytes) -> Any:
+        zset = self.zsets.setdefault(key, {})
+        added = 0
+        for score, member in zip(pairs[::2], pairs[1::2]):
+            added += member not in zset
+            zset[member] = float(score)
+        return added
+
+    def cmd_zrem(self, key: bytes, *members: bytes) -> Any:
+        zset = self.zsets.get(key, {})
+        return sum(zset.pop(member, None) is not None for member in members)
+
+    def cmd_zcard(self, key: bytes) -> Any:
+        return len(self.zsets.get(key, {}))
+
+    def cmd_zrangebyscore(self, key: bytes, low: bytes, high: bytes, *options: bytes) -> Any:
+        ordered = sorted(self.zsets.get(key, {}).items(), key=lambda item: (item[1], item[0]))
+        scores = [score for _, score in ordered]
+        start = bisect.bisect_left(scores, _score(low))
+        end = bisect.bisect_right(scores, _score(high))
+        members = [member for member, _ in ordered[start:end]]
+        if len(options) >= 3 and options[0].upper() == b"LIMIT":
+            offset, count = int(options[1]), int(options[2])
+            members = members[offset:] if count < 0 else members[offset : offset + count]
+        return members
+
+    def cmd_zremrangebyscore(self, key: bytes, low: bytes, high: bytes) -> Any:
+        zset = self.zsets.get(key, {})
+        doomed = [member for member, score in zset.items() if _score(low) <= score <= _score(high)]
+        for member in doomed:
+            del zset[member]
+        return len(doomed)
+
+    def _string(self, key: bytes) -> bytes | None:
+        entry = self.strings.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self.strings[key]
+            return None
+        return value
+
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+    """In-process Redis-protocol stand-in for exercising ``RedisLedgerCache``.
+
+    ``with FakeRedisServer() as server:`` listens on a free local port and
+    serves from a background thread; ``server.url`` is a ready REDIS_URL.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        super().__init__((host, port), RespHandler)
+        self.data = FakeRedis()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"redis://{host}:{port}/0"
+
+    def __enter__(self) -> FakeRedisServer:
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class RespHandler(socketserver.StreamRequestHandler):
+    server: FakeRedisServer
+    # Pipelined replies are written one by one; without this, Nagle plus
+    # delayed ACKs adds ~40 ms to every multi-command round trip.
+    disable_nagle_algorithm = True
+
+    def handle(self) -> None:
+        while True:
+            command = self._read_command()
+            if command is None:
+                return
+            reply = self.server.data.run(command[0].decode().upper(), command[1:])
+            self.wfile.write(_encode_reply(reply))
+
+    def _read_command(self) -> list[bytes] | None:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            return line.split()  # inline command, e.g. from telnet / redis-cli PING
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+
+def _score(value: bytes) -> float:
+    if value.startswith(b"("):
+        raise ValueError("exclusive score ranges are not supported")
+    return float(value)
+
+
+def _encode_reply(reply: Any) -> bytes:
+    if isinstance(reply, ValueError):
+        return b"-%s\r\n" % str(reply).encode()
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, str):
+        return b"+%s\r\n" % reply.encode()
+    if isinstance(reply, int):
+        return b":%d\r\n" % reply
+    if isinstance(reply, bytes):
+        return b"$%d\r\n%s\r\n" % (len(reply), reply)
+    return b"*%d\r\n" % len(reply) + b"".join(_encode_reply(item) for item in reply)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="RedisLedgerCache 테스트용 인메모리 Redis 프로토콜 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6390)
+    args = parser.parse_args()
+
+    server = FakeRedisServer(args.host, args.port)
+    print(f"REDIS_URL={server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
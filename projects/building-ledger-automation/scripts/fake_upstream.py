@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import hashlib
+import json
+import random
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+VWORLD_PATH = "/req/address"
+BUILDING_HUB_PATH = "/1613000/BldRgstHubService"
+
+# Shapes follow real getcoord / BldRgstHubService responses; used when no
+# recorded fixtures are given.
+SAMPLE_VWORLD = {
+    "response": {
+        "service": {"name": "address", "version": "2.0", "operation": "getcoord"},
+        "status": "OK",
+        "input": {"type": "parcel", "address": ""},
+        "refined": {
+            "text": "충청남도 천안시 서북구 불당동 1329",
+            "structure": {
+                "level0": "대한민국",
+                "level1": "충청남도",
+                "level2": "천안시 서북구",
+                "level4L": "불당동",
+                "level4LC": "",
+                "level5": "1329",
+            },
+        },
+        "result": {"crs": "EPSG:4326", "point": {"x": "127.1045", "y": "36.8118"}},
+    }
+}
+SAMPLE_ITEMS = {
+    "getBrTitleInfo": {
+        "regstrKindCdNm": "일반",
+        "bldNm": "불당타워",
+        "dongNm": "",
+        "platPlc": "충청남도 천안시 서북구 불당동 1329번지",
+        "newPlatPlc": "충청남도 천안시 서북구 불당21로 67",
+        "platArea": "1234.5",
+        "archArea": "740.2",
+        "bcRat": "59.96",
+        "totArea": "9876.5",
+        "vlRatEstmTotArea": "7020.1",
+        "vlRat": "568.67",
+        "strctCdNm": "철근콘크리트구조",
+        "etcStrct": "철근콘크리트조",
+        "rserthqkDsgnApplyYn": "1",
+        "rserthqkAblty": "VII-0.204g",
+        "useAprDay": "20150101",
+    },
+    "getBrRecapTitleInfo": {"bldNm": "불당타워", "mainBldCnt": "2", "totArea": "19876.5"},
+    "getBrFlrOulnInfo": {
+        "flrGbCdNm": "지상",
+        "flrNo": "1",
+        "mainPurpsCdNm": "제1종근린생활시설",
+        "area": "620.4",
+    },
+    "getBrExposPubuseAreaInfo": {
+        "exposPubuseGbCdNm": "전유",
+        "flrNo": "1",
+        "hoNm": "101호",
+        "area": "84.9",
+    },
+}
+
+
+def load_fixtures(directory: Path | None) -> tuple[list[dict], dict[str, list[dict]]]:
+    """Recorded responses: ``<dir>/vworld/*.json`` and ``<dir>/<operation>/*.json``.
+
+    Vworld files are whole getcoord responses; Building HUB files are whole
+    operation responses whose ``response.body.items.item`` rows are replayed.
+    """
+    vworld = [SAMPLE_VWORLD]
+    items = {operation: [item] for operation, item in SAMPLE_ITEMS.items()}
+    if directory is None:
+        return vworld, items
+
+    recorded = sorted((directory / "vworld").glob("*.json"))
+    vworld = [json.loads(path.read_text(encoding="utf-8")) for path in recorded] or vworld
+    for operation in SAMPLE_ITEMS:
+        rows: list[dict] = []
+        for path in sorted((directory / operation).glob("*.json")):
+            body = json.loads(path.read_text(encoding="utf-8")).get("response", {}).get("body", {})
+            item = (body.get("items") or {}).get("item", [])
+            rows.extend(item if isinstance(item, list) else [item])
+        items[operation] = rows or items[operation]
+    return vworld, items
+
+
+def pnu_for_address(address: str) -> str:
+    """Stable fake PNU so each distinct address is a distinct cache entry."""
+    digest = int(hashlib.sha1(address.encode("utf-8")).hexdigest(), 16)
+    return f"4413310100{1 + digest % 2}{digest // 2 % 10000:04d}{digest // 20000 % 10000:04d}"
+
+
+def point_for_pnu(pnu: str, base: dict[str, Any]) -> dict[str, str]:
+    """Spread parcels within ~3 km of the fixture's point, stable per PNU."""
+    digest = int(pnu[-8:])
+    x = float(base.get("x", 127.1045)) + (digest % 1000 - 500) * 0.00006
+    y = float(base.get("y", 36.8118)) + (digest // 1000 % 1000 - 500) * 0.00005
+    return {"x": f"{x:.7f}", "y": f"{y:.7f}"}
+
+
+def create_app(args: argparse.Namespace) -> FastAPI:
+    vworld_responses, operation_items = load_fixtures(args.fixtures)
+    rng = random.Random(args.seed)
+    counts: Counter[str] = Counter()
+    app = FastAPI(title="Fake Vworld / Building HUB")
+
+    async def simulate(route: str) -> JSONResponse | None:
+        counts[route] += 1
+        delay = max(0.0, rng.gauss(args.latency_ms, args.jitter_ms)) / 1000
+        await asyncio.sleep(delay)
+        if rng.random() < args.error_rate:
+            counts[f"{route}_errors"] += 1
+            return JSONResponse({"error": "injected failure"}, status_code=503)
+        return None
+
+    @app.get("/_stats")
+    def stats() -> dict[str, int]:
+        return dict(counts)
+
+    @app.get(VWORLD_PATH)
+    async def geocode(request: Request) -> Any:
+        failure = await simulate("vworld")
+        if failure:
+            return failure
+        address = request.query_params.get("address", "")
+        pnu = pnu_for_address(address)
+        payload = copy.deepcopy(vworld_responses[int(pnu[-8:]) % len(vworld_responses)])
+        response = payload.setdefault("response", {})
+        response["status"] = "OK"
+        response.setdefault("input", {})["address"] = address
+        response.setdefault("refined", {}).setdefault("structure", {})["level4LC"] = pnu
+        result = response.setdefault("result", {})
+        result["point"] = point_for_pnu(pnu, result.get("point") or {})
+        return payload
+
+    @app.get(BUILDING_HUB_PATH + "/{operation}")
+    async def building_hub(operation: str, request: Request) -> Any:
+        failure = await simulate(operation)
+        if failure:
+            return failure
+        templates = operation_items.get(operation)
+        if templates is None:
+            return JSONResponse({"error": f"unknown operation {operation}"}, status_code=404)
+
+        params = request.query_params
+        total = args.buildings if operation == "getBrTitleInfo" else len(templates)
+        page_no = int(params.get("pageNo", "1"))
+        num_rows = int(params.get("numOfRows", "10"))
+        start = (page_no - 1) * num_rows
+        rows = []
+        for index in range(start, min(total, start + num_rows)):
+            row = copy.deepcopy(templates[index % len(templates)])
+            row.update(
+                sigunguCd=params.get("sigungu_code", ""),
+                bjdongCd=params.get("bdong_code", ""),
+                platGbCd=params.get("plat_code", "0"),
+                bun=params.get("bun", ""),
+                ji=params.get("ji", ""),
+            )
+            if total > 1:
+                row["dongNm"] = f"{index + 1}동"
+            rows.append(row)
+
+        return {
+            "response": {
+                "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+                "body": {
+                    "items": {"item": rows},
+                    "numOfRows": str(num_rows),
+                    "pageNo": str(page_no),
+                    "totalCount": str(total),
+                },
+            }
+        }
+
+    return app
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="부하 테스트용 가짜 Vworld / 건축HUB 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--fixtures", type=Path, help="녹화된 응답 디렉터리 (vworld/, getBrTitleInfo/ ...)")
+    parser.add_argument("--latency-ms", type=float, default=80.0, help="평균 응답 지연")
+    parser.add_argument("--jitter-ms", type=float, default=30.0, help="지연 표준편차")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503을 돌려줄 비율 (0~1)")
+    parser.add_argument("--buildings", type=int, default=1, help="필지당 표제부 건수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(args), host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
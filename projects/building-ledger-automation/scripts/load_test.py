@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import Counter
+from pathlib import Path
+
+import httpx
+
+
+def load_addresses(path: Path | None, unique: int) -> list[str]:
+    """Addresses from a file (one per line), or ``unique`` synthetic ones.
+
+    With scripts/fake_upstream.py every distinct address is a distinct PNU, so
+    ``unique`` controls the cache hit ratio of a run.
+    """
+    if path is not None:
+        lines = path.read_text(encoding="utf-8").splitlines()
+        return [line.strip() for line in lines if line.strip()]
+    return [f"충청남도 천안시 서북구 불당동 {1000 + n}" for n in range(unique)]
+
+
+class LoadStats:
+    def __init__(self) -> None:
+        self.latencies: list[float] = []
+        self.statuses: Counter[str] = Counter()
+        self.items = 0
+        self.item_errors: Counter[str] = Counter()
+
+    def report(self, elapsed: float, sent: int) -> dict:
+        latencies = sorted(self.latencies)
+        completed = len(latencies)
+        report = {
+            "sent": sent,
+            "completed": completed,
+            "statuses": dict(self.statuses),
+            "seconds": round(elapsed, 2),
+            "throughput_rps": round(completed / elapsed, 1) if elapsed else 0.0,
+            "latency_ms": {
+                "p50": _percentile_ms(latencies, 0.50),
+                "p95": _percentile_ms(latencies, 0.95),
+                "p99": _percentile_ms(latencies, 0.99),
+                "max": _percentile_ms(latencies, 1.0),
+            },
+        }
+        if self.items:
+            report["items"] = self.items
+            report["items_per_second"] = round(self.items / elapsed, 1)
+            report["item_errors"] = dict(self.item_errors)
+        return report
+
+
+async def send_lookup(client: httpx.AsyncClient, args: argparse.Namespace, addresses: list[str]) -> str:
+    response = await client.post(
+        "/lookup",
+        params={"include": args.include} if args.include else None,
+        json={"address": addresses[0], "force_refresh": args.force_refresh},
+    )
+    return str(response.status_code)
+
+
+async def send_batch(
+    client: httpx.AsyncClient,
+    args: argparse.Namespace,
+    addresses: list[str],
+    stats: LoadStats,
+) -> str:
+    body = {
+        "addresses": addresses,
+        "force_refresh": args.force_refresh,
+        "include": args.include.split(",") if args.include else [],
+    }
+    async with client.stream("POST", "/lookup/batch", json=body) as response:
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+            record = json.loads(line)
+            stats.items += 1
+            if not record["success"]:
+                stats.item_errors[str(record["status_code"])] += 1
+    return str(response.status_code)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    addresses = load_addresses(args.addresses, args.unique)
+    per_request = args.batch_size if args.mode == "batch" else 1
+    total = int(args.rps * args.duration)
+    stats = LoadStats()
+    in_flight = asyncio.Semaphore(args.max_in_flight)
+    headers = {"X-API-Key": args.api_key} if args.api_key else {}
+    limits = httpx.Limits(max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight)
+
+    async with httpx.AsyncClient(
+        base_url=args.url,
+        headers=headers,
+        limits=limits,
+        timeout=args.timeout,
+    ) as client:
+
+        async def one(index: int, scheduled_at: float) -> None:
+            start = index * per_request
+            chosen = [addresses[(start + offset) % len(addresses)] for offset in range(per_request)]
+            try:
+                if args.mode == "batch":
+                    status = await send_batch(client, args, chosen, stats)
+                else:
+                    status = await send_lookup(client, args, chosen)
+            except httpx.HTTPError as exc:
+                status = type(exc).__name__
+            finally:
+                in_flight.release()
+            # Measured from the scheduled send time, so a saturated server
+            # shows up as latency instead of silently lowering the request rate.
+            stats.latencies.append(time.perf_counter() - scheduled_at)
+            stats.statuses[status] += 1
+
+        tasks = []
+        started = time.perf_counter()
+        for index in range(total):
+            scheduled_at = started + index / args.rps
+            delay = scheduled_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await in_flight.acquire()
+            tasks.append(asyncio.ensure_future(one(index, scheduled_at)))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    return stats.report(elapsed, total)
+
+
+def _percentile_ms(ordered: list[float], quantile: float) -> float | None:
+    if not ordered:
+        return None
+    rank = min(len(ordered) - 1, max(0, round(quantile * len(ordered)) - 1))
+    return round(ordered[rank] * 1000, 1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="/lookup, /lookup/batch 부하 생성기 (목표 RPS 고정)")
+    parser.add_argument("--url", default="http://127.0.0.1:8080", help="API 서버 주소")
+    parser.add_argument("--mode", choices=("lookup", "batch"), default="lookup")
+    parser.add_argument("--rps", type=float, default=20.0, help="초당 요청 수 (batch는 배치 요청 수)")
+    parser.add_argument("--duration", type=float, default=30.0, help="부하 시간(초)")
+    parser.add_argument("--batch-size", type=int, default=20, help="batch 요청당 주소 수")
+    parser.add_argument("--unique", type=int, default=1000, help="합성 주소 개수 (캐시 적중률 조절)")
+    parser.add_argument("--addresses", type=Path, help="주소 목록 파일 (한 줄에 하나)")
+    parser.add_argument("--include", help="추가 섹션 (예: floor,expos_area)")
+    parser.add_argument("--force-refresh", action="store_true", help="캐시를 우회해 upstream까지 측정")
+    parser.add_argument("--max-in-flight", type=int, default=256, help="동시 요청 상한")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--api-key", default=os.getenv("LEDGER_API_TOKEN"), help="X-API-Key")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args)), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,31 +2,343 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import csv
 import json
 import sys
+import time
 from pathlib import Path
+from typing import Any, Iterator, TextIO
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_DIR = PROJECT_ROOT / "src"
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
+from building_ledger_api.clients import (
+    CircuitOpenError,
+    QuotaExceededError,
+    RequestError,
+    UpstreamThrottledError,
+)
 from building_ledger_api.config import Settings
-from building_ledger_api.service import LedgerLookupService
+from building_ledger_api.models import BuildingLedgerData
+from building_ledger_api.service import LedgerLookupService, validate_sections
+
+CSV_COLUMNS = (
+    "index",
+    "address",
+    "success",
+    "status_code",
+    "error",
+    "pnu",
+    "road_address",
+    "from_cache",
+    "stale",
+    *BuildingLedgerData.model_fields,
+)
+PROGRESS_EVERY = 500
+
+
+def iter_addresses(path: Path, column: str, encoding: str, sheet: str | None) -> Iterator[tuple[int, str]]:
+    """``(index, address)`` for every data row, read lazily; ``index`` is 0-based.
+
+    The header is checked on the call itself, before any row is read.
+    """
+    if path.suffix.lower() == ".xlsx":
+        rows = _iter_xlsx_rows(path, sheet)
+    else:
+        rows = _iter_csv_rows(path, encoding)
+
+    header = [str(name or "").strip() for name in next(rows, [])]
+    if column not in header:
+        raise SystemExit(f"Column {column!r} not found in {path} (columns: {', '.join(header)})")
+    return _iter_column(rows, header.index(column))
+
+
+def _iter_column(rows: Iterator[list[Any]], position: int) -> Iterator[tuple[int, str]]:
+    for index, row in enumerate(rows):
+        value = row[position] if position < len(row) else None
+        yield index, str(value or "").strip()
+
+
+def _iter_csv_rows(path: Path, encoding: str) -> Iterator[list[Any]]:
+    with path.open(encoding=encoding, newline="") as handle:
+        yield from csv.reader(handle)
+
+
+def _iter_xlsx_rows(path: Path, sheet: str | None) -> Iterator[list[Any]]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise SystemExit("XLSX input needs openpyxl: pip install -r requirements-xlsx.txt") from None
+
+    # read_only streams rows instead of loading the whole workbook.
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet] if sheet else workbook.active
+        for row in worksheet.iter_rows(values_only=True):
+            yield list(row)
+    finally:
+        workbook.close()
+
+
+class Checkpoint:
+    """Append-only log of finished row indexes next to the output file.
+
+    Each index is appended right after its output row is flushed, so a crash
+    loses at most the rows still in flight, and those are simply redone. A row
+    flushed just before a crash but not yet marked is found again in the
+    output (``ResultWriter.finished_indexes``), so it is not written twice.
+    The first line records the input, so a checkpoint is never applied to a
+    different file or column.
+    """
+
+    def __init__(self, path: Path, source: dict[str, str]) -> None:
+        self.path = path
+        self.source = source
+        self.done: set[int] = set()
+        self._handle: TextIO | None = None
+
+    def load(self) -> bool:
+        """Read finished indexes from an earlier run; False when there is none."""
+        if not self.path.exists():
+            return False
+        with self.path.open(encoding="utf-8") as handle:
+            recorded = json.loads(handle.readline() or "{}")
+            if recorded != self.source:
+                raise SystemExit(
+                    f"Checkpoint {self.path} belongs to {recorded}, not {self.source}; "
+                    "use --restart to start over"
+                )
+            for line in handle:
+                if line.strip():
+                    self.done.add(int(line))
+        return True
+
+    def open(self, resume: bool) -> None:
+        self._handle = self.path.open("a" if resume else "w", encoding="utf-8")
+        if not resume:
+            self._handle.write(json.dumps(self.source, ensure_ascii=False) + "\n")
+            self._handle.flush()
+
+    def mark(self, index: int) -> None:
+        self._handle.write(f"{index}\n")
+        self._handle.flush()
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+
+
+class ResultWriter:
+    """Writes one record per finished row, as CSV or NDJSON by file extension."""
+
+    def __init__(self, path: Path, resume: bool) -> None:
+        self.ndjson = _is_ndjson(path)
+        appending = resume and path.exists() and path.stat().st_size > 0
+        # Excel only detects UTF-8 with a BOM; never write one mid-file.
+        encoding = "utf-8" if appending or self.ndjson else "utf-8-sig"
+        self._handle = path.open("a" if appending else "w", encoding=encoding, newline="")
+        if appending and not _ends_with_newline(path):
+            self._handle.write("\n")  # a line cut off by a crash; start the next row cleanly
+        self._csv = None if self.ndjson else csv.DictWriter(self._handle, CSV_COLUMNS, extrasaction="ignore")
+        if self._csv is not None and not appending:
+            self._csv.writeheader()
+
+    @staticmethod
+    def finished_indexes(path: Path) -> set[int]:
+        """Row indexes already in an earlier run's output (cut-off lines are ignored)."""
+        if not path.exists():
+            return set()
+        indexes: set[int] = set()
+        with path.open(encoding="utf-8-sig", newline="") as handle:
+            if _is_ndjson(path):
+                records = (_json_or_none(line) for line in handle)
+            else:
+                records = csv.DictReader(handle)
+            for record in records:
+                try:
+                    indexes.add(int(record["index"]))
+                except (TypeError, KeyError, ValueError):
+                    continue
+        return indexes
+
+    def write(self, record: dict[str, Any]) -> None:
+        if self._csv is None:
+            self._handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            self._csv.writerow(_csv_row(record))
+        self._handle.flush()
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+def _is_ndjson(path: Path) -> bool:
+    return path.suffix.lower() in {".ndjson", ".jsonl"}
+
+
+def _ends_with_newline(path: Path) -> bool:
+    with path.open("rb") as handle:
+        handle.seek(-1, 2)
+        return handle.read(1) == b"\n"
+
+
+def _json_or_none(line: str) -> dict[str, Any] | None:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def _csv_row(record: dict[str, Any]) -> dict[str, Any]:
+    row = {key: record.get(key) for key in ("index", "address", "success", "status_code", "error")}
+    result = record.get("result")
+    if result:
+        row.update({key: result.get(key) for key in ("pnu", "road_address", "from_cache", "stale")})
+        row.update(result.get("data") or {})
+    return row
+
+
+async def run_batch(settings: Settings, args: argparse.Namespace) -> int:
+    """Look up every address of ``args.input`` through one shared service.
+
+    ``args.workers`` tasks pull rows from a small queue, so the input is read
+    only as fast as lookups finish. Rows that failed for good (not found, bad
+    address, or an unexpected error) are written and checkpointed; a used-up
+    daily quota stops the run so it can be resumed later, and an open circuit
+    is waited out. The reader and the workers are awaited together, so a
+    worker that dies (e.g. the output cannot be written) ends the run instead
+    of leaving the reader blocked on a full queue.
+    """
+    sections = validate_sections(args.include.split(",") if args.include else [])
+    output: Path = args.output
+    checkpoint = Checkpoint(
+        args.checkpoint or output.with_name(output.name + ".checkpoint"),
+        {"input": str(args.input.resolve()), "column": args.column},
+    )
+    resume = not args.restart and checkpoint.load()
+    addresses = iter_addresses(args.input, args.column, args.encoding, args.sheet)
+    if resume:
+        checkpoint.done |= ResultWriter.finished_indexes(output)
+        print(f"resuming: {len(checkpoint.done):,} rows already done", file=sys.stderr)
+
+    service = LedgerLookupService(settings)
+    writer = ResultWriter(output, resume)
+    checkpoint.open(resume)
+    queue: asyncio.Queue[tuple[int, str] | None] = asyncio.Queue(maxsize=args.workers * 2)
+    stop = asyncio.Event()
+    counts = {"ok": 0, "failed": 0, "skipped": 0}
+    started = time.perf_counter()
+
+    async def lookup(address: str) -> dict[str, Any]:
+        while True:
+            try:
+                result = await service.lookup(
+                    address,
+                    force_refresh=args.force_refresh,
+                    include=sections,
+                    include_raw=args.include_raw,
+                )
+                return {"success": True, "result": result}
+            except (CircuitOpenError, UpstreamThrottledError) as exc:
+                await asyncio.sleep(max(exc.retry_after, 1.0))
+            except QuotaExceededError:
+                raise
+            except RequestError as exc:
+                return {"success": False, "status_code": 502, "error": str(exc)}
+            except ValueError as exc:
+                return {"success": False, "status_code": 400, "error": str(exc)}
+
+    async def worker() -> None:
+        while (item := await queue.get()) is not None:
+            index, address = item
+            if stop.is_set():
+                continue
+            try:
+                outcome = await lookup(address)
+            except QuotaExceededError as exc:
+                if not stop.is_set():
+                    print(f"stopping: {exc}; run again to resume", file=sys.stderr)
+                stop.set()
+                continue
+            except Exception as exc:  # unexpected data or a bug: record the row, keep going
+                outcome = {"success": False, "status_code": 500, "error": f"{type(exc).__name__}: {exc}"}
+            writer.write({"index": index, "address": address, **outcome})
+            checkpoint.mark(index)
+            counts["ok" if outcome["success"] else "failed"] += 1
+            done = counts["ok"] + counts["failed"]
+            if done % PROGRESS_EVERY == 0:
+                rate = done / (time.perf_counter() - started)
+                print(f"done {done:,} ({counts['failed']:,} failed), {rate:.1f} rows/s", file=sys.stderr)
+
+    async def produce() -> None:
+        for index, address in addresses:
+            if stop.is_set():
+                break
+            if index in checkpoint.done or not address:
+                counts["skipped"] += 1
+                continue
+            await queue.put((index, address))
+        for _ in workers:
+            await queue.put(None)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(args.workers)]
+    producer = asyncio.ensure_future(produce())
+    try:
+        await asyncio.gather(producer, *workers)
+    finally:
+        for task in (producer, *workers):
+            task.cancel()
+        writer.close()
+        checkpoint.close()
+        await service.aclose()
+
+    elapsed = time.perf_counter() - started
+    summary = {**counts, "stopped": stop.is_set(), "seconds": round(elapsed, 2), "output": str(output)}
+    print(json.dumps(summary, ensure_ascii=False))
+    return 2 if stop.is_set() else 0
 
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="One-off building ledger lookup")
-    parser.add_argument("--address", required=True, help="지번 주소")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--address", help="지번 주소")
+    source.add_argument("--input", type=Path, help="주소 열이 있는 CSV/XLSX 파일 (일괄 조회)")
     parser.add_argument("--force-refresh", action="store_true")
+
+    batch = parser.add_argument_group("일괄 조회 (--input)")
+    batch.add_argument("--column", default="address", help="주소 열 이름 (첫 행 기준)")
+    batch.add_argument("--sheet", help="XLSX 시트 이름 (기본: 활성 시트)")
+    batch.add_argument("--encoding", default="utf-8-sig", help="CSV 인코딩 (예: cp949)")
+    batch.add_argument("--output", type=Path, help="결과 파일 (.csv 또는 .ndjson)")
+    batch.add_argument("--checkpoint", type=Path, help="체크포인트 파일 (기본: <output>.checkpoint)")
+    batch.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터")
+    batch.add_argument("--workers", type=int, help="동시 조회 수 (기본: BATCH_CONCURRENCY)")
+    batch.add_argument("--include", help="추가 섹션 (예: floor,expos_area; NDJSON 출력에만 포함)")
+    batch.add_argument("--include-raw", action="store_true", help="NDJSON 출력에 raw_item 포함")
     args = parser.parse_args()
 
     settings = Settings.load()
-    service = LedgerLookupService(settings)
-    result = service.lookup(args.address, force_refresh=args.force_refresh)
+    if args.input:
+        if args.output is None:
+            parser.error("--output is required with --input")
+        args.workers = args.workers or settings.batch_concurrency
+        return asyncio.run(run_batch(settings, args))
+
+    result = asyncio.run(_lookup(settings, args.address, args.force_refresh))
     print(json.dumps(result, ensure_ascii=False, indent=2))
     return 0
 
 
+async def _lookup(settings: Settings, address: str, force_refresh: bool) -> dict:
+    service = LedgerLookupService(settings)
+    try:
+        return await service.lookup(address, force_refresh=force_refresh)
+    finally:
+        await service.aclose()
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from building_ledger_api.cache import SqliteLedgerCache
+from building_ledger_api.config import Settings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="ledger_cache 기존 JSON 행을 압축 포맷으로 변환")
+    parser.add_argument("--db", type=Path, help="캐시 SQLite 경로 (기본: CACHE_DB_PATH)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="트랜잭션당 변환 건수")
+    parser.add_argument("--vacuum", action="store_true", help="변환 후 VACUUM으로 파일 크기 회수")
+    args = parser.parse_args()
+
+    db_path = args.db or Settings.load(require_keys=False).cache_db_path
+    size_before = db_path.stat().st_size if db_path.exists() else 0
+    cache = SqliteLedgerCache(db_path)
+    migrated = cache.migrate_legacy_rows(batch_size=args.batch_size)
+    if args.vacuum:
+        cache.vacuum()
+    cache.close()
+
+    print(json.dumps({"migrated": migrated, "bytes_before": size_before, "bytes_after": db_path.stat().st_size}))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,4 +1,10 @@
 """Building ledger lookup API package."""
 
+import time
+
+# Start of the package import; main.py reports the difference as the "import"
+# startup phase (ledger_startup_seconds).
+IMPORT_STARTED = time.perf_counter()
+
 __all__ = ["__version__"]
 __version__ = "0.1.0"
@@ -2,64 +2,700 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
+from .metrics import CACHE_LATENCY, CACHE_REQUESTS
+
+if TYPE_CHECKING:
+    from .config import Settings
+
+# Per-connection tuning. WAL lets readers proceed while a writer commits, and
+# synchronous=NORMAL is durable enough for a cache that can always be refetched.
+# auto_vacuum must precede journal_mode to apply to a new file; existing files
+# switch over on their next full VACUUM.
+PRAGMAS = (
+    "PRAGMA auto_vacuum = INCREMENTAL",
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+)
+STATEMENT_CACHE_SIZE = 64
+AUTO_VACUUM_INCREMENTAL = 2
+# Age histogram buckets (upper bounds in days) reported by storage_stats().
+AGE_BUCKETS_DAYS = (1, 7, 30, 90, 180, 365)
+
+# ledger_cache row formats:
+#   1: payload_json holds the whole result as JSON text (legacy rows)
+#   2: payload_blob holds zlib-compressed compact JSON without raw_item, and
+#      raw_blob holds raw_item separately so it is only inflated on request
+SCHEMA_VERSION = 2
+COMPRESSION_LEVEL = 6
+
+LEDGER_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS ledger_cache (
+        pnu TEXT PRIMARY KEY,
+        payload_json TEXT NOT NULL DEFAULT '',
+        fetched_at TEXT NOT NULL,
+        schema_version INTEGER NOT NULL DEFAULT 1,
+        payload_blob BLOB,
+        raw_blob BLOB
+    )
+"""
+LEDGER_FETCHED_AT_INDEX = (
+    "CREATE INDEX IF NOT EXISTS ledger_cache_fetched_at ON ledger_cache (fetched_at)"
+)
+# Columns added to ledger_cache files created before SCHEMA_VERSION 2.
+LEDGER_ADDED_COLUMNS = {
+    "schema_version": "ALTER TABLE ledger_cache ADD COLUMN schema_version INTEGER NOT NULL DEFAULT 1",
+    "payload_blob": "ALTER TABLE ledger_cache ADD COLUMN payload_blob BLOB",
+    "raw_blob": "ALTER TABLE ledger_cache ADD COLUMN raw_blob BLOB",
+}
+LEDGER_COLUMNS = "schema_version, payload_json, payload_blob"
+LEDGER_SELECT = f"SELECT {LEDGER_COLUMNS}, fetched_at FROM ledger_cache WHERE pnu = ?"
+LEDGER_SELECT_WITH_RAW = f"SELECT {LEDGER_COLUMNS}, fetched_at, raw_blob FROM ledger_cache WHERE pnu = ?"
+LEDGER_SELECT_EXPIRING = f"""
+    SELECT pnu, {LEDGER_COLUMNS} FROM ledger_cache
+    WHERE fetched_at < ? AND instr(pnu, ':') = 0
+    ORDER BY fetched_at
+    LIMIT ?
+"""
+LEDGER_SELECT_PAGE = f"""
+    SELECT pnu, {LEDGER_COLUMNS}, raw_blob, fetched_at FROM ledger_cache
+    WHERE pnu > ?
+    ORDER BY pnu
+    LIMIT ?
+"""
+LEDGER_SELECT_LEGACY = """
+    SELECT pnu, payload_json FROM ledger_cache
+    WHERE schema_version < ?
+    LIMIT ?
+"""
+LEDGER_UPSERT = """
+    INSERT INTO ledger_cache (pnu, payload_json, fetched_at, schema_version, payload_blob, raw_blob)
+    VALUES (?, '', ?, ?, ?, ?)
+    ON CONFLICT(pnu) DO UPDATE SET
+        payload_json = '',
+        fetched_at = excluded.fetched_at,
+        schema_version = excluded.schema_version,
+        payload_blob = excluded.payload_blob,
+        raw_blob = excluded.raw_blob
+"""
+# Imported rows only replace local rows that were fetched earlier.
+LEDGER_RESTORE = """
+    INSERT INTO ledger_cache (pnu, payload_json, fetched_at, schema_version, payload_blob, raw_blob)
+    VALUES (?, '', ?, ?, ?, ?)
+    ON CONFLICT(pnu) DO UPDATE SET
+        payload_json = '',
+        fetched_at = excluded.fetched_at,
+        schema_version = excluded.schema_version,
+        payload_blob = excluded.payload_blob,
+        raw_blob = excluded.raw_blob
+    WHERE excluded.fetched_at > ledger_cache.fetched_at
+"""
+LEDGER_PURGE_TITLES = """
+    DELETE FROM ledger_cache WHERE rowid IN (
+        SELECT rowid FROM ledger_cache
+        WHERE fetched_at < ? AND instr(pnu, ':') = 0
+        LIMIT ?
+    )
+"""
+LEDGER_PURGE_SECTION = """
+    DELETE FROM ledger_cache WHERE rowid IN (
+        SELECT rowid FROM ledger_cache
+        WHERE fetched_at < ? AND instr(pnu, ':') > 0 AND substr(pnu, instr(pnu, ':') + 1) = ?
+        LIMIT ?
+    )
+"""
+LEDGER_STATS = """
+    SELECT
+        CASE WHEN instr(pnu, ':') = 0 THEN 'title' ELSE substr(pnu, instr(pnu, ':') + 1) END AS kind,
+        COUNT(*),
+        SUM(length(payload_json) + IFNULL(length(payload_blob), 0) + IFNULL(length(raw_blob), 0))
+    FROM ledger_cache
+    GROUP BY kind
+"""
+LEDGER_AGE_DAYS = """
+    SELECT CAST(julianday('now') - julianday(fetched_at) AS INTEGER) AS age_days, COUNT(*)
+    FROM ledger_cache
+    GROUP BY age_days
+"""
+LEDGER_REWRITE = """
+    UPDATE ledger_cache
+    SET payload_json = '', schema_version = ?, payload_blob = ?, raw_blob = ?
+    WHERE pnu = ?
+"""
+
+GEOCODE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS geocode_cache (
+        address_key TEXT PRIMARY KEY,
+        pnu TEXT NOT NULL,
+        road_address TEXT NOT NULL,
+        fetched_at TEXT NOT NULL,
+        lon REAL,
+        lat REAL
+    )
+"""
+GEOCODE_FETCHED_AT_INDEX = (
+    "CREATE INDEX IF NOT EXISTS geocode_cache_fetched_at ON geocode_cache (fetched_at)"
+)
+# Vworld points, added to geocode_cache files created before they were stored.
+GEOCODE_ADDED_COLUMNS = {
+    "lon": "ALTER TABLE geocode_cache ADD COLUMN lon REAL",
+    "lat": "ALTER TABLE geocode_cache ADD COLUMN lat REAL",
+}
+GEOCODE_SELECT = "SELECT pnu, road_address, fetched_at, lon, lat FROM geocode_cache WHERE address_key = ?"
+GEOCODE_SELECT_PAGE = """
+    SELECT address_key, pnu, road_address, fetched_at, lon, lat FROM geocode_cache
+    WHERE address_key > ?
+    ORDER BY address_key
+    LIMIT ?
+"""
+GEOCODE_COUNT = "SELECT COUNT(*) FROM geocode_cache"
+GEOCODE_UPSERT = """
+    INSERT INTO geocode_cache (address_key, pnu, road_address, fetched_at, lon, lat)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(address_key) DO UPDATE SET
+        pnu = excluded.pnu,
+        road_address = excluded.road_address,
+        fetched_at = excluded.fetched_at,
+        lon = excluded.lon,
+        lat = excluded.lat
+"""
+GEOCODE_RESTORE = """
+    INSERT INTO geocode_cache (address_key, pnu, road_address, fetched_at, lon, lat)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(address_key) DO UPDATE SET
+        pnu = excluded.pnu,
+        road_address = excluded.road_address,
+        fetched_at = excluded.fetched_at,
+        lon = excluded.lon,
+        lat = excluded.lat
+    WHERE excluded.fetched_at > geocode_cache.fetched_at
+"""
+GEOCODE_PURGE = """
+    DELETE FROM geocode_cache WHERE rowid IN (
+        SELECT rowid FROM geocode_cache WHERE fetched_at < ? LIMIT ?
+    )
+"""
+
+QUOTA_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS upstream_quota (
+        upstream TEXT NOT NULL,
+        day TEXT NOT NULL,
+        used INTEGER NOT NULL,
+        PRIMARY KEY (upstream, day)
+    )
+"""
+# Check and increment in one statement so concurrent workers cannot overshoot;
+# a limit of 0 means unlimited.
+QUOTA_RESERVE = """
+    INSERT INTO upstream_quota (upstream, day, used)
+    VALUES (?, ?, 1)
+    ON CONFLICT(upstream, day) DO UPDATE SET used = used + 1
+    WHERE ? <= 0 OR used < ?
+"""
+QUOTA_SELECT = "SELECT used FROM upstream_quota WHERE upstream = ? AND day = ?"
+
+
+class SqliteStore:
+    """One long-lived, WAL-mode connection per thread for a cache database.
+
+    SQL is kept in module constants so each connection's statement cache
+    reuses the prepared statements across calls.
+    """
+
+    name = "sqlite"
+    schema: tuple[str, ...] = ()
 
-class LedgerCache:
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self._init_db()
 
+    def stats(self) -> dict[str, int | float]:
+        return {"hits": self.hits, "misses": self.misses, "hit_ratio": _hit_ratio(self.hits, self.misses)}
+
+    def file_stats(self) -> dict[str, int]:
+        """Size of the database file and of the pages freed by deletes."""
+        conn = self._connect()
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        wal_path = self.db_path.with_name(self.db_path.name + "-wal")
+        return {
+            "file_bytes": page_size * page_count,
+            "free_bytes": page_size * free_pages,
+            "wal_bytes": wal_path.stat().st_size if wal_path.exists() else 0,
+        }
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def vacuum(self) -> None:
+        """Rebuild the database file to return freed pages to the filesystem."""
+        conn = self._connect()
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.execute("VACUUM")
+
+    def incremental_vacuum(self, pages: int = 0) -> int:
+        """Return up to ``pages`` free pages (0 = all) to the filesystem; returns pages freed.
+
+        Files created before auto_vacuum was enabled are switched over with
+        one full VACUUM, after which later calls are incremental.
+        """
+        conn = self._connect()
+        free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != AUTO_VACUUM_INCREMENTAL:
+            self.vacuum()
+        else:
+            conn.execute(f"PRAGMA incremental_vacuum({int(pages)})").fetchall()
+        return free_before - conn.execute("PRAGMA freelist_count").fetchone()[0]
+
     def _connect(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread is off only so close() can run from any thread;
+            # each connection is otherwise used by the thread that opened it.
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                cached_statements=STATEMENT_CACHE_SIZE,
+            )
+            for pragma in PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
 
     def _init_db(self) -> None:
         with self._connect() as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS ledger_cache (
-                    pnu TEXT PRIMARY KEY,
-                    payload_json TEXT NOT NULL,
-                    fetched_at TEXT NOT NULL
-                )
-                """
-            )
-            conn.commit()
+            for statement in self.schema:
+                conn.execute(statement)
+
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        CACHE_REQUESTS.inc(self.name, "hit" if hit else "miss")
+
+    def _delete_in_batches(self, statement: str, params: tuple, batch_size: int) -> int:
+        """Run a ``... LIMIT ?`` delete repeatedly, one short transaction per batch."""
+        deleted = 0
+        conn = self._connect()
+        while True:
+            with conn:
+                count = conn.execute(statement, (*params, batch_size)).rowcount
+            deleted += count
+            if count < batch_size:
+                return deleted
+
+
+class LedgerCache(ABC):
+    """Key -> lookup payload store behind ``LedgerLookupService``.
+
+    Keys are PNUs for title results and ``<pnu>:<section>`` for sections.
+    ``SqliteLedgerCache`` keeps a local file per host; ``RedisLedgerCache``
+    (``redis_cache.py``) is shared by every host pointing at the same server.
+    """
+
+    name = "ledger"
 
-    def get(self, pnu: str, ttl_days: int) -> dict | None:
+    def get(self, key: str, ttl_days: int, include_raw: bool = False) -> dict | None:
+        entry = self.get_entry(key, ttl_days, include_raw)
+        return entry[0] if entry else None
+
+    @abstractmethod
+    def get_entry(
+        self,
+        key: str,
+        ttl_days: int,
+        include_raw: bool = False,
+    ) -> tuple[dict, datetime] | None:
+        """Return the payload together with its ``fetched_at`` timestamp."""
+
+    def get_entries(
+        self,
+        keys: list[str],
+        ttl_days: int,
+        include_raw: bool = False,
+    ) -> dict[str, tuple[dict, datetime]]:
+        """Fresh entries for many keys at once; missing or expired keys are left out."""
+        entries = {}
+        for key in keys:
+            entry = self.get_entry(key, ttl_days, include_raw)
+            if entry:
+                entries[key] = entry
+        return entries
+
+    @abstractmethod
+    def expiring(self, fetched_before: datetime, limit: int) -> list[tuple[str, dict]]:
+        """Oldest title entries fetched before ``fetched_before``, for proactive refresh."""
+
+    def set(self, key: str, payload: dict) -> None:
+        self.set_many([(key, payload)])
+
+    @abstractmethod
+    def set_many(self, entries: list[tuple[str, dict]]) -> None:
+        """Upsert many payloads, stamped with the current time."""
+
+    @abstractmethod
+    def stats(self) -> dict[str, int | float]: ...
+
+    @abstractmethod
+    def close(self) -> None: ...
+
+
+class SqliteLedgerCache(SqliteStore, LedgerCache):
+    name = "ledger"
+    schema = (LEDGER_SCHEMA, LEDGER_FETCHED_AT_INDEX)
+
+    def _init_db(self) -> None:
+        super()._init_db()
         with self._connect() as conn:
-            row = conn.execute(
-                "SELECT payload_json, fetched_at FROM ledger_cache WHERE pnu = ?",
-                (pnu,),
-            ).fetchone()
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(ledger_cache)")}
+            for column, statement in LEDGER_ADDED_COLUMNS.items():
+                if column not in existing:
+                    conn.execute(statement)
 
-        if not row:
-            return None
+    def get_entry(
+        self,
+        key: str,
+        ttl_days: int,
+        include_raw: bool = False,
+    ) -> tuple[dict, datetime] | None:
+        """Return the payload together with its ``fetched_at`` timestamp.
 
-        payload_json, fetched_at = row
-        fetched_dt = datetime.fromisoformat(fetched_at)
-        now = datetime.now(timezone.utc)
-        if fetched_dt.tzinfo is None:
-            fetched_dt = fetched_dt.replace(tzinfo=timezone.utc)
+        ``raw_item`` is only decompressed when ``include_raw`` is set.
+        """
+        statement = LEDGER_SELECT_WITH_RAW if include_raw else LEDGER_SELECT
+        with CACHE_LATENCY.time(self.name, "get"):
+            row = self._connect().execute(statement, (key,)).fetchone()
 
-        if fetched_dt + timedelta(days=ttl_days) < now:
-            return None
+            if not row or _is_expired(row[3], ttl_days):
+                self._record(hit=False)
+                return None
+
+            self._record(hit=True)
+            payload = _decode_payload(*row[:3])
+            if row[0] >= 2 and include_raw and row[4] is not None:
+                payload["raw_item"] = _inflate(row[4])
+            elif not include_raw:
+                payload.pop("raw_item", None)
+            return payload, _parse_timestamp(row[3])
+
+    def migrate_legacy_rows(self, batch_size: int = 1000) -> int:
+        """Rewrite schema-version-1 rows in the compressed format; returns rows migrated."""
+        migrated = 0
+        conn = self._connect()
+        while True:
+            rows = conn.execute(LEDGER_SELECT_LEGACY, (SCHEMA_VERSION, batch_size)).fetchall()
+            if not rows:
+                return migrated
+            rewritten = [
+                (SCHEMA_VERSION, *encode_payload(json.loads(payload_json)), pnu)
+                for pnu, payload_json in rows
+            ]
+            with conn:
+                conn.executemany(LEDGER_REWRITE, rewritten)
+            migrated += len(rows)
+
+    def expiring(self, fetched_before: datetime, limit: int) -> list[tuple[str, dict]]:
+        """Oldest title entries fetched before ``fetched_before``, for proactive refresh.
+
+        Section entries (``<pnu>:<section>`` keys) are refreshed on demand only.
+        """
+        cutoff = fetched_before.astimezone(timezone.utc).isoformat()
+        rows = self._connect().execute(LEDGER_SELECT_EXPIRING, (cutoff, limit)).fetchall()
+        return [(row[0], _decode_payload(*row[1:])) for row in rows]
+
+    def purge(self, fetched_before: datetime, section: str | None = None, batch_size: int = 1000) -> int:
+        """Delete title entries (or one section's entries) fetched before the cutoff."""
+        cutoff = fetched_before.astimezone(timezone.utc).isoformat()
+        if section is None:
+            return self._delete_in_batches(LEDGER_PURGE_TITLES, (cutoff,), batch_size)
+        return self._delete_in_batches(LEDGER_PURGE_SECTION, (cutoff, section), batch_size)
 
-        return json.loads(payload_json)
+    def storage_stats(self) -> dict:
+        """Row count and stored bytes per key kind, plus an age histogram."""
+        conn = self._connect()
+        kinds = {
+            kind: {"rows": rows, "payload_bytes": payload_bytes or 0}
+            for kind, rows, payload_bytes in conn.execute(LEDGER_STATS)
+        }
+        histogram = {_age_bucket(days): 0 for days in (0, *AGE_BUCKETS_DAYS)}
+        for age_days, rows in conn.execute(LEDGER_AGE_DAYS):
+            histogram[_age_bucket(age_days)] += rows
+        return {
+            "rows": sum(kind["rows"] for kind in kinds.values()),
+            "kinds": kinds,
+            "age_days": histogram,
+            **self.file_stats(),
+        }
 
-    def set(self, pnu: str, payload: dict) -> None:
+    def iter_entries(self, batch_size: int = 1000) -> Iterator[tuple[str, dict, str]]:
+        """Every entry as ``(key, payload including raw_item, fetched_at)``, in key order."""
+        conn = self._connect()
+        last_key = ""
+        while True:
+            rows = conn.execute(LEDGER_SELECT_PAGE, (last_key, batch_size)).fetchall()
+            for key, schema_version, payload_json, payload_blob, raw_blob, fetched_at in rows:
+                payload = _decode_payload(schema_version, payload_json, payload_blob)
+                if schema_version >= 2 and raw_blob is not None:
+                    payload["raw_item"] = _inflate(raw_blob)
+                yield key, payload, fetched_at
+            if len(rows) < batch_size:
+                return
+            last_key = rows[-1][0]
+
+    def restore_many(self, entries: list[tuple[str, dict, str]]) -> int:
+        """Load exported entries, keeping their ``fetched_at``; returns rows written.
+
+        Entries older than the local row for the same key are skipped.
+        """
+        rows = [
+            (key, fetched_at, SCHEMA_VERSION, *encode_payload(payload))
+            for key, payload, fetched_at in entries
+        ]
+        with self._connect() as conn:
+            return conn.executemany(LEDGER_RESTORE, rows).rowcount
+
+    def set_many(self, entries: list[tuple[str, dict]]) -> None:
+        """Upsert many payloads in a single transaction."""
         now_iso = datetime.now(timezone.utc).isoformat()
+        with CACHE_LATENCY.time(self.name, "set"):
+            rows = [(pnu, now_iso, SCHEMA_VERSION, *encode_payload(payload)) for pnu, payload in entries]
+            with self._connect() as conn:
+                conn.executemany(LEDGER_UPSERT, rows)
+
+
+class GeocodeCache(SqliteStore):
+    """Normalized address -> PNU/road address, stored next to ``ledger_cache``."""
+
+    name = "geocode"
+    schema = (GEOCODE_SCHEMA, GEOCODE_FETCHED_AT_INDEX)
+
+    def _init_db(self) -> None:
+        super()._init_db()
         with self._connect() as conn:
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(geocode_cache)")}
+            for column, statement in GEOCODE_ADDED_COLUMNS.items():
+                if column not in existing:
+                    conn.execute(statement)
+
+    def get(self, address_key: str, ttl_days: int) -> dict | None:
+        with CACHE_LATENCY.time(self.name, "get"):
+            row = self._connect().execute(GEOCODE_SELECT, (address_key,)).fetchone()
+
+        if not row or _is_expired(row[2], ttl_days):
+            self._record(hit=False)
+            return None
+
+        self._record(hit=True)
+        return {"pnu": row[0], "road_address": row[1], "lon": row[3], "lat": row[4]}
+
+    def set(self, address_key: str, payload: dict) -> None:
+        now_iso = datetime.now(timezone.utc).isoformat()
+        with CACHE_LATENCY.time(self.name, "set"), self._connect() as conn:
             conn.execute(
-                """
-                INSERT INTO ledger_cache (pnu, payload_json, fetched_at)
-                VALUES (?, ?, ?)
-                ON CONFLICT(pnu) DO UPDATE SET
-                    payload_json = excluded.payload_json,
-                    fetched_at = excluded.fetched_at
-                """,
-                (pnu, json.dumps(payload, ensure_ascii=False), now_iso),
+                GEOCODE_UPSERT,
+                (
+                    address_key,
+                    payload["pnu"],
+                    payload["road_address"],
+                    now_iso,
+                    payload.get("lon"),
+                    payload.get("lat"),
+                ),
+            )
+
+    def purge(self, fetched_before: datetime, batch_size: int = 1000) -> int:
+        cutoff = fetched_before.astimezone(timezone.utc).isoformat()
+        return self._delete_in_batches(GEOCODE_PURGE, (cutoff,), batch_size)
+
+    def count(self) -> int:
+        return self._connect().execute(GEOCODE_COUNT).fetchone()[0]
+
+    def iter_entries(self, batch_size: int = 1000) -> Iterator[tuple[str, dict, str]]:
+        conn = self._connect()
+        last_key = ""
+        while True:
+            rows = conn.execute(GEOCODE_SELECT_PAGE, (last_key, batch_size)).fetchall()
+            for address_key, pnu, road_address, fetched_at, lon, lat in rows:
+                payload = {"pnu": pnu, "road_address": road_address, "lon": lon, "lat": lat}
+                yield address_key, payload, fetched_at
+            if len(rows) < batch_size:
+                return
+            last_key = rows[-1][0]
+
+    def restore_many(self, entries: list[tuple[str, dict, str]]) -> int:
+        rows = [
+            (
+                address_key,
+                payload["pnu"],
+                payload["road_address"],
+                fetched_at,
+                payload.get("lon"),
+                payload.get("lat"),
             )
-            conn.commit()
+            for address_key, payload, fetched_at in entries
+        ]
+        with self._connect() as conn:
+            return conn.executemany(GEOCODE_RESTORE, rows).rowcount
+
+
+class QuotaStore(SqliteStore):
+    """Daily upstream call counters, shared by every worker using the cache file."""
+
+    name = "quota"
+    schema = (QUOTA_SCHEMA,)
+
+    def reserve(self, upstream: str, day: str, limit: int) -> bool:
+        """Count one call unless ``limit`` calls were already made today."""
+        with self._connect() as conn:
+            return conn.execute(QUOTA_RESERVE, (upstream, day, limit, limit)).rowcount > 0
+
+    def used(self, upstream: str, day: str) -> int:
+        row = self._connect().execute(QUOTA_SELECT, (upstream, day)).fetchone()
+        return row[0] if row else 0
+
+
+def open_ledger_cache(settings: Settings) -> LedgerCache:
+    """The ``LedgerCache`` backend selected by ``CACHE_BACKEND``."""
+    if settings.cache_backend == "sqlite":
+        return SqliteLedgerCache(settings.cache_db_path)
+    if settings.cache_backend == "redis":
+        from .redis_cache import RedisLedgerCache
+
+        # Entries expire on the server once nothing can serve them any more.
+        max_age_days = max(
+            settings.cache_ttl_days + settings.stale_max_days,
+            settings.recap_title_ttl_days,
+            settings.floor_ttl_days,
+            settings.expos_area_ttl_days,
+        )
+        return RedisLedgerCache(
+            settings.redis_url,
+            key_prefix=settings.redis_key_prefix,
+            expire_seconds=max_age_days * 86400,
+            timeout=settings.redis_timeout_seconds,
+            retry_after=settings.redis_retry_after_seconds,
+        )
+    raise ValueError(f"Unknown CACHE_BACKEND: {settings.cache_backend} (allowed: sqlite, redis)")
+
+
+class MemoryCache:
+    """Bounded LRU of already-parsed payloads with a per-entry expiry.
+
+    Sits in front of ``LedgerCache`` so hot PNUs skip both the SQLite read and
+    the JSON/timestamp parsing. ``max_entries <= 0`` disables the tier.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": _hit_ratio(self.hits, self.misses),
+            "size": len(self._entries),
+        }
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                CACHE_REQUESTS.inc("memory", "miss")
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        CACHE_REQUESTS.inc("memory", "hit")
+        return dict(entry[1])
+
+    def set(self, key: str, payload: dict, expires_at: datetime) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (expires_at.timestamp(), payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+def encode_payload(payload: dict) -> tuple[bytes, bytes | None]:
+    """Split off ``raw_item`` and compress both parts (schema version 2)."""
+    body = dict(payload)
+    raw_item = body.pop("raw_item", None)
+    raw_blob = _deflate(raw_item) if raw_item is not None else None
+    return _deflate(body), raw_blob
+
+
+def _decode_payload(schema_version: int, payload_json: str, payload_blob: bytes | None) -> dict:
+    if schema_version >= 2:
+        return _inflate(payload_blob)
+    return json.loads(payload_json)
+
+
+def _deflate(value: object) -> bytes:
+    text = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return zlib.compress(text.encode("utf-8"), COMPRESSION_LEVEL)
+
+
+def _inflate(blob: bytes) -> dict:
+    return json.loads(zlib.decompress(blob))
+
+
+def _hit_ratio(hits: int, misses: int) -> float:
+    total = hits + misses
+    return round(hits / total, 4) if total else 0.0
+
+
+def _age_bucket(age_days: int | None) -> str:
+    previous = 0
+    for bound in AGE_BUCKETS_DAYS:
+        if age_days is not None and age_days < bound:
+            return f"{previous}-{bound}"
+        previous = bound
+    return f"{previous}+"
+
+
+def _parse_timestamp(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _is_expired(fetched_at: str, ttl_days: int) -> bool:
+    return _parse_timestamp(fetched_at) + timedelta(days=ttl_days) < datetime.now(timezone.utc)
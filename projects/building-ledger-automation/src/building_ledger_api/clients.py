@@ -1,25 +1,77 @@
 from __future__ import annotations
 
-import time
-from typing import Any
+import asyncio
+import random
+import re
+import unicodedata
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
 from urllib.parse import unquote
 
-import requests
-
+from .breaker import CircuitBreaker
 from .config import Settings
+from .metrics import UPSTREAM_ERRORS, UPSTREAM_LATENCY, UPSTREAM_RETRIES
+from .transport import AsyncHttpEngine
+
+if TYPE_CHECKING:
+    from .ratelimit import UpstreamLimiter
 
 
 class RequestError(RuntimeError):
-    """Raised when external API request fails after retries."""
+    """Raised when external API request fails after retries.
+
+    ``cause`` is a short, metric-friendly reason such as ``"timeout"`` or
+    ``"not_found"``.
+    """
+
+    def __init__(self, message: str, cause: str = "upstream_error") -> None:
+        super().__init__(message)
+        self.cause = cause
+
+
+class QuotaExceededError(RequestError):
+    """Raised before calling upstream when its daily quota is used up."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message, cause="quota_exceeded")
+        self.retry_after = retry_after
+
+
+class UpstreamThrottledError(RequestError):
+    """Raised when upstream asks us (429/503) to wait longer than ``max_backoff``."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message, cause="upstream_throttled")
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(RequestError):
+    """Raised without calling upstream while its circuit breaker is open."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message, cause="circuit_open")
+        self.retry_after = retry_after
 
 
 class VworldClient:
+    NAME = "vworld"
     BASE_URL = "https://api.vworld.kr/req/address"
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        engine: AsyncHttpEngine,
+        limiter: UpstreamLimiter | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
         self.settings = settings
+        self.engine = engine
+        self.limiter = limiter
+        self.breaker = breaker or CircuitBreaker(self.NAME, failure_threshold=0, reset_seconds=0)
+        self.base_url = settings.vworld_base_url or self.BASE_URL
 
-    def geocode_address(self, address: str) -> dict[str, Any]:
+    async def geocode_address(self, address: str) -> dict[str, Any]:
         params = {
             "service": "address",
             "request": "getcoord",
@@ -32,41 +84,126 @@ class VworldClient:
             "type": "parcel",
             "key": self.settings.vworld_api_key,
         }
-        payload = _request_json_with_retry(
-            url=self.BASE_URL,
+        payload = await _request_json_with_retry(
+            self.engine,
+            url=self.base_url,
             params=params,
             timeout=self.settings.request_timeout_seconds,
             retries=self.settings.retry_count,
             backoff=self.settings.retry_backoff_seconds,
-            name="vworld",
+            max_backoff=self.settings.retry_max_backoff_seconds,
+            limiter=self.limiter,
+            breaker=self.breaker,
+            name=self.NAME,
         )
 
         status = payload.get("response", {}).get("status")
         if status != "OK":
-            raise RequestError(f"Vworld status not OK: {status}")
+            raise RequestError(f"Vworld status not OK: {status}", cause="vworld_status")
 
         pnu = extract_pnu(payload)
         if len(pnu) < 19:
-            raise RequestError(f"Invalid PNU extracted: {pnu}")
+            raise RequestError(f"Invalid PNU extracted: {pnu}", cause="invalid_response")
 
         result = payload.get("response", {}).get("result", {})
         refined = payload.get("response", {}).get("refined", {})
         road_address = refined.get("text") or result.get("text") or address
 
+        point = result.get("point") or {}
+
         return {
             "pnu": pnu,
             "road_address": road_address,
+            "lon": _to_coordinate(point.get("x")),
+            "lat": _to_coordinate(point.get("y")),
             "raw": payload,
         }
 
 
 class BuildingHubClient:
-    BASE_URL = "https://apis.data.go.kr/1613000/BldRgstHubService/getBrTitleInfo"
+    NAME = "building_hub"
+    SERVICE_URL = "https://apis.data.go.kr/1613000/BldRgstHubService"
+    TITLE_OPERATION = "getBrTitleInfo"
+    # Optional sections served by the same BldRgstHubService, keyed by the
+    # name clients pass in ``include=``.
+    SECTION_OPERATIONS = {
+        "recap_title": "getBrRecapTitleInfo",
+        "floor": "getBrFlrOulnInfo",
+        "expos_area": "getBrExposPubuseAreaInfo",
+    }
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        engine: AsyncHttpEngine,
+        limiter: UpstreamLimiter | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
         self.settings = settings
+        self.engine = engine
+        self.limiter = limiter
+        self.breaker = breaker or CircuitBreaker(self.NAME, failure_threshold=0, reset_seconds=0)
+        self.service_url = settings.building_hub_base_url or self.SERVICE_URL
+
+    async def get_title_info(self, codes: dict[str, str]) -> dict[str, Any]:
+        payload = await self._fetch_page(codes, page_no=1, num_rows=1)
+        items = _body_items(payload)
+        if not items:
+            raise RequestError("Building HUB returned no item", cause="not_found")
+
+        return {
+            "item": items[0],
+            "raw": payload,
+        }
+
+    async def get_title_items(self, codes: dict[str, str]) -> dict[str, Any]:
+        """Fetch every title item (building) on the parcel."""
+        fetched = await self.get_operation_items(self.TITLE_OPERATION, codes)
+        if not fetched["items"]:
+            raise RequestError("Building HUB returned no item", cause="not_found")
+        return fetched
+
+    async def get_section_items(self, section: str, codes: dict[str, str]) -> dict[str, Any]:
+        operation = self.SECTION_OPERATIONS.get(section)
+        if operation is None:
+            raise ValueError(f"Unknown Building HUB section: {section}")
+        return await self.get_operation_items(operation, codes)
+
+    async def get_operation_items(self, operation: str, codes: dict[str, str]) -> dict[str, Any]:
+        """Fetch every item of one BldRgstHubService operation for the parcel.
+
+        The first page reports ``totalCount``; any remaining pages are then
+        requested concurrently with ``building_hub_page_size`` rows each.
+        """
+        page_size = self.settings.building_hub_page_size
+        first = await self._fetch_page(codes, page_no=1, num_rows=page_size, operation=operation)
+        items = _body_items(first)
+        if not items:
+            return {"items": [], "total_count": 0}
+
+        total_count = _to_int(first.get("response", {}).get("body", {}).get("totalCount"))
+        page_count = -(-max(total_count, len(items)) // page_size)
+        rest = await asyncio.gather(
+            *(
+                self._fetch_page(codes, page_no=page, num_rows=page_size, operation=operation)
+                for page in range(2, page_count + 1)
+            )
+        )
+        for payload in rest:
+            items.extend(_body_items(payload))
+
+        return {
+            "items": items,
+            "total_count": total_count or len(items),
+        }
 
-    def get_title_info(self, codes: dict[str, str]) -> dict[str, Any]:
+    async def _fetch_page(
+        self,
+        codes: dict[str, str],
+        page_no: int,
+        num_rows: int,
+        operation: str = TITLE_OPERATION,
+    ) -> dict[str, Any]:
         service_key = normalize_service_key(self.settings.data_go_kr_service_key)
         params = {
             "serviceKey": service_key,
@@ -75,35 +212,24 @@ class BuildingHubClient:
             "plat_code": codes["plat_code"],
             "bun": codes["bun"],
             "ji": codes["ji"],
-            "numOfRows": "1",
-            "pageNo": "1",
+            "numOfRows": str(num_rows),
+            "pageNo": str(page_no),
             "_type": "json",
         }
 
-        payload = _request_json_with_retry(
-            url=self.BASE_URL,
+        return await _request_json_with_retry(
+            self.engine,
+            url=f"{self.service_url}/{operation}",
             params=params,
             timeout=self.settings.request_timeout_seconds,
             retries=self.settings.retry_count,
             backoff=self.settings.retry_backoff_seconds,
-            name="building_hub",
+            max_backoff=self.settings.retry_max_backoff_seconds,
+            limiter=self.limiter,
+            breaker=self.breaker,
+            name=self.NAME,
         )
 
-        body = payload.get("response", {}).get("body", {})
-        items = body.get("items", {}).get("item")
-        if not items:
-            raise RequestError("Building HUB returned no item")
-
-        if isinstance(items, list):
-            item = items[0]
-        else:
-            item = items
-
-        return {
-            "item": item,
-            "raw": payload,
-        }
-
 
 def normalize_service_key(service_key: str) -> str:
     cleaned = service_key.strip()
@@ -146,7 +272,20 @@ def extract_pnu(payload: dict[str, Any]) -> str:
     if fallback and len(str(fallback)) >= 19:
         return str(fallback)
 
-    raise RequestError("Unable to extract PNU from Vworld response")
+    raise RequestError("Unable to extract PNU from Vworld response", cause="invalid_response")
+
+
+def normalize_address(address: str) -> str:
+    """Canonical jibun address used as the geocode cache key.
+
+    ``"불당동  산 12 - 3번지"`` and ``"불당동 산12-3"`` map to the same key.
+    """
+    normalized = unicodedata.normalize("NFKC", address).strip()
+    normalized = re.sub(r"\s+", " ", normalized)
+    normalized = re.sub(r"\s*-\s*", "-", normalized)
+    normalized = re.sub(r"(^|\s)산\s+(?=\d)", r"\1산", normalized)
+    normalized = re.sub(r"(\d)\s*번지", r"\1", normalized)
+    return normalized
 
 
 def split_pnu(pnu: str) -> dict[str, str]:
@@ -170,26 +309,128 @@ def split_pnu(pnu: str) -> dict[str, str]:
     }
 
 
-def _request_json_with_retry(
+def _to_coordinate(value: Any) -> float | None:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _body_items(payload: dict[str, Any]) -> list[dict[str, Any]]:
+    body = payload.get("response", {}).get("body", {})
+    items = (body.get("items") or {}).get("item")
+    if not items:
+        return []
+    return list(items) if isinstance(items, list) else [items]
+
+
+def _to_int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def pnu_from_title_item(item: dict[str, Any]) -> str:
+    """Rebuild the 19-digit PNU from a title item (inverse of ``split_pnu``)."""
+    if not str(item.get("sigunguCd") or "").strip() or not str(item.get("bjdongCd") or "").strip():
+        raise ValueError("Title item has no sigunguCd/bjdongCd")
+
+    plat_gb = str(item.get("platGbCd") or "0").strip()
+    pnu = (
+        f"{str(item.get('sigunguCd', '')).strip():0>5}"
+        f"{str(item.get('bjdongCd', '')).strip():0>5}"
+        f"{'2' if plat_gb == '1' else '1'}"
+        f"{str(item.get('bun', '')).strip():0>4}"
+        f"{str(item.get('ji', '')).strip():0>4}"
+    )
+    if len(pnu) != 19 or not pnu.isdigit():
+        raise ValueError(f"Cannot build PNU from title item: {pnu}")
+    return pnu
+
+
+async def _request_json_with_retry(
+    engine: AsyncHttpEngine,
     *,
     url: str,
     params: dict[str, Any],
     timeout: float,
     retries: int,
     backoff: float,
+    max_backoff: float,
+    limiter: UpstreamLimiter | None,
+    breaker: CircuitBreaker,
     name: str,
 ) -> dict[str, Any]:
     last_error: Exception | None = None
 
     for attempt in range(1, retries + 1):
+        if not breaker.allow():
+            UPSTREAM_ERRORS.inc(name, "circuit_open")
+            raise CircuitOpenError(f"{name} circuit is open", retry_after=breaker.retry_after())
         try:
-            response = requests.get(url, params=params, timeout=timeout)
-            response.raise_for_status()
-            return response.json()
-        except Exception as exc:  # requests/json errors are all operational failures here
+            if limiter is not None:
+                await limiter.acquire()
+            with UPSTREAM_LATENCY.time(name):
+                payload = await engine.get_json(url, params, timeout)
+        except QuotaExceededError:
+            breaker.release()
+            UPSTREAM_ERRORS.inc(name, "quota_exceeded")
+            raise
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        except Exception as exc:  # httpx/json errors are all operational failures here
+            breaker.record_failure()
             last_error = exc
+            UPSTREAM_ERRORS.inc(name, _error_cause(exc))
             if attempt == retries:
                 break
-            time.sleep(backoff * attempt)
+            retry_after = _retry_after_seconds(exc)
+            if retry_after > max_backoff:
+                raise UpstreamThrottledError(
+                    f"{name} asked to retry after {retry_after:.0f}s",
+                    retry_after=retry_after,
+                ) from exc
+            # Full-jitter exponential backoff, but never sooner than Retry-After.
+            delay = random.uniform(0, min(max_backoff, backoff * 2 ** (attempt - 1)))
+            UPSTREAM_RETRIES.inc(name)
+            await asyncio.sleep(max(delay, retry_after))
+        else:
+            breaker.record_success()
+            return payload
+
+    raise RequestError(
+        f"{name} request failed after {retries} attempts: {last_error}",
+        cause=_error_cause(last_error) if last_error else "upstream_error",
+    )
+
 
-    raise RequestError(f"{name} request failed after {retries} attempts: {last_error}")
+def _error_cause(exc: Exception) -> str:
+    import httpx  # already loaded by the engine that raised exc
+
+    if isinstance(exc, httpx.TimeoutException):
+        return "timeout"
+    if isinstance(exc, httpx.HTTPStatusError):
+        return f"http_{exc.response.status_code // 100}xx"
+    if isinstance(exc, httpx.TransportError):
+        return "network"
+    if isinstance(exc, ValueError):  # response body was not JSON
+        return "invalid_response"
+    return "upstream_error"
+
+
+def _retry_after_seconds(exc: Exception) -> float:
+    response = getattr(exc, "response", None)
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -16,9 +16,46 @@ class Settings:
     cache_db_path: Path
     cache_ttl_days: int
     api_token: str | None
+    retry_max_backoff_seconds: float = 30.0
+    vworld_rate_per_second: float = 10.0
+    vworld_daily_quota: int = 0
+    building_hub_rate_per_second: float = 10.0
+    building_hub_daily_quota: int = 0
+    breaker_failure_threshold: int = 5
+    breaker_reset_seconds: float = 30.0
+    fetch_all_buildings: bool = False
+    building_hub_page_size: int = 100
+    recap_title_ttl_days: int = 30
+    floor_ttl_days: int = 90
+    expos_area_ttl_days: int = 90
+    http_pool_size: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+    geocode_cache_ttl_days: int = 180
+    memory_cache_max_entries: int = 2048
+    stale_while_revalidate: bool = False
+    stale_max_days: int = 30
+    refresh_offpeak_hours: str = ""
+    refresh_ahead_days: int = 3
+    refresh_batch_size: int = 200
+    refresh_interval_seconds: float = 600.0
+    batch_max_items: int = 500
+    batch_concurrency: int = 8
+    # Empty means the real endpoint; point these at scripts/fake_upstream.py for load tests.
+    vworld_base_url: str = ""
+    building_hub_base_url: str = ""
+    cache_backend: str = "sqlite"
+    redis_url: str = "redis://localhost:6379/0"
+    redis_key_prefix: str = "building_ledger:"
+    redis_timeout_seconds: float = 2.0
+    redis_retry_after_seconds: float = 30.0
 
     @classmethod
-    def load(cls) -> "Settings":
+    def load(cls, require_keys: bool = True) -> "Settings":
+        """Settings from the environment (and ``.env``).
+
+        Offline cache tools pass ``require_keys=False``; they only need paths
+        and TTLs, so missing API keys are left empty instead of rejected.
+        """
         # Load .env from project root (projects/building-ledger-automation/.env)
         project_root = Path(__file__).resolve().parents[2]
         env_path = project_root / ".env"
@@ -28,13 +65,20 @@ class Settings:
         vworld_api_key = os.getenv("VWORLD_API_KEY", "").strip()
         data_go_kr_service_key = os.getenv("DATA_GO_KR_SERVICE_KEY", "").strip()
 
-        if not vworld_api_key:
+        if require_keys and not vworld_api_key:
             raise ValueError("VWORLD_API_KEY is required")
-        if not data_go_kr_service_key:
+        if require_keys and not data_go_kr_service_key:
             raise ValueError("DATA_GO_KR_SERVICE_KEY is required")
 
         cache_db = os.getenv("CACHE_DB_PATH", "data/cache/ledger_cache.sqlite3").strip()
 
+        cache_ttl_days = int(os.getenv("CACHE_TTL_DAYS", "30"))
+        refresh_offpeak_hours = os.getenv("REFRESH_OFFPEAK_HOURS", "").strip()
+        refresh_ahead_days = int(os.getenv("REFRESH_AHEAD_DAYS", "3"))
+        # Otherwise every entry counts as expiring and is refreshed on every tick.
+        if refresh_offpeak_hours and not 0 <= refresh_ahead_days < cache_ttl_days:
+            raise ValueError("REFRESH_AHEAD_DAYS must be at least 0 and less than CACHE_TTL_DAYS")
+
         return cls(
             vworld_api_key=vworld_api_key,
             data_go_kr_service_key=data_go_kr_service_key,
@@ -42,6 +86,41 @@ class Settings:
             retry_count=int(os.getenv("RETRY_COUNT", "3")),
             retry_backoff_seconds=float(os.getenv("RETRY_BACKOFF_SECONDS", "1.5")),
             cache_db_path=project_root / cache_db,
-            cache_ttl_days=int(os.getenv("CACHE_TTL_DAYS", "30")),
+            cache_ttl_days=cache_ttl_days,
             api_token=os.getenv("LEDGER_API_TOKEN", "").strip() or None,
+            retry_max_backoff_seconds=float(os.getenv("RETRY_MAX_BACKOFF_SECONDS", "30")),
+            vworld_rate_per_second=float(os.getenv("VWORLD_RATE_PER_SECOND", "10")),
+            vworld_daily_quota=int(os.getenv("VWORLD_DAILY_QUOTA", "0")),
+            building_hub_rate_per_second=float(os.getenv("BUILDING_HUB_RATE_PER_SECOND", "10")),
+            building_hub_daily_quota=int(os.getenv("BUILDING_HUB_DAILY_QUOTA", "0")),
+            breaker_failure_threshold=int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5")),
+            breaker_reset_seconds=float(os.getenv("BREAKER_RESET_SECONDS", "30")),
+            fetch_all_buildings=_env_flag("FETCH_ALL_BUILDINGS"),
+            building_hub_page_size=int(os.getenv("BUILDING_HUB_PAGE_SIZE", "100")),
+            recap_title_ttl_days=int(os.getenv("RECAP_TITLE_TTL_DAYS", "30")),
+            floor_ttl_days=int(os.getenv("FLOOR_TTL_DAYS", "90")),
+            expos_area_ttl_days=int(os.getenv("EXPOS_AREA_TTL_DAYS", "90")),
+            http_pool_size=int(os.getenv("HTTP_POOL_SIZE", "20")),
+            http_keepalive_expiry_seconds=float(os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", "30")),
+            geocode_cache_ttl_days=int(os.getenv("GEOCODE_CACHE_TTL_DAYS", "180")),
+            memory_cache_max_entries=int(os.getenv("MEMORY_CACHE_MAX_ENTRIES", "2048")),
+            stale_while_revalidate=_env_flag("STALE_WHILE_REVALIDATE"),
+            stale_max_days=int(os.getenv("STALE_MAX_DAYS", "30")),
+            refresh_offpeak_hours=refresh_offpeak_hours,
+            refresh_ahead_days=refresh_ahead_days,
+            refresh_batch_size=int(os.getenv("REFRESH_BATCH_SIZE", "200")),
+            refresh_interval_seconds=float(os.getenv("REFRESH_INTERVAL_SECONDS", "600")),
+            batch_max_items=int(os.getenv("BATCH_MAX_ITEMS", "500")),
+            batch_concurrency=int(os.getenv("BATCH_CONCURRENCY", "8")),
+            vworld_base_url=os.getenv("VWORLD_BASE_URL", "").strip().rstrip("/"),
+            building_hub_base_url=os.getenv("BUILDING_HUB_BASE_URL", "").strip().rstrip("/"),
+            cache_backend=os.getenv("CACHE_BACKEND", "sqlite").strip().lower(),
+            redis_url=os.getenv("REDIS_URL", "redis://localhost:6379/0").strip(),
+            redis_key_prefix=os.getenv("REDIS_KEY_PREFIX", "building_ledger:"),
+            redis_timeout_seconds=float(os.getenv("REDIS_TIMEOUT_SECONDS", "2")),
+            redis_retry_after_seconds=float(os.getenv("REDIS_RETRY_AFTER_SECONDS", "30")),
         )
+
+
+def _env_flag(name: str, default: str = "false") -> bool:
+    return os.getenv(name, default).strip().lower() in {"1", "true", "yes", "on"}
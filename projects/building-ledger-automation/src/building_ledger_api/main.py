@@ -1,43 +1,195 @@
 from __future__ import annotations
 
-from fastapi import FastAPI, Header, HTTPException
+import asyncio
+import json
+import logging
+import time
+from typing import Any, AsyncIterator
 
-from .clients import RequestError
+from fastapi import FastAPI, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+from . import IMPORT_STARTED
+from .clients import CircuitOpenError, QuotaExceededError, RequestError, UpstreamThrottledError
 from .config import Settings
-from .models import LookupRequest, LookupResponse
-from .service import LedgerLookupService
+from .metrics import STARTUP_SECONDS, render_metrics
+from .models import BatchLookupRequest, LookupRequest, LookupResponse, ParcelListResponse
+from .refresh import RefreshScheduler
+from .service import LedgerLookupService, validate_sections
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(title="Building Ledger API", version="0.1.0")
 
 
 @app.on_event("startup")
-def on_startup() -> None:
-    settings = Settings.load()
+async def on_startup() -> None:
+    # Package import up to here, including uvicorn's own setup after the import.
+    STARTUP_SECONDS.set(time.perf_counter() - IMPORT_STARTED, "import")
+    with STARTUP_SECONDS.time("settings"):
+        settings = Settings.load()
+    with STARTUP_SECONDS.time("service"):
+        service = LedgerLookupService(settings)
     app.state.settings = settings
-    app.state.service = LedgerLookupService(settings)
+    app.state.service = service
+    app.state.refresh_scheduler = RefreshScheduler(service)
+    app.state.refresh_scheduler.start()
+    # Start serving (and answering /health) now; the one-off work the first
+    # lookup would otherwise pay for runs in the background.
+    app.state.warm_up = asyncio.create_task(_warm_up(service))
+    logger.info("Started in %.0f ms", (time.perf_counter() - IMPORT_STARTED) * 1000)
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    await app.state.warm_up
+    await app.state.refresh_scheduler.stop()
+    await app.state.service.aclose()
+
+
+async def _warm_up(service: LedgerLookupService) -> None:
+    try:
+        with STARTUP_SECONDS.time("warm_up"):
+            await asyncio.to_thread(service.warm_up)
+    except Exception:
+        logger.exception("Startup warm-up failed; the first lookup will do it instead")
 
 
 @app.get("/health")
-def health() -> dict[str, str]:
-    return {"status": "ok"}
+def health() -> dict[str, Any]:
+    service: LedgerLookupService = app.state.service
+    breakers = service.breaker_status()
+    degraded = any(breaker["state"] != "closed" for breaker in breakers.values())
+    return {"status": "degraded" if degraded else "ok", "breakers": breakers}
+
+
+@app.get("/cache/stats")
+def cache_stats(x_api_key: str | None = Header(default=None, alias="X-API-Key")) -> dict[str, Any]:
+    service: LedgerLookupService = app.state.service
+    _authorize(x_api_key)
+    return service.cache_stats()
+
+
+@app.get("/quota")
+def quota(
+    x_api_key: str | None = Header(default=None, alias="X-API-Key"),
+) -> dict[str, dict[str, int | None]]:
+    service: LedgerLookupService = app.state.service
+    _authorize(x_api_key)
+    return service.quota_status()
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics(x_api_key: str | None = Header(default=None, alias="X-API-Key")) -> PlainTextResponse:
+    _authorize(x_api_key)
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/parcels", response_model=ParcelListResponse)
+def parcels_in_region(
+    sigungu_code: str = Query(pattern=r"^\d{5}$", description="시군구 code (PNU digits 1-5)"),
+    bdong_code: str | None = Query(
+        default=None,
+        pattern=r"^\d{5}$",
+        description="법정동 code (PNU digits 6-10)",
+    ),
+    after: str = Query(default="", description="next_after of the previous page"),
+    limit: int = Query(default=100, ge=1, le=1000),
+    x_api_key: str | None = Header(default=None, alias="X-API-Key"),
+) -> ParcelListResponse:
+    service: LedgerLookupService = app.state.service
+    _authorize(x_api_key)
+    return ParcelListResponse(**service.parcels_in_region(sigungu_code, bdong_code, after, limit))
+
+
+@app.get("/parcels/nearby", response_model=ParcelListResponse)
+def parcels_nearby(
+    lon: float = Query(ge=-180, le=180),
+    lat: float = Query(ge=-90, le=90),
+    radius_m: float = Query(default=500, gt=0, le=10000),
+    limit: int = Query(default=100, ge=1, le=1000),
+    x_api_key: str | None = Header(default=None, alias="X-API-Key"),
+) -> ParcelListResponse:
+    service: LedgerLookupService = app.state.service
+    _authorize(x_api_key)
+    return ParcelListResponse(**service.parcels_nearby(lon, lat, radius_m, limit))
 
 
 @app.post("/lookup", response_model=LookupResponse)
-def lookup(
+async def lookup(
     request: LookupRequest,
+    include: str | None = Query(
+        default=None,
+        description="Comma-separated extra sections: recap_title, floor, expos_area",
+    ),
     x_api_key: str | None = Header(default=None, alias="X-API-Key"),
 ) -> LookupResponse:
-    settings: Settings = app.state.settings
     service: LedgerLookupService = app.state.service
-
-    if settings.api_token and x_api_key != settings.api_token:
-        raise HTTPException(status_code=401, detail="Unauthorized")
+    _authorize(x_api_key)
 
     try:
-        payload = service.lookup(request.address.strip(), force_refresh=request.force_refresh)
+        payload = await service.lookup(
+            request.address.strip(),
+            force_refresh=request.force_refresh,
+            include=include.split(",") if include else (),
+            include_raw=request.include_raw,
+        )
+    except QuotaExceededError as exc:
+        raise HTTPException(
+            status_code=429,
+            detail=str(exc),
+            headers={"Retry-After": str(int(exc.retry_after) + 1)},
+        ) from exc
+    except (CircuitOpenError, UpstreamThrottledError) as exc:
+        raise HTTPException(
+            status_code=503,
+            detail=str(exc),
+            headers={"Retry-After": str(int(exc.retry_after) + 1)},
+        ) from exc
     except RequestError as exc:
         raise HTTPException(status_code=502, detail=str(exc)) from exc
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     return LookupResponse(**payload)
+
+
+@app.post("/lookup/batch")
+async def lookup_batch(
+    request: BatchLookupRequest,
+    x_api_key: str | None = Header(default=None, alias="X-API-Key"),
+) -> StreamingResponse:
+    settings: Settings = app.state.settings
+    service: LedgerLookupService = app.state.service
+    _authorize(x_api_key)
+
+    if len(request.addresses) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many addresses: {len(request.addresses)} > {settings.batch_max_items}",
+        )
+
+    try:
+        validate_sections(request.include)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    async def stream() -> AsyncIterator[str]:
+        records = service.lookup_batch(
+            request.addresses,
+            force_refresh=request.force_refresh,
+            include=request.include,
+            include_raw=request.include_raw,
+        )
+        async for record in records:
+            if record["success"]:
+                record["result"] = LookupResponse(**record["result"]).model_dump()
+            yield json.dumps(record, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+def _authorize(x_api_key: str | None) -> None:
+    settings: Settings = app.state.settings
+    if settings.api_token and x_api_key != settings.api_token:
+        raise HTTPException(status_code=401, detail="Unauthorized")
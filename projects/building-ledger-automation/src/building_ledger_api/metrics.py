@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+# Upstream / end-to-end latencies (seconds).
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# SQLite reads and writes are expected in the sub-millisecond range.
+CACHE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for label_values, value in values:
+            lines.append(f"{self.name}{_labels(self.labels, label_values)} {_number(value)}")
+        return lines
+
+
+class Gauge:
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def set(self, value: float, *label_values: str) -> None:
+        with self._lock:
+            self._values[label_values] = value
+
+    @contextmanager
+    def time(self, *label_values: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.set(time.perf_counter() - started, *label_values)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} gauge"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for label_values, value in values:
+            lines.append(f"{self.name}{_labels(self.labels, label_values)} {_number(value)}")
+        return lines
+
+
+class Histogram:
+    """Cumulative-bucket histogram rendered in the Prometheus text format."""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = buckets
+        # label values -> (per-bucket counts incl. +Inf, sum)
+        self._series: dict[tuple[str, ...], tuple[list[int], float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        index = len(self.buckets)
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = position
+                break
+        with self._lock:
+            counts, total = self._series.get(label_values) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[index] += 1
+            self._series[label_values] = (counts, total + value)
+
+    @contextmanager
+    def time(self, *label_values: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *label_values)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((key, (list(counts), total)) for key, (counts, total) in self._series.items())
+        for label_values, (counts, total) in series:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                bucket_labels = _labels((*self.labels, "le"), (*label_values, le))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            labels = _labels(self.labels, label_values)
+            lines.append(f"{self.name}_sum{labels} {_number(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+UPSTREAM_LATENCY = Histogram(
+    "ledger_upstream_request_seconds",
+    "Latency of one upstream HTTP attempt.",
+    labels=("upstream",),
+)
+UPSTREAM_RETRIES = Counter(
+    "ledger_upstream_retries_total",
+    "Upstream attempts retried after a failure.",
+    labels=("upstream",),
+)
+UPSTREAM_ERRORS = Counter(
+    "ledger_upstream_errors_total",
+    "Failed upstream attempts by cause.",
+    labels=("upstream", "cause"),
+)
+CACHE_LATENCY = Histogram(
+    "ledger_cache_operation_seconds",
+    "Latency of cache backend reads and writes.",
+    labels=("cache", "operation"),
+    buckets=CACHE_BUCKETS,
+)
+CACHE_REQUESTS = Counter(
+    "ledger_cache_requests_total",
+    "Cache lookups by tier and result.",
+    labels=("cache", "result"),
+)
+LOOKUP_LATENCY = Histogram(
+    "ledger_lookup_seconds",
+    "End-to-end latency of LedgerLookupService.lookup.",
+)
+LOOKUP_ERRORS = Counter(
+    "ledger_lookup_errors_total",
+    "Lookups that raised RequestError, by cause.",
+    labels=("cause",),
+)
+STARTUP_SECONDS = Gauge(
+    "ledger_startup_seconds",
+    "Time spent in each startup phase (import, settings, service, warm_up).",
+    labels=("phase",),
+)
+
+REGISTRY = (
+    LOOKUP_LATENCY,
+    LOOKUP_ERRORS,
+    UPSTREAM_LATENCY,
+    UPSTREAM_RETRIES,
+    UPSTREAM_ERRORS,
+    CACHE_LATENCY,
+    CACHE_REQUESTS,
+    STARTUP_SECONDS,
+)
+
+
+def render_metrics() -> str:
+    """Every registered metric in the Prometheus text exposition format."""
+    lines: list[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
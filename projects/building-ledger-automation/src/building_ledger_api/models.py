@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-from typing import Any
-from pydantic import BaseModel, Field
+from typing import Annotated, Any
+from pydantic import BaseModel, Field, StringConstraints
+
+# Batch items are validated one by one, so a blank entry is reported at its index.
+BatchAddress = Annotated[str, StringConstraints(strip_whitespace=True, min_length=2)]
 
 
 class LookupRequest(BaseModel):
     address: str = Field(min_length=2)
     force_refresh: bool = False
+    include_raw: bool = False
+
+
+class BatchLookupRequest(BaseModel):
+    addresses: list[BatchAddress] = Field(min_length=1)
+    force_refresh: bool = False
+    include: list[str] = Field(default_factory=list)
+    include_raw: bool = False
 
 
 class CodeParts(BaseModel):
@@ -19,6 +30,8 @@ class CodeParts(BaseModel):
 
 class BuildingLedgerData(BaseModel):
     regstr_kind_name: str | None = None
+    building_name: str | None = None
+    dong_name: str | None = None
     road_address: str | None = None
     plat_area: float | None = None
     arch_area: float | None = None
@@ -40,5 +53,23 @@ class LookupResponse(BaseModel):
     pnu: str
     codes: CodeParts
     from_cache: bool
+    stale: bool = False
     data: BuildingLedgerData
-    raw_item: dict[str, Any]
+    buildings: list[BuildingLedgerData] = Field(default_factory=list)
+    sections: dict[str, list[dict[str, Any]]] = Field(default_factory=dict)
+    # Sections that could not be fetched (their ``sections`` entry is empty).
+    section_errors: dict[str, str] = Field(default_factory=dict)
+    raw_item: dict[str, Any] | None = None
+
+
+class ParcelResult(LookupResponse):
+    lon: float | None = None
+    lat: float | None = None
+    distance_m: float | None = None
+    fetched_at: str
+
+
+class ParcelListResponse(BaseModel):
+    count: int
+    items: list[ParcelResult]
+    next_after: str | None = None
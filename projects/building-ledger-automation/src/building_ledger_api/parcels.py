@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import math
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+from .cache import SqliteStore
+from .clients import split_pnu
+from .metrics import CACHE_LATENCY
+
+# Mean Earth radius; haversine distances are accurate to ~0.5% at this scale.
+EARTH_RADIUS_M = 6_371_008.8
+METERS_PER_DEGREE_LAT = math.pi * EARTH_RADIUS_M / 180
+
+PARCEL_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS parcel_index (
+        pnu TEXT PRIMARY KEY,
+        sigungu_code TEXT NOT NULL,
+        bdong_code TEXT NOT NULL,
+        plat_code TEXT NOT NULL,
+        bun TEXT NOT NULL,
+        ji TEXT NOT NULL,
+        road_address TEXT NOT NULL DEFAULT '',
+        lon REAL,
+        lat REAL,
+        updated_at TEXT NOT NULL
+    )
+"""
+PARCEL_REGION_INDEX = (
+    "CREATE INDEX IF NOT EXISTS parcel_index_region ON parcel_index (sigungu_code, bdong_code, pnu)"
+)
+# R*-tree over the Vworld points (a point is a zero-size box); ids are parcel_index rowids.
+PARCEL_RTREE = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS parcel_rtree USING rtree(id, min_lon, max_lon, min_lat, max_lat)
+"""
+# Fallback for SQLite builds without the rtree module.
+PARCEL_POINT_INDEX = "CREATE INDEX IF NOT EXISTS parcel_index_point ON parcel_index (lat, lon)"
+
+# Parcels seen without coordinates (bulk imports, re-indexed cache rows) keep
+# any point and road address recorded earlier.
+PARCEL_UPSERT = """
+    INSERT INTO parcel_index
+        (pnu, sigungu_code, bdong_code, plat_code, bun, ji, road_address, lon, lat, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(pnu) DO UPDATE SET
+        road_address = CASE WHEN excluded.road_address != '' THEN excluded.road_address
+                            ELSE parcel_index.road_address END,
+        lon = COALESCE(excluded.lon, parcel_index.lon),
+        lat = COALESCE(excluded.lat, parcel_index.lat),
+        updated_at = excluded.updated_at
+"""
+PARCEL_RTREE_UPSERT = """
+    INSERT OR REPLACE INTO parcel_rtree (id, min_lon, max_lon, min_lat, max_lat)
+    SELECT rowid, lon, lon, lat, lat FROM parcel_index WHERE pnu = ? AND lon IS NOT NULL
+"""
+PARCEL_COLUMNS = "pnu, road_address, lon, lat"
+PARCEL_SELECT_SIGUNGU = f"""
+    SELECT {PARCEL_COLUMNS} FROM parcel_index
+    WHERE sigungu_code = ? AND pnu > ?
+    ORDER BY pnu
+    LIMIT ?
+"""
+PARCEL_SELECT_BDONG = f"""
+    SELECT {PARCEL_COLUMNS} FROM parcel_index
+    WHERE sigungu_code = ? AND bdong_code = ? AND pnu > ?
+    ORDER BY pnu
+    LIMIT ?
+"""
+PARCEL_SELECT_BOX_RTREE = """
+    SELECT p.pnu, p.road_address, p.lon, p.lat
+    FROM parcel_rtree AS r JOIN parcel_index AS p ON p.rowid = r.id
+    WHERE r.min_lon <= ? AND r.max_lon >= ? AND r.min_lat <= ? AND r.max_lat >= ?
+"""
+PARCEL_SELECT_BOX = f"""
+    SELECT {PARCEL_COLUMNS} FROM parcel_index
+    WHERE lon <= ? AND lon >= ? AND lat <= ? AND lat >= ?
+"""
+PARCEL_COUNT = "SELECT COUNT(*), COUNT(lon) FROM parcel_index"
+
+
+class ParcelIndex(SqliteStore):
+    """PNU components and Vworld points of every parcel the service has seen.
+
+    Answers "which parcels are in this 시군구/법정동" (B-tree on the PNU
+    components) and "which parcels are within r metres" (R*-tree bounding-box
+    scan, then an exact haversine filter). It only lists PNUs; the ledger data
+    itself stays in ``LedgerCache``.
+    """
+
+    name = "parcel"
+    schema = (PARCEL_SCHEMA, PARCEL_REGION_INDEX)
+
+    def _init_db(self) -> None:
+        super()._init_db()
+        with self._connect() as conn:
+            try:
+                conn.execute(PARCEL_RTREE)
+                self.has_rtree = True
+            except sqlite3.OperationalError:  # SQLite built without SQLITE_ENABLE_RTREE
+                conn.execute(PARCEL_POINT_INDEX)
+                self.has_rtree = False
+
+    def add(
+        self,
+        pnu: str,
+        road_address: str = "",
+        lon: float | None = None,
+        lat: float | None = None,
+    ) -> None:
+        self.add_many([(pnu, road_address, lon, lat)])
+
+    def add_many(self, parcels: Iterable[tuple[str, str, float | None, float | None]]) -> int:
+        """Upsert ``(pnu, road_address, lon, lat)`` rows; returns rows written."""
+        now_iso = datetime.now(timezone.utc).isoformat()
+        rows = []
+        for pnu, road_address, lon, lat in parcels:
+            codes = split_pnu(pnu)
+            rows.append(
+                (
+                    pnu,
+                    codes["sigungu_code"],
+                    codes["bdong_code"],
+                    codes["plat_code"],
+                    codes["bun"],
+                    codes["ji"],
+                    road_address or "",
+                    lon,
+                    lat,
+                    now_iso,
+                )
+            )
+        with CACHE_LATENCY.time(self.name, "set"), self._connect() as conn:
+            conn.executemany(PARCEL_UPSERT, rows)
+            if self.has_rtree:
+                conn.executemany(PARCEL_RTREE_UPSERT, [(row[0],) for row in rows if row[7] is not None])
+        return len(rows)
+
+    def in_region(
+        self,
+        sigungu_code: str,
+        bdong_code: str | None = None,
+        after: str = "",
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        """Parcels of a 시군구 (or one of its 법정동), in PNU order after ``after``."""
+        with CACHE_LATENCY.time(self.name, "get"):
+            if bdong_code:
+                statement, params = PARCEL_SELECT_BDONG, (sigungu_code, bdong_code, after, limit)
+            else:
+                statement, params = PARCEL_SELECT_SIGUNGU, (sigungu_code, after, limit)
+            rows = self._connect().execute(statement, params).fetchall()
+        return [_parcel(row) for row in rows]
+
+    def nearby(self, lon: float, lat: float, radius_m: float, limit: int = 100) -> list[dict[str, Any]]:
+        """Parcels within ``radius_m`` of the point, nearest first, with ``distance_m``."""
+        lat_delta = radius_m / METERS_PER_DEGREE_LAT
+        lon_delta = radius_m / (METERS_PER_DEGREE_LAT * max(math.cos(math.radians(lat)), 1e-6))
+        box = (lon + lon_delta, lon - lon_delta, lat + lat_delta, lat - lat_delta)
+        statement = PARCEL_SELECT_BOX_RTREE if self.has_rtree else PARCEL_SELECT_BOX
+        with CACHE_LATENCY.time(self.name, "get"):
+            rows = self._connect().execute(statement, box).fetchall()
+
+        parcels = []
+        for row in rows:
+            distance = haversine_m(lon, lat, row[2], row[3])
+            if distance <= radius_m:
+                parcels.append({**_parcel(row), "distance_m": round(distance, 1)})
+        parcels.sort(key=lambda parcel: parcel["distance_m"])
+        return parcels[:limit]
+
+    def count(self) -> dict[str, int]:
+        parcels, located = self._connect().execute(PARCEL_COUNT).fetchone()
+        return {"parcels": parcels, "with_point": located}
+
+
+def haversine_m(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
+    """Great-circle distance in metres between two WGS84 points."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def _parcel(row: tuple) -> dict[str, Any]:
+    pnu, road_address, lon, lat = row
+    return {"pnu": pnu, "road_address": road_address, "lon": lon, "lat": lat}
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+from .cache import QuotaStore
+from .clients import QuotaExceededError
+
+# data.go.kr and Vworld both reset daily quotas at midnight KST.
+KST = timezone(timedelta(hours=9))
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` tokens per second, up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class UpstreamLimiter:
+    """Per-second token bucket plus a daily quota shared through the cache DB.
+
+    Every request actually sent upstream (including retries) counts one unit
+    of the daily quota, so all workers on the same cache file see the same
+    counter. Calls rejected because the quota is spent are not counted.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate_per_second: float,
+        daily_quota: int,
+        store: QuotaStore,
+    ) -> None:
+        self.name = name
+        self.daily_quota = daily_quota
+        self.store = store
+        self.bucket = TokenBucket(rate_per_second, capacity=rate_per_second)
+        # Day on which this process saw the quota run out; skips the DB until reset.
+        self._exhausted_day: str | None = None
+
+    def status(self) -> dict[str, int | None]:
+        used = self.store.used(self.name, _quota_day())
+        return {"used": used, "daily_quota": self.daily_quota or None}
+
+    async def acquire(self) -> None:
+        day = _quota_day()
+        if self._exhausted_day == day:
+            raise self._quota_error()
+        await self.bucket.acquire()
+        # Reserve right before the request goes out; SQLite stays off the loop.
+        if not await asyncio.to_thread(self.store.reserve, self.name, day, self.daily_quota):
+            self._exhausted_day = day
+            raise self._quota_error()
+
+    def _quota_error(self) -> QuotaExceededError:
+        return QuotaExceededError(
+            f"{self.name} daily quota exhausted ({self.daily_quota} calls)",
+            retry_after=_seconds_until_reset(),
+        )
+
+
+def _quota_day() -> str:
+    return datetime.now(KST).date().isoformat()
+
+
+def _seconds_until_reset() -> float:
+    now = datetime.now(KST)
+    tomorrow = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=KST)
+    return (tomorrow - now).total_seconds()
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import logging
+import socket
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Sequence
+from urllib.parse import unquote, urlsplit
+
+from .cache import (
+    SCHEMA_VERSION,
+    LedgerCache,
+    _hit_ratio,
+    _inflate,
+    _is_expired,
+    _parse_timestamp,
+    encode_payload,
+)
+from .metrics import CACHE_LATENCY, CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+
+class RedisError(RuntimeError):
+    """Error reply from the Redis server."""
+
+
+class RespConnection:
+    """Minimal blocking RESP2 client with just what ``RedisLedgerCache`` needs.
+
+    ``execute`` pipelines: every command is written first and the replies are
+    read afterwards, so any number of commands costs one round trip.
+    """
+
+    def __init__(self, url: str, timeout: float) -> None:
+        parts = urlsplit(url)
+        if parts.scheme != "redis":
+            raise ValueError(f"Unsupported REDIS_URL (expected redis://host:port/db): {url}")
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 6379
+        self.username = unquote(parts.username) if parts.username else None
+        self.password = unquote(parts.password) if parts.password else None
+        self.db = int(parts.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self._sock: socket.socket | None = None
+        self._reader: Any = None
+        self._lock = threading.Lock()
+
+    def execute(self, *commands: tuple[Any, ...]) -> list[Any]:
+        with self._lock:
+            reused = self._sock is not None
+            try:
+                return self._execute(commands)
+            except (OSError, EOFError) as exc:
+                self._disconnect()
+                # The server may have dropped an idle connection; retry once on a
+                # fresh one (every command the cache sends is idempotent). A
+                # timeout means the server is slow or gone, so retrying would
+                # only double the wait.
+                if not reused or isinstance(exc, socket.timeout):
+                    raise
+                return self._execute(commands)
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def _execute(self, commands: tuple[tuple[Any, ...], ...]) -> list[Any]:
+        if self._sock is None:
+            self._connect()
+        self._sock.sendall(b"".join(_encode_command(command) for command in commands))
+        replies = [self._read_reply() for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RedisError):
+                raise reply
+        return replies
+
+    def _connect(self) -> None:
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._sock.makefile("rb")
+        handshake: list[tuple[Any, ...]] = []
+        if self.password:
+            credentials = (self.username, self.password) if self.username else (self.password,)
+            handshake.append(("AUTH", *credentials))
+        if self.db:
+            handshake.append(("SELECT", self.db))
+        if handshake:
+            self._execute(tuple(handshake))
+
+    def _disconnect(self) -> None:
+        if self._reader is not None:
+            self._reader.close()
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = None
+        self._reader = None
+
+    def _read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise EOFError("Redis closed the connection")
+        prefix, rest = line[:1], line[1:-2]
+        if prefix == b"+":
+            return rest.decode()
+        if prefix == b"-":
+            return RedisError(rest.decode())
+        if prefix == b":":
+            return int(rest)
+        if prefix == b"$":
+            length = int(rest)
+            return None if length < 0 else self._reader.read(length + 2)[:-2]
+        if prefix == b"*":
+            length = int(rest)
+            return None if length < 0 else [self._read_reply() for _ in range(length)]
+        raise RedisError(f"Unexpected Redis reply: {line!r}")
+
+
+class RedisLedgerCache(LedgerCache):
+    """``LedgerCache`` on a Redis-protocol server shared by every API host.
+
+    Each entry is ``<prefix>data:<key>`` (schema version and ``fetched_at``
+    header, then the compressed payload) plus ``<prefix>raw:<key>`` for
+    ``raw_item``, both expiring after ``expire_seconds``. Title keys are also
+    scored by fetch time in ``<prefix>fetched_at`` for ``expiring()``.
+
+    Cache errors are logged and treated as misses, so lookups keep working
+    (against the upstream APIs) while the server is unreachable. After an
+    error the server is skipped for ``retry_after`` seconds, so a dead or
+    hung server costs one timeout per window rather than one per request.
+
+    Calls block on the socket; ``LedgerLookupService`` runs them in worker
+    threads.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        key_prefix: str,
+        expire_seconds: int,
+        timeout: float,
+        retry_after: float = 30.0,
+    ) -> None:
+        self.connection = RespConnection(url, timeout)
+        self.key_prefix = key_prefix
+        self.expire_seconds = expire_seconds
+        self.retry_after = retry_after
+        self.hits = 0
+        self.misses = 0
+        self._down_until = 0.0
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": _hit_ratio(self.hits, self.misses),
+            "unavailable": self._unavailable(),
+        }
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def get_entry(
+        self,
+        key: str,
+        ttl_days: int,
+        include_raw: bool = False,
+    ) -> tuple[dict, datetime] | None:
+        return self.get_entries([key], ttl_days, include_raw).get(key)
+
+    def get_entries(
+        self,
+        keys: list[str],
+        ttl_days: int,
+        include_raw: bool = False,
+    ) -> dict[str, tuple[dict, datetime]]:
+        """One pipelined MGET round trip for all keys (and their raw items)."""
+        if not keys:
+            return {}
+        commands = [("MGET", *(self._data_key(key) for key in keys))]
+        if include_raw:
+            commands.append(("MGET", *(self._raw_key(key) for key in keys)))
+
+        with CACHE_LATENCY.time(self.name, "get"):
+            replies = self._execute("read", commands) or [[None] * len(keys)]
+
+            raw_blobs = replies[1] if len(replies) > 1 else [None] * len(keys)
+            entries = {}
+            for key, value, raw_blob in zip(keys, replies[0], raw_blobs):
+                entry = _unpack(value, ttl_days)
+                self._record(hit=entry is not None)
+                if entry is None:
+                    continue
+                payload, fetched_at = entry
+                if raw_blob is not None:
+                    payload["raw_item"] = _inflate(raw_blob)
+                entries[key] = (payload, fetched_at)
+        return entries
+
+    def expiring(self, fetched_before: datetime, limit: int) -> list[tuple[str, dict]]:
+        index = self._index_key()
+        replies = self._execute(
+            "scan", [("ZRANGEBYSCORE", index, "-inf", fetched_before.timestamp(), "LIMIT", 0, limit)]
+        )
+        keys = [key.decode() for key in replies[0]] if replies else []
+        if not keys:
+            return []
+        replies = self._execute("scan", [("MGET", *(self._data_key(key) for key in keys))])
+        if not replies:
+            return []
+        values = replies[0]
+
+        entries = []
+        gone = []
+        for key, value in zip(keys, values):
+            entry = _unpack(value, ttl_days=None)
+            if entry is None:
+                gone.append(key)
+            else:
+                entries.append((key, entry[0]))
+        if gone:
+            self._quietly(("ZREM", index, *gone))
+        return entries
+
+    def set_many(self, entries: list[tuple[str, dict]]) -> None:
+        fetched_at = datetime.now(timezone.utc)
+        header = f"{SCHEMA_VERSION} {fetched_at.isoformat()}\n".encode()
+        index = self._index_key()
+        commands: list[tuple[Any, ...]] = []
+
+        with CACHE_LATENCY.time(self.name, "set"):
+            for key, payload in entries:
+                payload_blob, raw_blob = encode_payload(payload)
+                commands.append(("SET", self._data_key(key), header + payload_blob, "EX", self.expire_seconds))
+                if raw_blob is None:
+                    commands.append(("DEL", self._raw_key(key)))
+                else:
+                    commands.append(("SET", self._raw_key(key), raw_blob, "EX", self.expire_seconds))
+                # Sections are refreshed on demand only, as with SqliteLedgerCache.
+                if ":" not in key:
+                    commands.append(("ZADD", index, fetched_at.timestamp(), key))
+            expired_before = fetched_at.timestamp() - self.expire_seconds
+            commands.append(("ZREMRANGEBYSCORE", index, "-inf", expired_before))
+            self._quietly(*commands)
+
+    def _quietly(self, *commands: tuple[Any, ...]) -> None:
+        self._execute("write", commands)
+
+    def _execute(self, action: str, commands: Sequence[tuple[Any, ...]]) -> list[Any] | None:
+        """Run ``commands``; ``None`` if they failed or the server is being skipped."""
+        if self._unavailable():
+            return None
+        try:
+            return self.connection.execute(*commands)
+        except RedisError as exc:
+            logger.warning("Redis cache %s failed: %s", action, exc)
+        except (OSError, EOFError) as exc:
+            self._down_until = time.monotonic() + self.retry_after
+            logger.warning(
+                "Redis cache %s failed: %s; skipping Redis for %.0f s", action, exc, self.retry_after
+            )
+        return None
+
+    def _unavailable(self) -> bool:
+        return time.monotonic() < self._down_until
+
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        CACHE_REQUESTS.inc(self.name, "hit" if hit else "miss")
+
+    def _data_key(self, key: str) -> str:
+        return f"{self.key_prefix}data:{key}"
+
+    def _raw_key(self, key: str) -> str:
+        return f"{self.key_prefix}raw:{key}"
+
+    def _index_key(self) -> str:
+        return f"{self.key_prefix}fetched_at"
+
+
+def _unpack(value: bytes | None, ttl_days: int | None) -> tuple[dict, datetime] | None:
+    if value is None:
+        return None
+    header, blob = value.split(b"\n", 1)
+    version, fetched_at = header.decode().split(" ", 1)
+    if int(version) != SCHEMA_VERSION or (ttl_days is not None and _is_expired(fetched_at, ttl_days)):
+        return None
+    return _inflate(blob), _parse_timestamp(fetched_at)
+
+
+def _encode_command(command: tuple[Any, ...]) -> bytes:
+    parts = [b"*%d\r\n" % len(command)]
+    for arg in command:
+        if isinstance(arg, bytes):
+            data = arg
+        elif isinstance(arg, float):
+            data = repr(arg).encode()
+        else:
+            data = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
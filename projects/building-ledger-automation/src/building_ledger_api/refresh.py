@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+from .ratelimit import KST
+from .service import LedgerLookupService
+
+logger = logging.getLogger(__name__)
+
+# A PNU whose refresh failed is skipped for this long, so entries that keep
+# failing do not hold the head of every (oldest-first) batch.
+FAILED_REFRESH_BACKOFF_SECONDS = 24 * 60 * 60
+
+
+class RefreshScheduler:
+    """Re-fetch ledger entries that are close to expiry during off-peak hours.
+
+    Refreshes go through ``LedgerLookupService.schedule_refresh`` so they are
+    deduplicated against stale-while-revalidate refreshes of the same PNU.
+    Off-peak hours are KST, like the upstream quota day.
+    """
+
+    def __init__(self, service: LedgerLookupService) -> None:
+        self.service = service
+        self.settings = service.settings
+        self.hours = parse_hour_window(self.settings.refresh_offpeak_hours)
+        self._task: asyncio.Task[None] | None = None
+        # PNU -> monotonic time after which a failed refresh may be retried.
+        self._backoff: dict[str, float] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.hours)
+
+    def start(self) -> None:
+        if self.enabled and self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_once(self) -> int:
+        """Refresh one batch of soon-to-expire entries and return its size."""
+        ttl = timedelta(days=self.settings.cache_ttl_days - self.settings.refresh_ahead_days)
+        cutoff = datetime.now(timezone.utc) - ttl
+        now = time.monotonic()
+        self._backoff = {pnu: until for pnu, until in self._backoff.items() if until > now}
+        # Over-fetch by the backed-off entries so they cannot fill the batch.
+        batch_size = self.settings.refresh_batch_size
+        candidates = await asyncio.to_thread(
+            self.service.cache.expiring, cutoff, batch_size + len(self._backoff)
+        )
+        entries = [(pnu, payload) for pnu, payload in candidates if pnu not in self._backoff]
+        entries = entries[:batch_size]
+        semaphore = asyncio.Semaphore(self.settings.batch_concurrency)
+
+        async def refresh(pnu: str, payload: dict) -> None:
+            async with semaphore:
+                try:
+                    refreshed = await asyncio.shield(self.service.schedule_refresh(pnu, payload))
+                except Exception:
+                    logger.exception("Ledger cache refresh of %s failed", pnu)
+                    refreshed = False
+            if not refreshed:
+                self._backoff[pnu] = time.monotonic() + FAILED_REFRESH_BACKOFF_SECONDS
+
+        await asyncio.gather(*(refresh(pnu, payload) for pnu, payload in entries))
+        return len(entries)
+
+    async def _run(self) -> None:
+        while True:
+            if datetime.now(KST).hour in self.hours:
+                try:
+                    refreshed = await self.run_once()
+                    if refreshed:
+                        logger.info("Refreshed %d ledger cache entries", refreshed)
+                except Exception:  # keep the scheduler alive across unexpected failures
+                    logger.exception("Ledger cache refresh run failed")
+            await asyncio.sleep(self.settings.refresh_interval_seconds)
+
+
+def parse_hour_window(value: str) -> set[int]:
+    """``"1-5"`` -> ``{1, 2, 3, 4}``; wraps past midnight (``"23-2"``)."""
+    if not value:
+        return set()
+    start_text, _, end_text = value.partition("-")
+    start = int(start_text) % 24
+    end = int(end_text or start_text) % 24
+    if start == end:
+        return {start} if not end_text else set(range(24))
+    hours = set()
+    hour = start
+    while hour != end:
+        hours.add(hour)
+        hour = (hour + 1) % 24
+    return hours
@@ -1,61 +1,549 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import logging
+from contextlib import AbstractAsyncContextManager, nullcontext
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Sequence
 
-from .cache import LedgerCache
-from .clients import BuildingHubClient, VworldClient, split_pnu
+from .breaker import CircuitBreaker
+from .cache import GeocodeCache, MemoryCache, QuotaStore, open_ledger_cache
+from .clients import (
+    BuildingHubClient,
+    CircuitOpenError,
+    QuotaExceededError,
+    RequestError,
+    UpstreamThrottledError,
+    VworldClient,
+    normalize_address,
+    split_pnu,
+)
 from .config import Settings
+from .metrics import LOOKUP_ERRORS, LOOKUP_LATENCY
+from .parcels import ParcelIndex
+from .ratelimit import UpstreamLimiter
+from .singleflight import SingleFlight
+from .transport import AsyncHttpEngine
+
+logger = logging.getLogger(__name__)
 
 
 class LedgerLookupService:
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
-        self.cache = LedgerCache(settings.cache_db_path)
-        self.vworld = VworldClient(settings)
-        self.building_hub = BuildingHubClient(settings)
+        self.memory_cache = MemoryCache(settings.memory_cache_max_entries)
+        self.cache = open_ledger_cache(settings)
+        self.geocode_cache = GeocodeCache(settings.cache_db_path)
+        self.quota = QuotaStore(settings.cache_db_path)
+        self.parcels = ParcelIndex(settings.cache_db_path)
+        self.http = AsyncHttpEngine(settings)
+        self.vworld = VworldClient(
+            settings,
+            self.http,
+            UpstreamLimiter(
+                VworldClient.NAME,
+                settings.vworld_rate_per_second,
+                settings.vworld_daily_quota,
+                self.quota,
+            ),
+            self._breaker(VworldClient.NAME),
+        )
+        self.building_hub = BuildingHubClient(
+            settings,
+            self.http,
+            UpstreamLimiter(
+                BuildingHubClient.NAME,
+                settings.building_hub_rate_per_second,
+                settings.building_hub_daily_quota,
+                self.quota,
+            ),
+            self._breaker(BuildingHubClient.NAME),
+        )
+        self.geocode_flights: SingleFlight[dict[str, Any]] = SingleFlight()
+        self.ledger_flights: SingleFlight[dict[str, Any]] = SingleFlight()
+        self._refreshing: dict[str, asyncio.Task[bool]] = {}
+        # PNUs whose point this process already wrote to the parcel index.
+        self._indexed_points: set[str] = set()
+
+    def _breaker(self, name: str) -> CircuitBreaker:
+        return CircuitBreaker(
+            name,
+            self.settings.breaker_failure_threshold,
+            self.settings.breaker_reset_seconds,
+        )
+
+    def warm_up(self) -> None:
+        """One-off work ahead of the first lookup (httpx imports, TLS context).
+
+        Blocking; main.py runs it in a worker thread after startup.
+        """
+        self.http.warm_up()
+
+    async def aclose(self) -> None:
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        await self.http.aclose()
+        self.cache.close()
+        self.geocode_cache.close()
+        self.quota.close()
+        self.parcels.close()
+
+    def cache_stats(self) -> dict[str, Any]:
+        return {
+            "geocode": self.geocode_cache.stats(),
+            "memory": self.memory_cache.stats(),
+            "ledger": self.cache.stats(),
+            "parcels": self.parcels.count(),
+            "coalescing": {
+                "geocode": self.geocode_flights.stats(),
+                "ledger": self.ledger_flights.stats(),
+            },
+        }
+
+    def quota_status(self) -> dict[str, dict[str, int | None]]:
+        return {
+            "vworld": self.vworld.limiter.status(),
+            "building_hub": self.building_hub.limiter.status(),
+        }
+
+    def breaker_status(self) -> dict[str, dict[str, Any]]:
+        return {
+            "vworld": self.vworld.breaker.status(),
+            "building_hub": self.building_hub.breaker.status(),
+        }
+
+    async def lookup(
+        self,
+        address: str,
+        force_refresh: bool = False,
+        include: Sequence[str] = (),
+        include_raw: bool = False,
+    ) -> dict[str, Any]:
+        sections = validate_sections(include)
+        with LOOKUP_LATENCY.time():
+            try:
+                geocoded = await self._geocode(address, force_refresh)
+                return await self._lookup_with_sections(
+                    address, geocoded, force_refresh, sections, include_raw
+                )
+            except RequestError as exc:
+                LOOKUP_ERRORS.inc(exc.cause)
+                raise
+
+    async def lookup_batch(
+        self,
+        addresses: list[str],
+        force_refresh: bool = False,
+        include: Sequence[str] = (),
+        include_raw: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield one NDJSON-ready record per input address, in completion order.
+
+        Identical addresses are looked up once, and addresses that geocode to
+        the same PNU share one Building HUB fetch through the service-wide
+        single-flight groups. Upstream calls run under a semaphore of
+        ``batch_concurrency`` and results are yielded as soon as they finish,
+        so cache hits are never held behind slow upstream items.
+
+        Cached results for addresses with a cached geocode are read up front
+        in one multi-key ``get_entries`` call (one round trip on Redis).
+        """
+        sections = validate_sections(include)
+        semaphore = asyncio.Semaphore(self.settings.batch_concurrency)
+
+        positions: dict[str, list[int]] = {}
+        for index, address in enumerate(addresses):
+            positions.setdefault(address.strip(), []).append(index)
+        known = {} if force_refresh else await self._prefetch(list(positions), include_raw)
+
+        async def resolve(address: str) -> dict[str, Any]:
+            geocoded = known.get(address) or await self._geocode(address, force_refresh, semaphore)
+            result = await self._lookup_with_sections(
+                address, geocoded, force_refresh, sections, include_raw, semaphore
+            )
+            result["input_address"] = address
+            return result
+
+        async def run(address: str) -> tuple[str, dict[str, Any]]:
+            try:
+                return address, {"success": True, "result": await resolve(address)}
+            except QuotaExceededError as exc:
+                return address, {"success": False, "status_code": 429, "error": str(exc)}
+            except (CircuitOpenError, UpstreamThrottledError) as exc:
+                return address, {"success": False, "status_code": 503, "error": str(exc)}
+            except RequestError as exc:
+                return address, {"success": False, "status_code": 502, "error": str(exc)}
+            except ValueError as exc:
+                return address, {"success": False, "status_code": 400, "error": str(exc)}
+
+        tasks = [asyncio.ensure_future(run(address)) for address in positions]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                address, outcome = await next_done
+                for index in positions[address]:
+                    yield {"index": index, "address": address, **outcome}
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _prefetch(self, addresses: list[str], include_raw: bool) -> dict[str, dict[str, Any]]:
+        """Warm the memory tier for a batch; returns the geocodes found on the way."""
+        known = await asyncio.to_thread(self._cached_geocodes, addresses)
+        if known and self.memory_cache.max_entries > 0:
+            pnus = sorted({geocoded["pnu"] for geocoded in known.values()})
+            entries = await asyncio.to_thread(
+                self.cache.get_entries,
+                pnus,
+                ttl_days=self.settings.cache_ttl_days,
+                include_raw=include_raw,
+            )
+            for pnu, (payload, fetched_at) in entries.items():
+                self._remember(pnu, payload, fetched_at)
+        return known
+
+    def parcels_in_region(
+        self,
+        sigungu_code: str,
+        bdong_code: str | None = None,
+        after: str = "",
+        limit: int = 100,
+    ) -> dict[str, Any]:
+        """Cached results for the parcels of a 시군구/법정동, one PNU-ordered page at a time.
+
+        ``next_after`` continues the listing; a page may hold fewer items than
+        ``limit`` because parcels without a cached result are left out.
+        """
+        parcels = self.parcels.in_region(sigungu_code, bdong_code, after, limit)
+        next_after = parcels[-1]["pnu"] if len(parcels) == limit else None
+        return {**self._cached_parcels(parcels), "next_after": next_after}
+
+    def parcels_nearby(self, lon: float, lat: float, radius_m: float, limit: int = 100) -> dict[str, Any]:
+        """Cached results for parcels within ``radius_m`` of the point, nearest first."""
+        return self._cached_parcels(self.parcels.nearby(lon, lat, radius_m, limit))
+
+    def _cached_parcels(self, parcels: list[dict[str, Any]]) -> dict[str, Any]:
+        """Attach cached ledger results (no upstream calls) to index rows.
+
+        Results past ``cache_ttl_days`` but within ``stale_max_days`` are
+        included and marked ``stale``, as lookups would serve them.
+        """
+        entries = self.cache.get_entries(
+            [parcel["pnu"] for parcel in parcels],
+            ttl_days=self.settings.cache_ttl_days + self.settings.stale_max_days,
+            include_raw=False,
+        )
+        fresh_after = datetime.now(timezone.utc) - timedelta(days=self.settings.cache_ttl_days)
+        items = []
+        for parcel in parcels:
+            entry = entries.get(parcel["pnu"])
+            if entry is None:
+                continue
+            payload, fetched_at = entry
+            payload.pop("raw_item", None)
+            location = {key: parcel[key] for key in ("lon", "lat", "distance_m") if key in parcel}
+            items.append(
+                {
+                    **payload,
+                    **location,
+                    "from_cache": True,
+                    "stale": fetched_at < fresh_after,
+                    "fetched_at": fetched_at.isoformat(),
+                }
+            )
+        return {"count": len(items), "items": items}
+
+    def schedule_refresh(self, pnu: str, payload: dict[str, Any]) -> asyncio.Task[bool]:
+        """Re-fetch ``pnu`` in the background; concurrent calls share one task.
+
+        The task's result tells whether the refresh succeeded.
+        """
+        task = self._refreshing.get(pnu)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh(pnu, payload))
+            self._refreshing[pnu] = task
+            task.add_done_callback(lambda _: self._refreshing.pop(pnu, None))
+        return task
+
+    async def _refresh(self, pnu: str, payload: dict[str, Any]) -> bool:
+        geocoded = {"pnu": pnu, "road_address": payload["road_address"]}
+        try:
+            await self._lookup_geocoded(payload["input_address"], geocoded, force_refresh=True)
+        except (RequestError, ValueError) as exc:
+            logger.warning("Background refresh failed for %s: %s", pnu, exc)
+            return False
+        return True
+
+    async def _geocode(
+        self,
+        address: str,
+        force_refresh: bool,
+        limit: AbstractAsyncContextManager[Any] | None = None,
+    ) -> dict[str, Any]:
+        address_key = normalize_address(address)
+        if not force_refresh:
+            cached = await asyncio.to_thread(self._cached_geocode, address_key)
+            if cached:
+                return cached
+
+        async def fetch() -> dict[str, Any]:
+            async with limit or nullcontext():
+                geocoded = await self.vworld.geocode_address(address)
+            await asyncio.to_thread(self._store_geocode, address_key, geocoded)
+            return geocoded
+
+        return await self.geocode_flights.do(address_key, fetch)
 
-    def lookup(self, address: str, force_refresh: bool = False) -> dict[str, Any]:
-        geocoded = self.vworld.geocode_address(address)
+    # The geocode cache and parcel index are SQLite; these run in worker threads.
+
+    def _cached_geocodes(self, addresses: list[str]) -> dict[str, dict[str, Any]]:
+        known = {}
+        for address in addresses:
+            cached = self._cached_geocode(normalize_address(address))
+            if cached:
+                known[address] = cached
+        return known
+
+    def _cached_geocode(self, address_key: str) -> dict[str, Any] | None:
+        cached = self.geocode_cache.get(address_key, ttl_days=self.settings.geocode_cache_ttl_days)
+        if cached:
+            self._index_point(cached)
+        return cached
+
+    def _store_geocode(self, address_key: str, geocoded: dict[str, Any]) -> None:
+        self.geocode_cache.set(address_key, geocoded)
+        self.parcels.add(
+            geocoded["pnu"], geocoded["road_address"], geocoded.get("lon"), geocoded.get("lat")
+        )
+        if geocoded.get("lon") is not None:
+            self._indexed_points.add(geocoded["pnu"])
+
+    def _index_point(self, geocoded: dict[str, Any]) -> None:
+        """Put a geocoded point into the parcel index, once per PNU and process."""
+        if geocoded.get("lon") is None or geocoded["pnu"] in self._indexed_points:
+            return
+        self.parcels.add(geocoded["pnu"], geocoded["road_address"], geocoded["lon"], geocoded["lat"])
+        self._indexed_points.add(geocoded["pnu"])
+
+    async def _lookup_with_sections(
+        self,
+        address: str,
+        geocoded: dict[str, Any],
+        force_refresh: bool,
+        sections: list[str],
+        include_raw: bool,
+        limit: AbstractAsyncContextManager[Any] | None = None,
+    ) -> dict[str, Any]:
+        """Title lookup plus the requested sections, all fetched concurrently.
+
+        Only the title lookup is required: a section that fails comes back as
+        an empty list with its error in ``section_errors``.
+        """
         pnu = geocoded["pnu"]
         codes = split_pnu(pnu)
+        result, *section_items = await asyncio.gather(
+            self._lookup_geocoded(address, geocoded, force_refresh, limit, include_raw),
+            *(self._get_section(pnu, codes, section, force_refresh, limit) for section in sections),
+            return_exceptions=True,
+        )
+        if isinstance(result, BaseException):
+            raise result
+        if not include_raw:
+            result.pop("raw_item", None)
+        if sections:
+            items_by_section = {}
+            errors = {}
+            for section, items in zip(sections, section_items):
+                if isinstance(items, (RequestError, ValueError)):
+                    logger.warning("Section %s lookup failed for %s: %s", section, pnu, items)
+                    items_by_section[section] = []
+                    errors[section] = str(items)
+                elif isinstance(items, BaseException):
+                    raise items
+                else:
+                    items_by_section[section] = items
+            result = {**result, "sections": items_by_section, "section_errors": errors}
+        return result
 
+    async def _get_section(
+        self,
+        pnu: str,
+        codes: dict[str, str],
+        section: str,
+        force_refresh: bool,
+        limit: AbstractAsyncContextManager[Any] | None,
+    ) -> list[dict[str, Any]]:
+        key = section_cache_key(pnu, section)
         if not force_refresh:
-            cached = self.cache.get(pnu, ttl_days=self.settings.cache_ttl_days)
+            ttl_days = getattr(self.settings, f"{section}_ttl_days")
+            cached = await asyncio.to_thread(self.cache.get, key, ttl_days=ttl_days)
             if cached:
+                return cached["items"]
+
+        async def fetch() -> dict[str, Any]:
+            async with limit or nullcontext():
+                fetched = await self.building_hub.get_section_items(section, codes)
+            payload = {"items": fetched["items"]}
+            await asyncio.to_thread(self.cache.set, key, payload)
+            return payload
+
+        return (await self.ledger_flights.do(key, fetch))["items"]
+
+    async def _lookup_geocoded(
+        self,
+        address: str,
+        geocoded: dict[str, Any],
+        force_refresh: bool,
+        limit: AbstractAsyncContextManager[Any] | None = None,
+        include_raw: bool = False,
+    ) -> dict[str, Any]:
+        pnu = geocoded["pnu"]
+        codes = split_pnu(pnu)
+
+        if force_refresh:
+            self.memory_cache.invalidate(pnu)
+        else:
+            cached = await self._get_cached(pnu, include_raw)
+            if cached:
+                if cached.get("stale"):
+                    self.schedule_refresh(pnu, cached)
                 cached["from_cache"] = True
                 return cached
 
-        fetched = self.building_hub.get_title_info(codes)
-        item = fetched["item"]
-
-        result = {
-            "success": True,
-            "input_address": address,
-            "road_address": geocoded["road_address"],
-            "pnu": pnu,
-            "codes": codes,
-            "from_cache": False,
-            "data": {
-                "regstr_kind_name": item.get("regstrKindCdNm"),
-                "road_address": item.get("newPlatPlc") or geocoded["road_address"],
-                "plat_area": _to_float(item.get("platArea")),
-                "arch_area": _to_float(item.get("archArea")),
-                "bc_ratio": _to_float(item.get("bcRat")),
-                "tot_area": _to_float(item.get("totArea")),
-                "vl_ratio_estm_tot_area": _to_float(item.get("vlRatEstmTotArea")),
-                "vl_ratio": _to_float(item.get("vlRat")),
-                "structure_name": item.get("strctCdNm"),
-                "etc_structure": item.get("etcStrct") or item.get("strctCd"),
-                "seismic_design_yn": item.get("rserthqkDsgnApplyYn") or item.get("rgnlLmtSe"),
-                "seismic_ability": item.get("rserthqkAblty") or item.get("rgnlLmtSe"),
-                "use_approval_day": item.get("useAprDay"),
-            },
-            "raw_item": item,
-        }
+        try:
+            fetched = await self.ledger_flights.do(
+                pnu, lambda: self._fetch_ledger(address, geocoded, codes, limit)
+            )
+        except CircuitOpenError:
+            # Building HUB is known to be down: any recent copy beats failing.
+            stale = await self._get_stale(pnu, include_raw)
+            if not stale:
+                raise
+            stale["from_cache"] = True
+            stale["stale"] = True
+            return stale
+        # Coalesced callers share the leader's result; keep their own input.
+        return {**fetched, "input_address": address}
 
-        self.cache.set(pnu, result)
+    async def _fetch_ledger(
+        self,
+        address: str,
+        geocoded: dict[str, Any],
+        codes: dict[str, str],
+        limit: AbstractAsyncContextManager[Any] | None,
+    ) -> dict[str, Any]:
+        pnu = geocoded["pnu"]
+        async with limit or nullcontext():
+            if self.settings.fetch_all_buildings:
+                items = (await self.building_hub.get_title_items(codes))["items"]
+            else:
+                items = [(await self.building_hub.get_title_info(codes))["item"]]
+
+        result = build_ledger_result(address, geocoded["road_address"], pnu, items)
+
+        await asyncio.to_thread(self.cache.set, pnu, result)
+        # Parcels geocoded before the index existed get their PNU components here.
+        await asyncio.to_thread(self.parcels.add, pnu, geocoded["road_address"])
+        self._remember(pnu, result, datetime.now(timezone.utc))
         return result
 
+    async def _get_cached(self, pnu: str, include_raw: bool = False) -> dict[str, Any] | None:
+        """Cached result for ``pnu``, marked ``stale`` when past ``cache_ttl_days``.
+
+        Stale rows are only returned with ``stale_while_revalidate``; the row
+        is read once either way.
+        """
+        cached = self.memory_cache.get(pnu)
+        # Entries remembered from a raw-less read cannot serve raw_item requests.
+        if cached and (not include_raw or "raw_item" in cached):
+            return cached
+
+        max_age_days = self.settings.cache_ttl_days
+        if self.settings.stale_while_revalidate:
+            max_age_days += self.settings.stale_max_days
+        # Ledger cache calls may block on the network (Redis): keep them off the event loop.
+        entry = await asyncio.to_thread(
+            self.cache.get_entry, pnu, ttl_days=max_age_days, include_raw=include_raw
+        )
+        if not entry:
+            return None
+        payload, fetched_at = entry
+        fresh_after = datetime.now(timezone.utc) - timedelta(days=self.settings.cache_ttl_days)
+        if fetched_at < fresh_after:
+            return {**payload, "stale": True}
+        self._remember(pnu, payload, fetched_at)
+        return dict(payload)
+
+    async def _get_stale(self, pnu: str, include_raw: bool = False) -> dict[str, Any] | None:
+        """Any copy within ``stale_max_days``, for when upstream is unavailable."""
+        max_age_days = self.settings.cache_ttl_days + self.settings.stale_max_days
+        entry = await asyncio.to_thread(
+            self.cache.get_entry, pnu, ttl_days=max_age_days, include_raw=include_raw
+        )
+        return dict(entry[0]) if entry else None
+
+    def _remember(self, pnu: str, payload: dict[str, Any], fetched_at: datetime) -> None:
+        expires_at = fetched_at + timedelta(days=self.settings.cache_ttl_days)
+        self.memory_cache.set(pnu, payload, expires_at)
+
+
+def section_cache_key(pnu: str, section: str) -> str:
+    """``ledger_cache`` key for an optional section; plain PNUs hold the title."""
+    return f"{pnu}:{section}"
+
+
+def validate_sections(include: Sequence[str]) -> list[str]:
+    sections = list(dict.fromkeys(name.strip() for name in include if name.strip()))
+    unknown = [name for name in sections if name not in BuildingHubClient.SECTION_OPERATIONS]
+    if unknown:
+        allowed = ", ".join(BuildingHubClient.SECTION_OPERATIONS)
+        raise ValueError(f"Unknown include section(s): {', '.join(unknown)} (allowed: {allowed})")
+    return sections
+
+
+def build_ledger_result(
+    address: str,
+    road_address: str,
+    pnu: str,
+    items: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Map Building HUB title items to the cached/returned lookup payload.
+
+    ``data``/``raw_item`` describe the first item, as before; ``buildings``
+    holds every item on the parcel when all of them were fetched.
+    """
+    item = items[0]
+    return {
+        "success": True,
+        "input_address": address,
+        "road_address": road_address,
+        "pnu": pnu,
+        "codes": split_pnu(pnu),
+        "from_cache": False,
+        "data": _building_data(item, road_address),
+        "buildings": [_building_data(building, road_address) for building in items],
+        "raw_item": item,
+    }
+
+
+def _building_data(item: dict[str, Any], road_address: str) -> dict[str, Any]:
+    return {
+        "regstr_kind_name": item.get("regstrKindCdNm"),
+        "building_name": item.get("bldNm") or None,
+        "dong_name": item.get("dongNm") or None,
+        "road_address": item.get("newPlatPlc") or road_address,
+        "plat_area": _to_float(item.get("platArea")),
+        "arch_area": _to_float(item.get("archArea")),
+        "bc_ratio": _to_float(item.get("bcRat")),
+        "tot_area": _to_float(item.get("totArea")),
+        "vl_ratio_estm_tot_area": _to_float(item.get("vlRatEstmTotArea")),
+        "vl_ratio": _to_float(item.get("vlRat")),
+        "structure_name": item.get("strctCdNm"),
+        "etc_structure": item.get("etcStrct") or item.get("strctCd"),
+        "seismic_design_yn": item.get("rserthqkDsgnApplyYn") or item.get("rgnlLmtSe"),
+        "seismic_ability": item.get("rserthqkAblty") or item.get("rgnlLmtSe"),
+        "use_approval_day": item.get("useAprDay"),
+    }
+
 
 def _to_float(value: Any) -> float | None:
     if value in (None, ""):
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+통합DB 행 추출 벤치마크
+
+합성 매물 시트(기본 10만 행)로 collect_unified_rows(열 단위 연산)와
+이전 iterrows 방식의 수집 시간을 비교하고 결과가 같은지 확인합니다.
+Google Sheets 연결 없이 실행됩니다.
+
+사용법:
+    python scripts/bench_unified_collect.py --rows 100000 --repeat 3
+"""
+import sys
+import os
+import time
+import random
+import argparse
+
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.integration.unified_db import CHECKED_VALUES, collect_unified_rows
+
+
+def make_sheet(rows: int, with_checkbox: bool, seed: int) -> pd.DataFrame:
+    """A~E열(+ 통매매 체크박스) 합성 시트 생성 (빈 D_ID, 공백, None 포함)"""
+    rng = random.Random(seed)
+    checkbox_values = ['TRUE', 'FALSE', '', 'true', ' ✓ ', None]
+
+    data = {
+        'ID': [str(i) for i in range(rows)],
+        '관련파일': [rng.choice(['', f'https://drive.google.com/{i}']) for i in range(rows)],
+        '폴더ID': [rng.choice(['', f'folder-{i}', None]) for i in range(rows)],
+        'D_ID': [rng.choice(['', '  ', f'B-{i}', f' B-{i} ', None]) for i in range(rows)],
+        '주소': [f'충청남도 아산시 배방읍 공수리 {i} ' for i in range(rows)],
+    }
+    if with_checkbox:
+        data['통매매'] = [rng.choice(checkbox_values) for _ in range(rows)]
+    return pd.DataFrame(data)
+
+
+def collect_with_iterrows(df: pd.DataFrame, sheet_name: str, checkbox_col_idx=None) -> pd.DataFrame:
+    """이전 구현 (행 단위 iterrows) - 비교 기준"""
+    def is_checked(value):
+        if pd.isna(value):
+            return False
+        return str(value).strip().upper() in CHECKED_VALUES
+
+    collected = []
+    for _, row in df.iterrows():
+        if checkbox_col_idx is not None and len(df.columns) > checkbox_col_idx:
+            value = row.iloc[checkbox_col_idx] if pd.notna(row.iloc[checkbox_col_idx]) else ''
+            if not is_checked(value):
+                continue
+
+        values = []
+        for position in range(5):
+            value = ''
+            if len(df.columns) > position:
+                value = str(row.iloc[position]) if pd.notna(row.iloc[position]) else ''
+            values.append(value)
+
+        id_value, url_value, folder_id_value, d_id, address = values
+        if not d_id or d_id.strip() == '':
+            continue
+
+        collected.append({
+            'ID': id_value.strip(),
+            '관련파일': url_value.strip(),
+            '폴더ID': folder_id_value.strip(),
+            'D_ID': d_id.strip(),
+            '주소': address.strip(),
+            '매물유형': sheet_name
+        })
+    return pd.DataFrame(collected)
+
+
+def best_of(repeat: int, func, *args):
+    """repeat번 실행해 가장 빠른 시간과 결과 반환"""
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="통합DB 행 추출 벤치마크 (iterrows vs 열 단위 연산)")
+    parser.add_argument("--rows", type=int, default=100_000, help="합성 시트 행 수")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--skip-iterrows", action="store_true", help="이전 구현 측정 생략")
+    args = parser.parse_args()
+
+    cases = [
+        ('아파트매물', make_sheet(args.rows, with_checkbox=False, seed=args.seed), None),
+        ('건물', make_sheet(args.rows, with_checkbox=True, seed=args.seed), 5),
+    ]
+
+    print(f"📊 합성 시트 {args.rows:,} 행, {args.repeat}회 중 최솟값")
+    for sheet_name, df, checkbox_col_idx in cases:
+        vectorized, result = best_of(args.repeat, collect_unified_rows, df, sheet_name, checkbox_col_idx)
+        line = f"{sheet_name}: 열 단위 {vectorized * 1000:,.1f} ms ({len(result):,} 행)"
+
+        if not args.skip_iterrows:
+            legacy, expected = best_of(1, collect_with_iterrows, df, sheet_name, checkbox_col_idx)
+            pd.testing.assert_frame_equal(result, expected.reindex(columns=result.columns))
+            line += f" / iterrows {legacy * 1000:,.1f} ms ({legacy / vectorized:,.0f}배), 결과 동일"
+
+        print(line)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,13 +7,57 @@ Note: 2025-11-29 Google Sheets로 롤백
 """
 
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Optional
 from loguru import logger
 
 from src.config.settings import Settings
 from src.sheets.reader import SheetsReader
 from src.sheets.writer import SheetsWriter
 
+# 통합DB 컬럼 순서
+UNIFIED_COLUMNS = ['ID', '관련파일', '폴더ID', 'D_ID', '주소', '매물유형']
+
+# 체크박스가 체크된 것으로 보는 값 (대문자, 앞뒤 공백 제거 후 비교)
+CHECKED_VALUES = ['TRUE', '1', 'YES', 'Y', '✓', '✔', 'CHECKED', '체크']
+
+# 매물 시트(A~E열 순서로 읽은 DataFrame)의 열 위치 → 통합DB 컬럼
+SOURCE_COLUMN_POSITIONS = {'ID': 0, '관련파일': 1, '폴더ID': 2, 'D_ID': 3, '주소': 4}
+
+
+def collect_unified_rows(df: pd.DataFrame, sheet_name: str,
+                         checkbox_col_idx: Optional[int] = None) -> pd.DataFrame:
+    """
+    매물 시트 DataFrame에서 통합DB 행 추출 (열 단위 연산)
+    
+    Args:
+        df: A~E열(ID, 관련파일, 폴더ID, D_ID, 주소) 순서의 시트 데이터
+        sheet_name: 시트 이름 (매물유형 값)
+        checkbox_col_idx: 체크된 행만 남길 체크박스 열 위치 (None이면 사용 안 함,
+                          해당 열이 없으면 모든 행 포함)
+        
+    Returns:
+        pd.DataFrame: UNIFIED_COLUMNS 순서의 데이터 (D_ID가 빈 행 제외)
+    """
+    column_count = len(df.columns)
+    
+    def text_column(position: int) -> pd.Series:
+        # 빈 값(NaN/None)은 '', 나머지는 문자열로 바꾼 뒤 앞뒤 공백 제거
+        if position >= column_count:
+            return pd.Series('', index=df.index, dtype=object)
+        return df.iloc[:, position].fillna('').astype(str).str.strip()
+    
+    result = pd.DataFrame({
+        column: text_column(position) for column, position in SOURCE_COLUMN_POSITIONS.items()
+    })
+    
+    keep = result['D_ID'] != ''
+    if checkbox_col_idx is not None and column_count > checkbox_col_idx:
+        keep &= text_column(checkbox_col_idx).str.upper().isin(CHECKED_VALUES)
+        
+    result = result[keep].reset_index(drop=True)
+    result['매물유형'] = sheet_name
+    return result[UNIFIED_COLUMNS]
+
 
 class UnifiedDBBuilder:
     """통합DB 구축 클래스 (Google Sheets 백엔드)"""
@@ -38,6 +82,10 @@ class UnifiedDBBuilder:
             logger.warning("⚠️ Excel 백엔드는 Google Sheets로 롤백되었습니다.")
             raise NotImplementedError("Excel 백엔드는 Google Sheets로 롤백되었습니다.")
         
+        # 매물 시트에서 읽을 열: A=ID, B=관련파일, C=폴더ID, D=D_ID, E=주소 (건물은 M=통매매 추가)
+        self.source_columns = ['A', 'B', 'C', 'D', 'E']
+        self.building_columns = self.source_columns + ['M']
+        
         # 시트 타입별 D_ID 컬럼명 매핑
         self.d_id_column_mapping = {
             '아파트매물': 'D_AD_ID',
@@ -74,22 +122,24 @@ class UnifiedDBBuilder:
                 logger.warning("⚠️ 매물DB 시트를 찾을 수 없습니다")
                 return False
             
-            # 3. 각 매물DB 시트에서 데이터 수집
-            unified_data = []
+            # 3. 각 매물DB 시트에서 데이터 수집 (batchGet 한 번으로 필요한 열만 읽기)
+            sheet_frames = self._read_property_sheets(property_sheets)
+            collected = []
             for sheet_name in property_sheets:
                 logger.info(f"📖 데이터 수집 중: {sheet_name}")
-                sheet_data = self._collect_sheet_data(sheet_name)
-                if sheet_data:
-                    unified_data.extend(sheet_data)
+                sheet_data = self._collect_sheet_data(sheet_name, sheet_frames.get(sheet_name))
+                if not sheet_data.empty:
+                    collected.append(sheet_data)
             
-            if not unified_data:
+            if not collected:
                 logger.warning("⚠️ 수집된 데이터가 없습니다")
                 return False
             
-            logger.info(f"✅ 총 {len(unified_data)} 개의 레코드 수집 완료")
+            unified_df = pd.concat(collected, ignore_index=True)
+            logger.info(f"✅ 총 {len(unified_df)} 개의 레코드 수집 완료")
             
             # 4. 통합DB 시트에 데이터 쓰기
-            success = self._write_to_unified_db(unified_data)
+            success = self._write_to_unified_db(unified_df)
             
             if success:
                 logger.info(f"✅ 통합DB 구축 완료: {self.unified_sheet_name}")
@@ -149,6 +199,31 @@ class UnifiedDBBuilder:
         
         return property_sheets
     
+    def _source_columns_for(self, sheet_name: str) -> List[str]:
+        """
+        시트에서 읽을 열 목록
+        
+        Args:
+            sheet_name: 시트 이름
+            
+        Returns:
+            List[str]: 열 문자 목록
+        """
+        return self.building_columns if sheet_name == '건물' else self.source_columns
+    
+    def _read_property_sheets(self, property_sheets: List[str]) -> Dict[str, pd.DataFrame]:
+        """
+        매물 시트들의 필요한 열만 한 번에 읽기
+        
+        Args:
+            property_sheets: 매물 시트 목록
+            
+        Returns:
+            Dict[str, pd.DataFrame]: 시트 이름 → 데이터 (A~E열, 건물은 M열 포함)
+        """
+        column_letters = {sheet_name: self._source_columns_for(sheet_name) for sheet_name in property_sheets}
+        return self.sheets_reader.read_sheets_as_dataframes(property_sheets, column_letters=column_letters)
+    
     def _get_d_id_column_name(self, sheet_name: str) -> Optional[str]:
         """
         시트 이름으로부터 D_ID 컬럼명 찾기
@@ -168,7 +243,8 @@ class UnifiedDBBuilder:
         logger.warning(f"⚠️ {sheet_name}: 시트 타입을 찾을 수 없어 D열을 기본으로 사용합니다")
         return None
     
-    def _collect_sheet_data(self, sheet_name: str) -> List[Dict[str, Any]]:
+    def _collect_sheet_data(self, sheet_name: str,
+                            df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         시트에서 통합DB 데이터 수집
         
@@ -185,109 +261,34 @@ class UnifiedDBBuilder:
         
         Args:
             sheet_name: 시트 이름
+            df: 미리 읽어 둔 시트 데이터 (_read_property_sheets 결과, None이면 시트를 직접 읽음)
             
         Returns:
-            List[Dict[str, Any]]: 수집된 데이터 리스트
+            pd.DataFrame: 수집된 데이터 (UNIFIED_COLUMNS 순서)
         """
         try:
-            # 시트를 DataFrame으로 읽기 (Google Sheets)
-            df = self.sheets_reader.read_sheet_as_dataframe(sheet_name)
+            # 시트의 필요한 열만 DataFrame으로 읽기 (A~E열, 건물은 M열 포함)
+            if df is None:
+                df = self.sheets_reader.read_sheet_as_dataframe(
+                    sheet_name, column_letters=self._source_columns_for(sheet_name))
             
             if df.empty:
                 logger.warning(f"⚠️ 빈 시트: {sheet_name}")
-                return []
-            
-            collected_data = []
+                return pd.DataFrame(columns=UNIFIED_COLUMNS)
             
-            # 고정 컬럼 위치 (A=ID, B=관련파일, C=폴더ID, D=D_ID, E=주소)
-            id_col_idx = 0      # A열 (0-based)
-            url_col_idx = 1     # B열 (0-based)
-            folder_id_col_idx = 2  # C열 (0-based)
-            d_id_col_idx = 3    # D열 (0-based)
-            address_col_idx = 4 # E열 (0-based)
-            
-            # 건물 시트의 경우 M열(13번째 열, 인덱스 12)의 통매매 체크박스 확인
+            # 건물 시트의 경우 M열(통매매 체크박스)은 A~E열 다음에 읽힘
             is_building_sheet = sheet_name == '건물'
-            통매매_col_idx = 12  # M열은 13번째 열 (0-based로 12)
-            
-            # 각 행에서 데이터 추출
-            for idx, row in df.iterrows():
-                # 건물 시트의 경우 통매매 체크박스 확인
-                if is_building_sheet:
-                    if len(df.columns) > 통매매_col_idx:
-                        통매매_value = row.iloc[통매매_col_idx] if pd.notna(row.iloc[통매매_col_idx]) else ''
-                        # 체크박스가 체크되지 않았으면 건너뛰기
-                        # 체크박스 값은 보통 TRUE/FALSE, "TRUE"/"FALSE", 또는 체크 표시
-                        if not self._is_checked(통매매_value):
-                            continue
-                    else:
-                        # M열이 없으면 모든 건물 포함 (하위 호환성)
-                        logger.debug(f"⚠️ {sheet_name}: M열(통매매)이 없어 모든 건물 포함")
-                
-                # A열: ID
-                id_value = ''
-                if len(df.columns) > id_col_idx:
-                    id_value = str(row.iloc[id_col_idx]) if pd.notna(row.iloc[id_col_idx]) else ''
-                
-                # B열: 관련파일
-                url_value = ''
-                if len(df.columns) > url_col_idx:
-                    url_value = str(row.iloc[url_col_idx]) if pd.notna(row.iloc[url_col_idx]) else ''
-                
-                # C열: 폴더ID
-                folder_id_value = ''
-                if len(df.columns) > folder_id_col_idx:
-                    folder_id_value = str(row.iloc[folder_id_col_idx]) if pd.notna(row.iloc[folder_id_col_idx]) else ''
-                
-                # D열: D_ID (디스플레이 아이디)
-                d_id = ''
-                if len(df.columns) > d_id_col_idx:
-                    d_id = str(row.iloc[d_id_col_idx]) if pd.notna(row.iloc[d_id_col_idx]) else ''
-                
-                # E열: 주소
-                address = ''
-                if len(df.columns) > address_col_idx:
-                    address = str(row.iloc[address_col_idx]) if pd.notna(row.iloc[address_col_idx]) else ''
-                
-                # 빈 D_ID는 건너뛰기
-                if not d_id or d_id.strip() == '':
-                    continue
-                
-                collected_data.append({
-                    'ID': id_value.strip(),
-                    '관련파일': url_value.strip(),
-                    '폴더ID': folder_id_value.strip(),
-                    'D_ID': d_id.strip(),
-                    '주소': address.strip(),
-                    '매물유형': sheet_name
-                })
+            통매매_col_idx = 5  # M열 (A~E열 다음, 0-based로 5)
+            
+            collected_data = collect_unified_rows(
+                df, sheet_name, 통매매_col_idx if is_building_sheet else None)
             
             logger.info(f"✅ {sheet_name}: {len(collected_data)} 개 레코드 수집")
             return collected_data
             
         except Exception as e:
             logger.error(f"❌ 시트 데이터 수집 실패 ({sheet_name}): {e}")
-            return []
-    
-    def _is_checked(self, value: Any) -> bool:
-        """
-        체크박스 값이 체크되었는지 확인
-        
-        Args:
-            value: 체크박스 값 (TRUE/FALSE, "TRUE"/"FALSE", 체크 표시 등)
-            
-        Returns:
-            bool: 체크되었으면 True
-        """
-        if pd.isna(value):
-            return False
-        
-        value_str = str(value).strip().upper()
-        
-        # TRUE, "TRUE", 체크 표시 등
-        checked_values = ['TRUE', '1', 'YES', 'Y', '✓', '✔', 'CHECKED', '체크']
-        
-        return value_str in checked_values
+            return pd.DataFrame(columns=UNIFIED_COLUMNS)
     
     def _construct_address_from_row(self, row: pd.Series, columns: List[str]) -> str:
         """
@@ -348,7 +349,7 @@ class UnifiedDBBuilder:
         
         return ' '.join(address_parts) if address_parts else ''
     
-    def _write_to_unified_db(self, data: List[Dict[str, Any]]) -> bool:
+    def _write_to_unified_db(self, df: pd.DataFrame) -> bool:
         """
         통합DB 시트에 데이터 쓰기
         
@@ -361,15 +362,12 @@ class UnifiedDBBuilder:
         - F열: 출처시트
         
         Args:
-            data: 작성할 데이터
+            df: 작성할 데이터 (_collect_sheet_data 결과를 합친 것)
             
         Returns:
             bool: 성공 여부
         """
         try:
-            # DataFrame 생성
-            df = pd.DataFrame(data)
-            
             # 중복 제거 (D_ID 기준)
             initial_count = len(df)
             df = df.drop_duplicates(subset=['D_ID'], keep='first')
@@ -423,23 +421,19 @@ class UnifiedDBBuilder:
                 return False
             property_sheets = self._find_property_sheets(all_sheets)
             
-            unified_data = []
+            sheet_frames = self._read_property_sheets(property_sheets)
+            collected = []
             for sheet_name in property_sheets:
-                sheet_data = self._collect_sheet_data(sheet_name)
-                if sheet_data:
-                    unified_data.extend(sheet_data)
+                sheet_data = self._collect_sheet_data(sheet_name, sheet_frames.get(sheet_name))
+                if not sheet_data.empty:
+                    collected.append(sheet_data)
             
-            if not unified_data:
+            if not collected:
                 logger.warning("⚠️ 수집된 데이터가 없습니다")
                 return False
             
-            # 새 데이터를 DataFrame으로 변환
-            new_df = pd.DataFrame(unified_data)
-            
-            # 통합DB 구조에 맞게 컬럼 정렬
-            column_order = ['ID', '관련파일', '폴더ID', 'D_ID', '주소', '매물유형']
-            existing_columns = [col for col in column_order if col in new_df.columns]
-            new_df = new_df[existing_columns]
+            # 새 데이터 (이미 통합DB 컬럼 순서)
+            new_df = pd.concat(collected, ignore_index=True)
             
             # 기존 데이터와 병합 (D_ID 기준)
             if not existing_df.empty and 'D_ID' in existing_df.columns:
@@ -5,20 +5,52 @@ Google Sheets에서 데이터를 읽어오는 기능을 제공합니다.
 """
 
 import pandas as pd
-from typing import Dict, List, Any, Optional
+import re
+from typing import Dict, List, Any, Optional, Tuple, Union
 from loguru import logger
 
 import gspread
-from google.oauth2.service_account import Credentials
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials as OAuthCredentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from pathlib import Path
+from gspread.utils import a1_to_rowcol, absolute_range_name, rowcol_to_a1
+
+from src.sheets.session import get_sheets_session
+
+
+# 열 문자 (A ~ ZZZ)
+COLUMN_LETTER_PATTERN = re.compile(r'^[A-Z]{1,3}$')
+
+
+def _is_column_letter(column: str) -> bool:
+    """열 문자('A', 'AB') 여부"""
+    return bool(COLUMN_LETTER_PATTERN.match(column))
+
+
+def _column_index(letter: str) -> int:
+    """열 문자 → 열 번호 (A=1)"""
+    return a1_to_rowcol(f"{letter}1")[1]
+
+
+def _column_letter(index: int) -> str:
+    """열 번호 → 열 문자 (1=A)"""
+    return rowcol_to_a1(1, index)[:-1]
+
+
+def _column_runs(indexes: List[int]) -> List[Tuple[int, int]]:
+    """열 번호들을 인접한 구간 (시작, 끝)으로 묶기: [1, 2, 3, 5, 13] → [(1, 3), (5, 5), (13, 13)]"""
+    runs: List[Tuple[int, int]] = []
+    for index in sorted(set(indexes)):
+        if runs and index == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], index)
+        else:
+            runs.append((index, index))
+    return runs
 
 
 class SheetsReader:
     """Google Sheets 데이터 읽기 클래스"""
     
+    # values.batchGet 한 번에 요청할 최대 범위 수 (범위는 GET 쿼리로 전달되어 URL 길이 제한이 있음)
+    BATCH_GET_CHUNK_SIZE = 50
+    
     def __init__(self, settings):
         """
         Sheets Reader 초기화
@@ -29,106 +61,37 @@ class SheetsReader:
         self.settings = settings
         self.client = None
         self.spreadsheet = None
+        self.session = None
         
         # Google Sheets 연결
         self._connect_to_sheets()
         
     def _connect_to_sheets(self):
-        """Google Sheets에 연결 (OAuth 2.0 또는 서비스 계정)"""
-        try:
-            # 스코프 설정
-            scopes = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            
-            # 먼저 OAuth 2.0 시도
-            creds = self._try_oauth_auth(scopes)
-            
-            # OAuth 실패시 서비스 계정 시도
-            if not creds:
-                creds = self._try_service_account_auth(scopes)
-            
-            if not creds:
-                raise Exception("인증 실패: OAuth 2.0과 서비스 계정 모두 실패")
-                
-            # gspread 클라이언트 생성
-            self.client = gspread.authorize(creds)
-            
-            # 스프레드시트 열기
-            self.spreadsheet = self.client.open_by_key(self.settings.google_sheets.spreadsheet_id)
-            
-            logger.info(f"✅ Google Sheets 연결 성공: {self.spreadsheet.title}")
-            
-        except Exception as e:
-            logger.error(f"❌ Google Sheets 연결 실패: {e}")
-            raise
-            
-    def _try_oauth_auth(self, scopes):
-        """OAuth 2.0 인증 시도"""
-        try:
-            oauth_creds_path = Path(self.settings.paths.project_root) / "config/oauth_credentials.json"
-            token_path = Path(self.settings.paths.project_root) / "config/token.json"
-            
-            if not oauth_creds_path.exists():
-                logger.debug("OAuth 인증 파일이 없음")
-                return None
-                
-            creds = None
-            
-            # 기존 토큰 파일이 있는지 확인
-            if token_path.exists():
-                creds = OAuthCredentials.from_authorized_user_file(str(token_path), scopes)
-                
-            # 유효한 자격 증명이 없으면 새로 인증
-            if not creds or not creds.valid:
-                if creds and creds.expired and creds.refresh_token:
-                    creds.refresh(Request())
-                else:
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        str(oauth_creds_path), scopes)
-                    creds = flow.run_local_server(port=0)
-                    
-                # 토큰을 파일에 저장
-                with open(token_path, 'w') as token:
-                    token.write(creds.to_json())
-                    
-            logger.info("✅ OAuth 2.0 인증 성공")
-            return creds
-            
-        except Exception as e:
-            logger.debug(f"OAuth 2.0 인증 실패: {e}")
-            return None
-            
-    def _try_service_account_auth(self, scopes):
-        """서비스 계정 인증 시도"""
-        try:
-            creds_path = Path(self.settings.paths.project_root) / self.settings.google_sheets.credentials_file
-            
-            if not creds_path.exists():
-                logger.debug("서비스 계정 인증 파일이 없음")
-                return None
-                
-            creds = Credentials.from_service_account_file(str(creds_path), scopes=scopes)
-            logger.info("✅ 서비스 계정 인증 성공")
-            return creds
-            
-        except Exception as e:
-            logger.debug(f"서비스 계정 인증 실패: {e}")
-            return None
+        """공유 Sheets 세션에 연결 (프로세스당 인증 1회)"""
+        self.session = get_sheets_session(self.settings)
+        self.client = self.session.client
+        self.spreadsheet = self.session.spreadsheet
     
-    def read_sheet_as_dataframe(self, sheet_name: str) -> pd.DataFrame:
+    def read_sheet_as_dataframe(self, sheet_name: str,
+                                columns: Optional[List[str]] = None,
+                                column_letters: Optional[List[str]] = None) -> pd.DataFrame:
         """
         시트를 DataFrame으로 읽기
         
         Args:
             sheet_name: 시트 이름
+            columns: 읽을 열의 헤더 이름 (None이면 전체 열)
+            column_letters: 읽을 열 문자 ('A', 'M', columns 대신 사용)
             
         Returns:
             pd.DataFrame: 시트 데이터
         """
+        if columns is not None or column_letters is not None:
+            frames = self.read_sheets_as_dataframes([sheet_name], columns, column_letters)
+            return frames.get(sheet_name, pd.DataFrame())
+            
         try:
-            sheet = self.spreadsheet.worksheet(sheet_name)
+            sheet = self.session.worksheet(sheet_name)
             
             # 모든 데이터 가져오기
             data = sheet.get_all_values()
@@ -137,12 +100,7 @@ class SheetsReader:
                 logger.warning(f"⚠️ 빈 시트: {sheet_name}")
                 return pd.DataFrame()
             
-            # 첫 번째 행을 헤더로 사용
-            headers = data[0]
-            rows = data[1:] if len(data) > 1 else []
-            
-            # DataFrame 생성
-            df = pd.DataFrame(rows, columns=headers)
+            df = self._values_to_dataframe(data)
             
             logger.debug(f"✅ 시트 읽기 완료: {sheet_name} ({len(df)} 행)")
             return df
@@ -151,9 +109,217 @@ class SheetsReader:
             logger.error(f"❌ 시트를 찾을 수 없음: {sheet_name}")
             return pd.DataFrame()
         except Exception as e:
+            self.session.on_error(e)
             logger.error(f"❌ 시트 읽기 실패 ({sheet_name}): {e}")
             return pd.DataFrame()
     
+    def read_sheets_as_dataframes(self, sheet_names: List[str],
+                                  columns: Optional[Union[List[str], Dict[str, List[str]]]] = None,
+                                  column_letters: Optional[Union[List[str], Dict[str, List[str]]]] = None
+                                  ) -> Dict[str, pd.DataFrame]:
+        """
+        여러 시트를 values.batchGet으로 한 번에 읽기
+        
+        시트마다 get_all_values()를 순서대로 호출하는 대신, 최대 BATCH_GET_CHUNK_SIZE개
+        범위를 요청 하나로 묶어 가져옵니다.
+        
+        columns(헤더 이름, 'ID'·'주소') 또는 column_letters(열 문자, 'A'·'AB')를 주면 해당
+        열만 읽습니다. 'ID'나 'URL' 같은 헤더가 열 문자로 잘못 해석되지 않도록 둘은 따로
+        받습니다. 인접한 열은 하나의 범위(A:E)로 묶어 요청하고, 결과 DataFrame의 열은 지정한
+        순서를 따릅니다. 시트 범위를 벗어나거나 헤더에 없는 열은 제외됩니다.
+        
+        Args:
+            sheet_names: 시트 이름 목록
+            columns: 모든 시트에 적용할 헤더 이름 목록, 또는 시트 이름 → 헤더 이름 목록
+                     (dict에 없는 시트와 None이면 전체 열)
+            column_letters: columns 대신 열 문자로 지정 (형식은 columns와 같음)
+            
+        Raises:
+            ValueError: columns와 column_letters를 함께 지정한 경우
+            
+        Returns:
+            Dict[str, pd.DataFrame]: 시트 이름 → 데이터 (읽지 못한 시트는 제외)
+        """
+        if columns is not None and column_letters is not None:
+            raise ValueError("columns와 column_letters는 함께 지정할 수 없습니다")
+            
+        frames: Dict[str, pd.DataFrame] = {}
+        
+        try:
+            existing = set(self.session.worksheet_titles())
+            names = []
+            for sheet_name in dict.fromkeys(sheet_names):
+                if sheet_name in existing:
+                    names.append(sheet_name)
+                else:
+                    logger.error(f"❌ 시트를 찾을 수 없음: {sheet_name}")
+            
+            projections = self._resolve_projections(names, columns, column_letters)
+            
+            # 시트별 요청 범위: 전체 시트, 또는 인접 열을 묶은 범위들
+            requests = []
+            for sheet_name in names:
+                if sheet_name not in projections:
+                    requests.append((sheet_name, absolute_range_name(sheet_name)))
+                    continue
+                for first, last in _column_runs(projections[sheet_name]):
+                    range_name = f"{_column_letter(first)}:{_column_letter(last)}"
+                    requests.append((sheet_name, absolute_range_name(sheet_name, range_name)))
+            
+            blocks: Dict[str, List[List[List[Any]]]] = {sheet_name: [] for sheet_name in names}
+            values = self._batch_get([range_name for _, range_name in requests])
+            for (sheet_name, _), data in zip(requests, values):
+                blocks[sheet_name].append(data)
+            
+            for sheet_name in names:
+                if sheet_name in projections:
+                    data = self._project_columns(projections[sheet_name], blocks[sheet_name])
+                else:
+                    data = blocks[sheet_name][0]
+                    
+                if not data:
+                    logger.warning(f"⚠️ 빈 시트: {sheet_name}")
+                    frames[sheet_name] = pd.DataFrame()
+                    continue
+                frames[sheet_name] = self._values_to_dataframe(data)
+                    
+            logger.debug(f"✅ 일괄 읽기 완료: {len(frames)} 개 시트 ({len(requests)} 개 범위)")
+            return frames
+            
+        except Exception as e:
+            self.session.on_error(e)
+            logger.error(f"❌ 일괄 읽기 실패 ({', '.join(sheet_names)}): {e}")
+            return frames
+    
+    def _batch_get(self, ranges: List[str]) -> List[List[List[Any]]]:
+        """
+        values.batchGet 호출 (BATCH_GET_CHUNK_SIZE개씩 나누어 요청)
+        
+        Args:
+            ranges: A1 표기 범위 목록 (시트 이름 포함)
+            
+        Returns:
+            List[List[List[Any]]]: 범위 순서대로의 값 목록
+        """
+        values = []
+        for start in range(0, len(ranges), self.BATCH_GET_CHUNK_SIZE):
+            chunk = ranges[start:start + self.BATCH_GET_CHUNK_SIZE]
+            response = self.spreadsheet.values_batch_get(chunk)
+            
+            # valueRanges는 요청한 범위 순서대로 반환됨
+            value_ranges = response.get('valueRanges', [])
+            values.extend(value_range.get('values', []) for value_range in value_ranges)
+            
+        return values
+    
+    def _resolve_projections(self, sheet_names: List[str],
+                             columns: Optional[Union[List[str], Dict[str, List[str]]]],
+                             column_letters: Optional[Union[List[str], Dict[str, List[str]]]] = None
+                             ) -> Dict[str, List[int]]:
+        """
+        열 지정을 시트별 열 번호(1부터 시작) 목록으로 변환
+        
+        헤더 이름으로 지정하면 해당 시트들의 첫 행을 batchGet 한 번으로 가져옵니다.
+        
+        Args:
+            sheet_names: 읽을 시트 이름 목록
+            columns: read_sheets_as_dataframes의 columns 인자 (헤더 이름)
+            column_letters: read_sheets_as_dataframes의 column_letters 인자 (열 문자)
+            
+        Returns:
+            Dict[str, List[int]]: 시트 이름 → 열 번호 (열 지정이 없는 시트는 제외)
+        """
+        by_letter = column_letters is not None
+        selection = column_letters if by_letter else columns
+        if selection is None:
+            return {}
+        
+        if isinstance(selection, dict):
+            requested = {name: selection[name] for name in sheet_names if name in selection}
+        else:
+            requested = {name: selection for name in sheet_names}
+            
+        # 헤더 이름으로 지정된 경우에만 첫 행 읽기
+        header_sheets = [] if by_letter else list(requested)
+        header_rows = self._batch_get([absolute_range_name(name, '1:1') for name in header_sheets])
+        headers = {
+            name: [str(header).strip() for header in (rows[0] if rows else [])]
+            for name, rows in zip(header_sheets, header_rows)
+        }
+        
+        projections = {}
+        for sheet_name, names in requested.items():
+            col_count = self.session.worksheet(sheet_name).col_count
+            indexes = []
+            for column in names:
+                if by_letter and _is_column_letter(column):
+                    index = _column_index(column)
+                elif not by_letter and column.strip() in headers[sheet_name]:
+                    index = headers[sheet_name].index(column.strip()) + 1
+                else:
+                    logger.warning(f"⚠️ 컬럼을 찾을 수 없음: {sheet_name}의 '{column}'")
+                    continue
+                    
+                # 시트 범위 밖의 열을 요청하면 batchGet 전체가 실패함
+                if index > col_count:
+                    logger.debug(f"⚠️ {sheet_name}: {column}열이 시트 범위({col_count}열) 밖이라 제외")
+                    continue
+                indexes.append(index)
+            projections[sheet_name] = indexes
+            
+        return projections
+    
+    def _project_columns(self, indexes: List[int], blocks: List[List[List[Any]]]) -> List[List[Any]]:
+        """
+        열 범위별 응답을 지정한 열 순서의 행 목록으로 합치기
+        
+        요청한 열은 모두 비어 있어도 유지하고 빈 칸은 ''로 채웁니다.
+        (빈 체크박스 열이 빠지면 "체크 안 됨"이 "열 없음"으로 바뀌기 때문)
+        
+        Args:
+            indexes: 열 번호 목록 (지정 순서)
+            blocks: _column_runs(indexes) 순서대로의 범위별 값
+            
+        Returns:
+            List[List[Any]]: 행 목록 (첫 행은 헤더)
+        """
+        block_of = {}
+        for (first, last), data in zip(_column_runs(indexes), blocks):
+            for index in range(first, last + 1):
+                block_of[index] = (first, data)
+                
+        # 범위마다 끝의 빈 행이 생략되므로 가장 긴 범위에 맞춤
+        row_count = max((len(data) for data in blocks), default=0)
+        
+        projected = []
+        for index in indexes:
+            first, data = block_of[index]
+            offset = index - first
+            column = [row[offset] if offset < len(row) else '' for row in data]
+            projected.append(column + [''] * (row_count - len(column)))
+            
+        return [list(row) for row in zip(*projected)]
+    
+    def _values_to_dataframe(self, data: List[List[Any]]) -> pd.DataFrame:
+        """
+        값 목록을 DataFrame으로 변환 (첫 번째 행을 헤더로 사용)
+        
+        API 응답은 행 끝의 빈 셀을 생략하므로 가장 긴 행에 맞춰 빈 문자열로 채웁니다.
+        
+        Args:
+            data: 시트 값 (2차원 리스트)
+            
+        Returns:
+            pd.DataFrame: 시트 데이터
+        """
+        width = max(len(row) for row in data)
+        padded = [row + [''] * (width - len(row)) for row in data]
+        
+        headers = padded[0]
+        rows = padded[1:]
+        
+        return pd.DataFrame(rows, columns=headers)
+    
     def read_sheet_column(self, sheet_name: str, column_letter: str, 
                          start_row: int = 1, end_row: Optional[int] = None) -> List[Any]:
         """
@@ -169,7 +335,7 @@ class SheetsReader:
             List[Any]: 열 데이터
         """
         try:
-            sheet = self.spreadsheet.worksheet(sheet_name)
+            sheet = self.session.worksheet(sheet_name)
             
             # 범위 결정
             if end_row:
@@ -192,6 +358,7 @@ class SheetsReader:
             return result
             
         except Exception as e:
+            self.session.on_error(e)
             logger.error(f"❌ 열 읽기 실패 ({sheet_name}!{column_letter}): {e}")
             return []
     
@@ -207,13 +374,14 @@ class SheetsReader:
             List[Any]: 행 데이터
         """
         try:
-            sheet = self.spreadsheet.worksheet(sheet_name)
+            sheet = self.session.worksheet(sheet_name)
             row_data = sheet.row_values(row_number)
             
             logger.debug(f"✅ 행 읽기 완료: {sheet_name} 행 {row_number}")
             return row_data
             
         except Exception as e:
+            self.session.on_error(e)
             logger.error(f"❌ 행 읽기 실패 ({sheet_name} 행 {row_number}): {e}")
             return []
     
@@ -225,13 +393,13 @@ class SheetsReader:
             List[str]: 시트 이름 목록
         """
         try:
-            worksheets = self.spreadsheet.worksheets()
-            sheet_names = [sheet.title for sheet in worksheets]
+            sheet_names = self.session.worksheet_titles()
             
             logger.debug(f"✅ 시트 목록 조회 완료: {len(sheet_names)} 개")
             return sheet_names
             
         except Exception as e:
+            self.session.on_error(e)
             logger.error(f"❌ 시트 목록 조회 실패: {e}")
             return []
     
@@ -246,13 +414,14 @@ class SheetsReader:
             List[str]: 헤더 목록
         """
         try:
-            sheet = self.spreadsheet.worksheet(sheet_name)
+            sheet = self.session.worksheet(sheet_name)
             headers = sheet.row_values(1)
             
             logger.debug(f"✅ 헤더 읽기 완료: {sheet_name} ({len(headers)} 개)")
             return headers
             
         except Exception as e:
+            self.session.on_error(e)
             logger.error(f"❌ 헤더 읽기 실패 ({sheet_name}): {e}")
             return []
     
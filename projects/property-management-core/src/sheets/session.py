@@ -0,0 +1,272 @@
+"""
+Google Sheets 공유 세션 모듈
+
+프로세스 전체에서 하나의 인증/스프레드시트 연결을 공유합니다.
+SheetsReader, SheetsWriter를 몇 번 생성하더라도 인증과 open_by_key는 한 번만 수행됩니다.
+"""
+
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from loguru import logger
+
+import gspread
+from google.oauth2.service_account import Credentials
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials as OAuthCredentials
+from google_auth_oauthlib.flow import InstalledAppFlow
+
+
+class SheetsSession:
+    """Google Sheets 인증 세션 (OAuth 2.0 또는 서비스 계정)"""
+
+    def __init__(self, settings):
+        """
+        Sheets 세션 초기화 (인증 + 스프레드시트 열기)
+
+        Args:
+            settings: 시스템 설정 객체
+        """
+        self.settings = settings
+        self.credentials = None
+        self.client = None
+        self.spreadsheet = None
+        self.token_path = Path(settings.paths.project_root) / "config/token.json"
+        self._is_oauth = False
+
+        # 시트 제목 → 워크시트 (첫 조회 시 한 번만 가져옴)
+        self._worksheets: Optional[Dict[str, gspread.Worksheet]] = None
+        self._worksheets_lock = threading.Lock()
+
+        self._connect()
+
+    def _connect(self):
+        """Google Sheets에 연결"""
+        try:
+            scopes = self.settings.google_sheets.scopes
+
+            # 먼저 OAuth 2.0 시도
+            creds = self._try_oauth_auth(scopes)
+            self._is_oauth = creds is not None
+
+            # OAuth 실패시 서비스 계정 시도
+            if not creds:
+                creds = self._try_service_account_auth(scopes)
+
+            if not creds:
+                raise Exception("인증 실패: OAuth 2.0과 서비스 계정 모두 실패")
+
+            self.credentials = creds
+
+            # gspread 클라이언트 생성 (요청마다 만료된 액세스 토큰을 자동 갱신)
+            self.client = gspread.authorize(creds)
+
+            # 스프레드시트 열기
+            self.spreadsheet = self.client.open_by_key(self.settings.google_sheets.spreadsheet_id)
+
+            logger.info(f"✅ Google Sheets 연결 성공: {self.spreadsheet.title}")
+
+        except Exception as e:
+            logger.error(f"❌ Google Sheets 연결 실패: {e}")
+            raise
+
+    def _try_oauth_auth(self, scopes):
+        """OAuth 2.0 인증 시도"""
+        try:
+            oauth_creds_path = Path(self.settings.paths.project_root) / "config/oauth_credentials.json"
+
+            if not oauth_creds_path.exists():
+                logger.debug("OAuth 인증 파일이 없음")
+                return None
+
+            creds = None
+
+            # 기존 토큰 파일이 있는지 확인
+            if self.token_path.exists():
+                creds = OAuthCredentials.from_authorized_user_file(str(self.token_path), scopes)
+
+            # 유효한 자격 증명이 없으면 새로 인증
+            if not creds or not creds.valid:
+                if creds and creds.expired and creds.refresh_token:
+                    creds.refresh(Request())
+                else:
+                    flow = InstalledAppFlow.from_client_secrets_file(
+                        str(oauth_creds_path), scopes)
+                    creds = flow.run_local_server(port=0)
+
+                self._save_token(creds)
+
+            logger.info("✅ OAuth 2.0 인증 성공")
+            return creds
+
+        except Exception as e:
+            logger.debug(f"OAuth 2.0 인증 실패: {e}")
+            return None
+
+    def _try_service_account_auth(self, scopes):
+        """서비스 계정 인증 시도"""
+        try:
+            creds_path = Path(self.settings.paths.project_root) / self.settings.google_sheets.credentials_file
+
+            if not creds_path.exists():
+                logger.debug("서비스 계정 인증 파일이 없음")
+                return None
+
+            creds = Credentials.from_service_account_file(str(creds_path), scopes=scopes)
+            logger.info("✅ 서비스 계정 인증 성공")
+            return creds
+
+        except Exception as e:
+            logger.debug(f"서비스 계정 인증 실패: {e}")
+            return None
+
+    def _save_token(self, creds):
+        """OAuth 토큰을 파일에 저장"""
+        with open(self.token_path, 'w') as token:
+            token.write(creds.to_json())
+
+    def refresh_if_expired(self):
+        """
+        만료된 액세스 토큰 갱신
+
+        gspread는 요청 시 토큰을 자동 갱신하지만 token.json에는 반영하지 않으므로,
+        세션을 재사용할 때 여기서 갱신하고 OAuth 토큰은 파일에도 저장합니다.
+        """
+        creds = self.credentials
+        if creds is None or creds.valid:
+            return
+
+        try:
+            creds.refresh(Request())
+            if self._is_oauth:
+                self._save_token(creds)
+            logger.debug("🔄 Google Sheets 액세스 토큰 갱신")
+
+        except Exception as e:
+            logger.warning(f"⚠️ 토큰 갱신 실패 (다음 요청에서 재시도): {e}")
+
+    def _worksheet_index(self) -> Dict[str, gspread.Worksheet]:
+        """워크시트 캐시 조회 (없으면 메타데이터 1회 요청)"""
+        with self._worksheets_lock:
+            if self._worksheets is None:
+                worksheets = self.spreadsheet.worksheets()
+                self._worksheets = {sheet.title: sheet for sheet in worksheets}
+                logger.debug(f"📋 워크시트 목록 캐시: {len(self._worksheets)} 개")
+            return self._worksheets
+
+    def worksheet_titles(self) -> List[str]:
+        """
+        시트 이름 목록 (캐시 사용)
+
+        Returns:
+            List[str]: 스프레드시트의 시트 순서대로 정렬된 이름 목록
+        """
+        return list(self._worksheet_index())
+
+    def worksheet(self, title: str) -> gspread.Worksheet:
+        """
+        시트 조회 (캐시 사용)
+
+        Args:
+            title: 시트 이름
+
+        Returns:
+            gspread.Worksheet: 시트 객체
+
+        Raises:
+            gspread.exceptions.WorksheetNotFound: 시트가 없을 때
+        """
+        sheet = self._worksheet_index().get(title)
+        if sheet is None:
+            raise gspread.exceptions.WorksheetNotFound(title)
+        return sheet
+
+    def get_or_create_worksheet(self, title: str, rows: int = 1000,
+                                cols: int = 20) -> Tuple[gspread.Worksheet, bool]:
+        """
+        시트 조회, 없으면 생성 후 캐시에 추가
+
+        Args:
+            title: 시트 이름
+            rows: 새 시트의 행 수
+            cols: 새 시트의 열 수
+
+        Returns:
+            Tuple[gspread.Worksheet, bool]: (시트 객체, 새로 생성했는지 여부)
+        """
+        worksheets = self._worksheet_index()
+        sheet = worksheets.get(title)
+        if sheet is not None:
+            return sheet, False
+
+        try:
+            sheet = self.spreadsheet.add_worksheet(title=title, rows=rows, cols=cols)
+        except gspread.exceptions.APIError:
+            # 다른 곳에서 이미 만든 시트일 수 있음: 목록을 다시 받아 확인
+            self.invalidate_worksheets()
+            sheet = self._worksheet_index().get(title)
+            if sheet is None:
+                raise
+            return sheet, False
+
+        with self._worksheets_lock:
+            if self._worksheets is not None:
+                self._worksheets[title] = sheet
+        return sheet, True
+
+    def invalidate_worksheets(self):
+        """워크시트 캐시 폐기 (다음 조회 때 다시 가져옴)"""
+        with self._worksheets_lock:
+            self._worksheets = None
+
+    def on_error(self, error: Exception):
+        """
+        API 오류 처리: 시트 삭제/이름 변경 등으로 캐시가 틀렸을 수 있으므로 무효화
+
+        Args:
+            error: 발생한 예외
+        """
+        if isinstance(error, gspread.exceptions.APIError):
+            self.invalidate_worksheets()
+
+
+# (프로젝트 루트, 스프레드시트 ID) → 세션
+_sessions: Dict[Tuple[str, str], SheetsSession] = {}
+_sessions_lock = threading.Lock()
+
+
+def get_sheets_session(settings) -> SheetsSession:
+    """
+    프로세스 공유 Sheets 세션 조회 (없으면 생성)
+
+    Args:
+        settings: 시스템 설정 객체
+
+    Returns:
+        SheetsSession: 인증된 공유 세션
+    """
+    key = (str(settings.paths.project_root), settings.google_sheets.spreadsheet_id)
+
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = SheetsSession(settings)
+            _sessions[key] = session
+        else:
+            session.refresh_if_expired()
+
+    return session
+
+
+def reset_sheets_session(settings: Optional[object] = None):
+    """
+    공유 세션 폐기 (재인증이 필요할 때)
+
+    Args:
+        settings: 해당 설정의 세션만 폐기 (None이면 전체)
+    """
+    with _sessions_lock:
+        if settings is None:
+            _sessions.clear()
+        else:
+            _sessions.pop((str(settings.paths.project_root), settings.google_sheets.spreadsheet_id), None)
@@ -5,15 +5,12 @@ Google Sheets에 데이터를 쓰고 업데이트하는 기능을 제공합니
 """
 
 import pandas as pd
-from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 from loguru import logger
 
 import gspread
-from google.oauth2.service_account import Credentials
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials as OAuthCredentials
-from google_auth_oauthlib.flow import InstalledAppFlow
+
+from src.sheets.session import get_sheets_session
 
 
 class SheetsWriter:
@@ -29,93 +26,16 @@ class SheetsWriter:
         self.settings = settings
         self.client = None
         self.spreadsheet = None
+        self.session = None
         
         # Google Sheets 연결
         self._connect_to_sheets()
         
     def _connect_to_sheets(self):
-        """Google Sheets에 연결 (OAuth 2.0 또는 서비스 계정)"""
-        try:
-            # 스코프 설정
-            scopes = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-            
-            # 먼저 OAuth 2.0 시도
-            creds = self._try_oauth_auth(scopes)
-            
-            # OAuth 실패시 서비스 계정 시도
-            if not creds:
-                creds = self._try_service_account_auth(scopes)
-            
-            if not creds:
-                raise Exception("인증 실패: OAuth 2.0과 서비스 계정 모두 실패")
-                
-            # gspread 클라이언트 생성
-            self.client = gspread.authorize(creds)
-            
-            # 스프레드시트 열기
-            self.spreadsheet = self.client.open_by_key(self.settings.google_sheets.spreadsheet_id)
-            
-            logger.info(f"✅ Google Sheets 연결 성공: {self.spreadsheet.title}")
-            
-        except Exception as e:
-            logger.error(f"❌ Google Sheets 연결 실패: {e}")
-            raise
-            
-    def _try_oauth_auth(self, scopes):
-        """OAuth 2.0 인증 시도"""
-        try:
-            oauth_creds_path = Path(self.settings.paths.project_root) / "config/oauth_credentials.json"
-            token_path = Path(self.settings.paths.project_root) / "config/token.json"
-            
-            if not oauth_creds_path.exists():
-                logger.debug("OAuth 인증 파일이 없음")
-                return None
-                
-            creds = None
-            
-            # 기존 토큰 파일이 있는지 확인
-            if token_path.exists():
-                creds = OAuthCredentials.from_authorized_user_file(str(token_path), scopes)
-                
-            # 유효한 자격 증명이 없으면 새로 인증
-            if not creds or not creds.valid:
-                if creds and creds.expired and creds.refresh_token:
-                    creds.refresh(Request())
-                else:
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        str(oauth_creds_path), scopes)
-                    creds = flow.run_local_server(port=0)
-                    
-                # 토큰을 파일에 저장
-                with open(token_path, 'w') as token:
-                    token.write(creds.to_json())
-                    
-            logger.info("✅ OAuth 2.0 인증 성공")
-            return creds
-            
-        except Exception as e:
-            logger.debug(f"OAuth 2.0 인증 실패: {e}")
-            return None
-            
-    def _try_service_account_auth(self, scopes):
-        """서비스 계정 인증 시도"""
-        try:
-            creds_path = Path(self.settings.paths.project_root) / self.settings.google_sheets.credentials_file
-            
-            if not creds_path.exists():
-                logger.debug("서비스 계정 인증 파일이 없음")
-                return None
-                
-            creds = Credentials.from_service_account_file(str(creds_path), scopes=scopes)
-            logger.info("✅ 서비스 계정 인증 성공")
-            return creds
-            
-        except Exception as e:
-            logger.debug(f"서비스 계정 인증 실패: {e}")
-            return None
+        """공유 Sheets 세션에 연결 (프로세스당 인증 1회)"""
+        self.session = get_sheets_session(self.settings)
+        self.client = self.session.client
+        self.spreadsheet = self.session.spreadsheet
             
     def update_sheet_with_dataframe(self, sheet_name: str, dataframe: pd.DataFrame, 
                                    clear_existing: bool = True) -> bool:
@@ -152,6 +72,7 @@ class SheetsWriter:
             return True
             
         except Exception as e:
+            self.session.on_error(e)
             logger.error(f"❌ 시트 업데이트 실패 ({sheet_name}): {e}")
             return False
             
@@ -176,6 +97,7 @@ class SheetsWriter:
             return True
             
         except Exception as e:
+            self.session.on_error(e)
             logger.error(f"❌ 행 추가 실패 ({sheet_name}): {e}")
             return False
             
@@ -202,6 +124,7 @@ class SheetsWriter:
             return True
             
         except Exception as e:
+            self.session.on_error(e)
             logger.error(f"❌ 셀 범위 업데이트 실패 ({sheet_name}!{range_name}): {e}")
             return False
             
@@ -240,6 +163,7 @@ class SheetsWriter:
             return True
             
         except Exception as e:
+            self.session.on_error(e)
             logger.error(f"❌ 매물 데이터 동기화 실패: {e}")
             return False
             
@@ -254,24 +178,19 @@ class SheetsWriter:
             bool: 성공 여부
         """
         try:
-            # 기존 시트 확인
-            existing_sheet = None
-            for sheet in self.spreadsheet.worksheets():
-                if sheet.title == sheet_name:
-                    existing_sheet = sheet
-                    break
-                    
-            if existing_sheet:
+            # 캐시된 시트 목록으로 확인, 없으면 생성
+            _, created = self.session.get_or_create_worksheet(sheet_name, rows=1000, cols=20)
+            
+            if not created:
                 logger.debug(f"📄 시트 이미 존재: {sheet_name}")
                 return True
                 
-            # 새 시트 생성
-            new_sheet = self.spreadsheet.add_worksheet(title=sheet_name, rows=1000, cols=20)
             logger.info(f"✅ 새 시트 생성 완료: {sheet_name}")
             
             return True
             
         except Exception as e:
+            self.session.on_error(e)
             logger.error(f"❌ 시트 생성 실패 ({sheet_name}): {e}")
             return False
             
@@ -286,14 +205,11 @@ class SheetsWriter:
             gspread.Worksheet: 시트 객체
         """
         try:
-            # 기존 시트 찾기
-            for sheet in self.spreadsheet.worksheets():
-                if sheet.title == sheet_name:
-                    return sheet
-                    
-            # 시트가 없으면 생성
-            logger.info(f"📄 새 시트 생성 중: {sheet_name}")
-            return self.spreadsheet.add_worksheet(title=sheet_name, rows=1000, cols=20)
+            # 캐시된 시트 목록에서 찾고, 없으면 생성
+            sheet, created = self.session.get_or_create_worksheet(sheet_name, rows=1000, cols=20)
+            if created:
+                logger.info(f"📄 새 시트 생성: {sheet_name}")
+            return sheet
             
         except Exception as e:
             logger.error(f"❌ 시트 접근 실패 ({sheet_name}): {e}")
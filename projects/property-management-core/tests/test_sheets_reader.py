@@ -0,0 +1,99 @@
+"""
+SheetsReader 열 지정 읽기 테스트
+
+Google Sheets 대신 메모리 스프레드시트로 values.batchGet 응답을 흉내 냅니다.
+"""
+
+import os
+import sys
+
+import pytest
+from gspread.utils import a1_to_rowcol
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.sheets.reader import SheetsReader
+
+
+class FakeWorksheet:
+    def __init__(self, title, col_count):
+        self.title = title
+        self.col_count = col_count
+
+
+class FakeSession:
+    def __init__(self, sheets):
+        self.sheets = sheets
+
+    def worksheet_titles(self):
+        return list(self.sheets)
+
+    def worksheet(self, title):
+        return FakeWorksheet(title, max(len(row) for row in self.sheets[title]))
+
+    def on_error(self, error):
+        pass
+
+
+class FakeSpreadsheet:
+    """'시트'!A:E, '시트'!1:1 형식의 범위만 지원"""
+
+    def __init__(self, sheets):
+        self.sheets = sheets
+        self.requested = []
+
+    def values_batch_get(self, ranges):
+        self.requested.extend(ranges)
+        return {'valueRanges': [{'values': self._values(range_name)} for range_name in ranges]}
+
+    def _values(self, range_name):
+        title, cells = range_name.rsplit('!', 1)
+        rows = self.sheets[title.strip("'")]
+        first, last = cells.split(':')
+        if first.isdigit():
+            return rows[int(first) - 1:int(last)]
+        start, end = a1_to_rowcol(f"{first}1")[1], a1_to_rowcol(f"{last}1")[1]
+        return [row[start - 1:end] for row in rows]
+
+
+def make_reader(sheets):
+    reader = SheetsReader.__new__(SheetsReader)
+    reader.session = FakeSession(sheets)
+    reader.spreadsheet = FakeSpreadsheet(sheets)
+    return reader
+
+
+BUILDING_SHEET = [
+    ['ID', '관련파일', '폴더ID', 'D_ID', '주소', 'URL', '통매매'],
+    ['1', '', 'f-1', 'B-1', '주소 1', 'https://a', 'TRUE'],
+    ['2', '', 'f-2', 'B-2', '주소 2', 'https://b', ''],
+]
+
+
+def test_all_caps_headers_are_read_by_name():
+    reader = make_reader({'건물': BUILDING_SHEET})
+
+    frames = reader.read_sheets_as_dataframes(['건물'], ['ID', 'D_ID', 'URL', '통매매'])
+
+    df = frames['건물']
+    assert list(df.columns) == ['ID', 'D_ID', 'URL', '통매매']
+    assert df['ID'].tolist() == ['1', '2']
+    assert df['URL'].tolist() == ['https://a', 'https://b']
+
+
+def test_column_letters_are_read_by_position():
+    reader = make_reader({'건물': BUILDING_SHEET})
+
+    df = reader.read_sheet_as_dataframe('건물', column_letters=['D', 'A', 'G'])
+
+    assert list(df.columns) == ['D_ID', 'ID', '통매매']
+    assert df['통매매'].tolist() == ['TRUE', '']
+    # 열 문자로만 지정하면 헤더 행을 따로 읽지 않음
+    assert "'건물'!1:1" not in reader.spreadsheet.requested
+
+
+def test_columns_and_column_letters_are_exclusive():
+    reader = make_reader({'건물': BUILDING_SHEET})
+
+    with pytest.raises(ValueError):
+        reader.read_sheets_as_dataframes(['건물'], ['ID'], column_letters=['A'])